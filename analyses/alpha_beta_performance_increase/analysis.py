@@ -2,35 +2,69 @@ from __future__ import annotations
 
 import time
 from functools import partial
-from os import walk
-from typing import Generator, Sequence
+from typing import Generator, Optional, Sequence
 
 from utahchess import WHITE
 from utahchess.board import Board
-from utahchess.minimax import Node, create_children_from_parent, get_node_value, minimax
+from utahchess.minimax import (
+    Node,
+    create_children_from_parent,
+    get_board_value,
+    get_node_value,
+    minimax,
+)
+from utahchess.position_encoding import read_positions
+from utahchess.search import ASPIRATION_WINDOWS, iterative_deepening, mtdf
+from utahchess.search_stats import SearchStats
+
+MINIMAX = "minimax"
+MTDF = "mtdf"
 
 
 def generate_dataset(
     dataset_path: str, num_boards: int
 ) -> Generator[tuple[Board, str], None, None]:
-    """Read and yield a number of board strings read from files."""
-    for root, _, filenames in walk(dataset_path):
-        for count, filename in enumerate(filenames):
-            if count == num_boards:
-                break
-            with open(f"{root}/{filename}", "r") as file:
-                yield Board(board_string=file.read()), filename
+    """Read and yield a number of boards from a file of encoded positions."""
+    for count, board in enumerate(read_positions(path=dataset_path, stop=num_boards)):
+        yield board, f"board_{count + 1}"
 
 
 def run_experiment(
-    dataset: Sequence[tuple[Board, str]], depth: int, order: bool, prune: bool
-) -> tuple[float, list[float], list[str], list[str]]:
-    """Run minimax algorithm at given depth for all boards in the dataset."""
-    start = time.time()
+    dataset: Sequence[tuple[Board, str]],
+    depth: int,
+    order: bool,
+    prune: bool,
+    stats: Optional[SearchStats] = None,
+    algorithm: str = MINIMAX,
+) -> tuple[float, list[float], list[Optional[str]], list[str]]:
+    """Run a search algorithm at given depth for all boards in the dataset.
+
+    With MINIMAX the minimax algorithm is run with or without ordering and pruning.
+    With MTDF "mtdf" is run from the static value of the board, it always orders
+    and prunes. Values are always to white, the player to move.
+
+    Statistics of all searches are accumulated in "stats" if given. The name of the
+    found node is None for boards without legal moves.
+    """
+    start = time.perf_counter()
     found_values = []
-    found_nodes = []
+    found_nodes: list[Optional[str]] = []
     filenames = []
     for board, filename in dataset:
+        if algorithm == MTDF:
+            suggested_node, value = mtdf(
+                board=board,
+                player=WHITE,
+                first_guess=get_board_value(
+                    board=board, player_that_just_made_the_move=WHITE, last_move=None
+                ),
+                depth=depth,
+                stats=stats,
+            )
+            found_values.append(value)
+            found_nodes.append(None if suggested_node is None else suggested_node.name)
+            filenames.append(filename)
+            continue
 
         parent_node = Node(
             name="initial_node",
@@ -41,25 +75,68 @@ def run_experiment(
         )
         suggested_node, value = minimax(
             parent_node=parent_node,
-            value_function=get_node_value,
-            get_children=partial(create_children_from_parent, ordered=order),
+            value_function=partial(get_node_value, player=WHITE),
+            get_children=partial(
+                create_children_from_parent, ordered=order, stats=stats
+            ),
             depth=depth,
             alpha=-float("inf"),
             beta=float("inf"),
             maximizing_player=True,
             prune=prune,
+            stats=stats,
         )
         found_values.append(value)
-        found_nodes.append(suggested_node.name)
+        found_nodes.append(None if suggested_node is None else suggested_node.name)
         filenames.append(filename)
-    return time.time() - start, found_values, found_nodes, filenames
+    return time.perf_counter() - start, found_values, found_nodes, filenames
+
 
+def run_deepening_experiment(
+    dataset: Sequence[tuple[Board, str]],
+    depth: int,
+    aspiration_windows: Sequence[float],
+    stats: Optional[SearchStats] = None,
+) -> tuple[float, list[Optional[float]]]:
+    """Run iterative deepening up to given depth for all boards in the dataset.
 
-def report_results(time: float, type: str, num_boards: int) -> None:
+    Statistics of all searches, including aspiration window re-searches, are
+    accumulated in "stats" if given.
+    """
+    start = time.perf_counter()
+    found_values: list[Optional[float]] = []
+    for board, _ in dataset:
+        result = iterative_deepening(
+            board=board,
+            current_player=WHITE,
+            max_depth=depth,
+            stats=stats,
+            aspiration_windows=aspiration_windows,
+        )
+        found_values.append(None if result is None else result.value)
+    return time.perf_counter() - start, found_values
+
+
+def report_results(
+    time: float, type: str, num_boards: int, stats: Optional[SearchStats] = None
+) -> None:
     print(
         f"Experiment of type '{type}' took {time:.2f} seconds to run. "
         f"This implies each board took {time/num_boards:.2f} seconds to process."
     )
+    if stats is not None:
+        print(
+            f"    {stats.nodes} nodes at {stats.nodes_per_second:.0f} nodes/s, "
+            f"{stats.beta_cutoffs} cutoffs of which "
+            f"{stats.first_move_cutoff_rate:.0%} on the first move. Time spent in "
+            f"move generation {stats.move_generation_seconds:.2f}s, algebraic "
+            f"identifiers {stats.san_seconds:.2f}s, evaluation "
+            f"{stats.evaluation_seconds:.2f}s."
+        )
+        if stats.tt_hits:
+            print(f"    {stats.tt_hits} transposition table hits.")
+        if stats.aspiration_researches:
+            print(f"    {stats.aspiration_researches} aspiration window re-searches.")
 
 
 if __name__ == "__main__":
@@ -70,7 +147,7 @@ if __name__ == "__main__":
         print("NUM_BOARDS:", NUM_BOARDS)
         dataset = tuple(
             generate_dataset(
-                dataset_path="analyses/alpha_beta_performance_increase/board_strings/",
+                dataset_path="analyses/alpha_beta_performance_increase/boards.bin",
                 num_boards=NUM_BOARDS,
             )
         )
@@ -87,26 +164,54 @@ if __name__ == "__main__":
             f"{min(len(tuple(board.all_pieces())) for board, _ in dataset)} pieces."
         )
 
+        ordered_and_pruned_stats = SearchStats()
         (
             ordered_and_pruned_time,
             ordered_and_pruned_values,
             ordered_and_pruned_node_names,
             ordered_and_pruned_node_filenames,
-        ) = run_experiment(dataset=dataset, depth=DEPTH, order=True, prune=True)
+        ) = run_experiment(
+            dataset=dataset,
+            depth=DEPTH,
+            order=True,
+            prune=True,
+            stats=ordered_and_pruned_stats,
+        )
+        just_pruned_stats = SearchStats()
         (
             just_pruned_time,
             just_pruned_values,
             just_pruned_node_names,
             just_pruned_filenames,
-        ) = run_experiment(dataset=dataset, depth=DEPTH, order=False, prune=True)
+        ) = run_experiment(
+            dataset=dataset,
+            depth=DEPTH,
+            order=False,
+            prune=True,
+            stats=just_pruned_stats,
+        )
+
+        mtdf_stats = SearchStats()
+        mtdf_time, mtdf_values, mtdf_node_names, mtdf_filenames = run_experiment(
+            dataset=dataset,
+            depth=DEPTH,
+            order=True,
+            prune=True,
+            stats=mtdf_stats,
+            algorithm=MTDF,
+        )
 
         # Assert all algorithms found the same values
         assert ordered_and_pruned_values == just_pruned_values
-        for experiment_time, type in zip(
-            (ordered_and_pruned_time, just_pruned_time),
-            ("ordered and pruned", "only pruned"),
+        assert ordered_and_pruned_values == mtdf_values
+        for experiment_time, type, stats in zip(
+            (ordered_and_pruned_time, just_pruned_time, mtdf_time),
+            ("ordered and pruned", "only pruned", "MTD(f)"),
+            (ordered_and_pruned_stats, just_pruned_stats, mtdf_stats),
         ):
-            report_results(time=experiment_time, type=type, num_boards=NUM_BOARDS)
+            report_results(
+                time=experiment_time, type=type, num_boards=NUM_BOARDS, stats=stats
+            )
 
         if DEPTH < 4:
             (
@@ -118,3 +223,24 @@ if __name__ == "__main__":
             assert just_pruned_values == baseline_values
             assert baseline_values == ordered_and_pruned_values
             report_results(time=baseline_time, type="baseline", num_boards=NUM_BOARDS)
+
+        deepening_stats = SearchStats()
+        deepening_time, deepening_values = run_deepening_experiment(
+            dataset=dataset, depth=DEPTH, aspiration_windows=(), stats=deepening_stats
+        )
+        aspiration_stats = SearchStats()
+        aspiration_time, aspiration_values = run_deepening_experiment(
+            dataset=dataset,
+            depth=DEPTH,
+            aspiration_windows=ASPIRATION_WINDOWS,
+            stats=aspiration_stats,
+        )
+        assert deepening_values == aspiration_values
+        for experiment_time, type, stats in zip(
+            (deepening_time, aspiration_time),
+            ("iterative deepening", "iterative deepening with aspiration windows"),
+            (deepening_stats, aspiration_stats),
+        ):
+            report_results(
+                time=experiment_time, type=type, num_boards=NUM_BOARDS, stats=stats
+            )
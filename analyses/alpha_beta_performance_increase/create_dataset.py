@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import argparse
 import random
 from itertools import product
-from typing import Type
+from multiprocessing import Pool
+from typing import Generator, Type
 
 from utahchess import BLACK, WHITE
 from utahchess.board import Board
-from utahchess.legal_moves import is_checkmate
 from utahchess.move_validation import is_check
 from utahchess.piece import Bishop, King, Knight, Pawn, Piece, Queen, Rook
+from utahchess.position_encoding import encode_board, write_positions
+
+DATASET_PATH = "analyses/alpha_beta_performance_increase/boards.bin"
 
 ALL_POSITIONS = tuple(product((0, 1, 2, 3, 4, 5, 6, 7), (0, 1, 2, 3, 4, 5, 6, 7)))
 NUMBER_OF_TOTAL_POSITIONS = len(ALL_POSITIONS)
@@ -17,14 +21,17 @@ POSSIBLE_INDICES = list(range(NUMBER_OF_TOTAL_POSITIONS))
 IMBALANCE_RANGE_LOW = 0.3
 IMBALANCE_RANGE_HIGH = 0.7
 
+PIECES_RANGE_LOW = 6
+PIECES_RANGE_HIGH = 20
+BOARDS_PER_CHUNK = 50
+
 
-def sample_n_positions(n: int) -> list[tuple[int, int]]:
+def sample_n_positions(n: int, rng: random.Random) -> list[tuple[int, int]]:
     """Generate n positions on a chess board at random."""
-    random.shuffle(POSSIBLE_INDICES)
-    return list(ALL_POSITIONS[i] for i in POSSIBLE_INDICES[:n])
+    return list(ALL_POSITIONS[i] for i in rng.sample(POSSIBLE_INDICES, n))
 
 
-def sample_random_board(n_pieces: int) -> Board:
+def sample_random_board(n_pieces: int, rng: random.Random) -> Board:
     """Generate semi-random chess board.
 
     The board is configured by first placing the king of each color.
@@ -33,17 +40,27 @@ def sample_random_board(n_pieces: int) -> Board:
     Types of pieces are randomly sampled according to their occurence. This means a
     white rook is twice as likely to appear than a white queen but is four time less
     like to appear than a white pawn.
-    In the end the procedure is repeated if the resulting board is arleady in check or
-    checkmate.
+    In the end the procedure is repeated if either king of the resulting board is
+    attacked, which also rules out checkmate.
 
     Args:
         n_pieces: Number of pieces to distribute on the board.
+        rng: Random number generator to sample from.
 
     Returns: A board with randomly distributed pieces placed on it. Always contains
         each color's king and is never in check or checkmate.
     """
+    board = _sample_board(n_pieces=n_pieces, rng=rng)
+    while is_check(board=board, current_player=BLACK) or is_check(
+        board=board, current_player=WHITE
+    ):
+        board = _sample_board(n_pieces=n_pieces, rng=rng)
+    return board
+
+
+def _sample_board(n_pieces: int, rng: random.Random) -> Board:
     board_pieces: list[Piece] = []
-    positions_to_fill = sample_n_positions(n=n_pieces)
+    positions_to_fill = sample_n_positions(n=n_pieces, rng=rng)
     # place two kings
     board_pieces.append(
         King(
@@ -62,7 +79,7 @@ def sample_random_board(n_pieces: int) -> Board:
 
     pieces_left = n_pieces - 2
     white_number_of_pieces = int(
-        random.uniform(IMBALANCE_RANGE_LOW, IMBALANCE_RANGE_HIGH) * pieces_left
+        rng.uniform(IMBALANCE_RANGE_LOW, IMBALANCE_RANGE_HIGH) * pieces_left
     )
     black_number_of_pieces = pieces_left - white_number_of_pieces
 
@@ -82,7 +99,7 @@ def sample_random_board(n_pieces: int) -> Board:
             Queen,
         )
         for _ in range(number_of_pieces):
-            class_to_instantiate = random.choice(valid_choices)  # type: ignore
+            class_to_instantiate = rng.choice(valid_choices)  # type: ignore
             board_pieces.append(
                 class_to_instantiate(  # type: ignore
                     position=positions_to_fill.pop(),
@@ -130,31 +147,95 @@ def sample_random_board(n_pieces: int) -> Board:
                     if valid_choice != Queen
                 )
 
-    board = Board(pieces=board_pieces)
+    return Board(pieces=board_pieces)
 
-    if is_checkmate(board=board, current_player=BLACK, last_move=None) or is_checkmate(
-        board=board, current_player=WHITE, last_move=None
-    ):
-        return sample_random_board(n_pieces=n_pieces)
-    if is_check(board=board, current_player=BLACK) or is_check(
-        board=board, current_player=WHITE
-    ):
-        return sample_random_board(n_pieces=n_pieces)
-    return board
+
+def generate_chunk(
+    seed: int, chunk_index: int, count: int, pieces_range: tuple[int, int]
+) -> list[bytes]:
+    """Generate encoded semi-random boards of one chunk.
+
+    Every chunk seeds its own random number generator from the global seed and its
+    index, so the dataset does not depend on which worker generates which chunk.
+
+    Args:
+        seed: Seed of the whole dataset.
+        chunk_index: Index of the chunk within the dataset.
+        count: Number of boards to generate.
+        pieces_range: Lower (inclusive) and upper (exclusive) number of pieces.
+
+    Returns: The encoded boards.
+    """
+    rng = random.Random(f"{seed}:{chunk_index}")
+    return [
+        encode_board(
+            board=sample_random_board(n_pieces=rng.randrange(*pieces_range), rng=rng)
+        )
+        for _ in range(count)
+    ]
+
+
+def generate_boards(
+    count: int,
+    seed: int = 0,
+    workers: int = 1,
+    pieces_range: tuple[int, int] = (PIECES_RANGE_LOW, PIECES_RANGE_HIGH),
+) -> Generator[bytes, None, None]:
+    """Generate encoded semi-random boards across a pool of worker processes.
+
+    Boards are yielded in the same order for the same seed regardless of the number
+    of workers.
+    """
+    chunk_arguments = [
+        (seed, chunk_index, min(BOARDS_PER_CHUNK, count - start), pieces_range)
+        for chunk_index, start in enumerate(range(0, count, BOARDS_PER_CHUNK))
+    ]
+    if workers <= 1:
+        chunks = (generate_chunk(*arguments) for arguments in chunk_arguments)
+        yield from (board for chunk in chunks for board in chunk)
+        return
+    with Pool(processes=workers) as pool:
+        for chunk in pool.imap(_generate_chunk, chunk_arguments):
+            yield from chunk
+
+
+def _generate_chunk(arguments: tuple[int, int, int, tuple[int, int]]) -> list[bytes]:
+    return generate_chunk(*arguments)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a dataset of semi-random boards."
+    )
+    parser.add_argument("--count", type=int, default=1000, help="Number of boards.")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of worker processes."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the dataset.")
+    parser.add_argument(
+        "--pieces-range",
+        type=int,
+        nargs=2,
+        default=(PIECES_RANGE_LOW, PIECES_RANGE_HIGH),
+        metavar=("LOW", "HIGH"),
+        help="Lower (inclusive) and upper (exclusive) number of pieces per board.",
+    )
+    parser.add_argument("--output", default=DATASET_PATH, help="Path of the dataset.")
+    arguments = parser.parse_args()
+    if not 2 <= arguments.pieces_range[0] < arguments.pieces_range[1] <= 33:
+        parser.error("--pieces-range must satisfy 2 <= LOW < HIGH <= 33.")
+    return arguments
 
 
 if __name__ == "__main__":
-    NUM_BOARDS = 1000
-    count = 0
-    while count < NUM_BOARDS:
-        num_pieces = int(random.uniform(6, 20))
-        board = sample_random_board(n_pieces=num_pieces)
-        count += 1
-        if count % 10 == 0:
-            print(f"Saving board {count}")
-        with open(
-            f"analyses"
-            f"/alpha_beta_performance_increase/board_strings/board_{count}.txt",
-            "w",
-        ) as file:
-            file.write(board.to_string())
+    arguments = parse_arguments()
+    count = write_positions(
+        path=arguments.output,
+        encoded_positions=generate_boards(
+            count=arguments.count,
+            seed=arguments.seed,
+            workers=arguments.workers,
+            pieces_range=tuple(arguments.pieces_range),
+        ),
+    )
+    print(f"Saved {count} boards to {arguments.output}")
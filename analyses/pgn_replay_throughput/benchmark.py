@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from typing import Optional
+
+from utahchess.chess import ChessGame
+from utahchess.pgn import read_games_from_path, replay_game, write_game
+
+
+def create_random_games_file(path: str, num_games: int, num_plies: int) -> None:
+    """Write games of random legal moves to a PGN file."""
+    rng = random.Random(0)
+    with open(path, "w") as file:
+        for game_index in range(num_games):
+            game = ChessGame()
+            game.new_game()
+            for _ in range(num_plies):
+                if game.is_game_over():
+                    break
+                game.make_move(
+                    move_in_algebraic_notation=rng.choice(game.get_legal_moves())
+                )
+            file.write(write_game(game=game, headers={"Round": str(game_index + 1)}))
+
+
+def measure_throughput(path: str, replay: bool) -> tuple[int, float]:
+    """Read all games of a PGN file and optionally replay them on a ChessGame."""
+    num_games = 0
+    start = time.perf_counter()
+    for pgn_game in read_games_from_path(path=path):
+        if replay:
+            replay_game(pgn_game=pgn_game)
+        num_games += 1
+    return num_games, time.perf_counter() - start
+
+
+def report_results(type: str, num_games: int, seconds: float) -> None:
+    print(
+        f"Experiment of type '{type}' processed {num_games} games in {seconds:.2f} "
+        f"seconds. This implies {num_games / seconds:.2f} games per second."
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure PGN reading and replaying throughput in games/sec."
+    )
+    parser.add_argument("--pgn", help="PGN file to read. Random games if omitted.")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--plies", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.pgn
+        if path is None:
+            path = f"{directory}/random_games.pgn"
+            create_random_games_file(
+                path=path, num_games=args.games, num_plies=args.plies
+            )
+        for type, replay in (("read only", False), ("read and replay", True)):
+            num_games, seconds = measure_throughput(path=path, replay=replay)
+            report_results(type=type, num_games=num_games, seconds=seconds)
+
+
+if __name__ == "__main__":
+    main()
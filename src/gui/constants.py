@@ -1,3 +1,5 @@
+import os
+
 import pygame
 
 from utahchess import BLACK, WHITE
@@ -29,6 +31,18 @@ PIECE_ASSET_WIDTH = 60
 BACKGROUND_COLOR = "#000000"
 PLAYERS = [WHITE, BLACK]
 
+FRAMES_PER_SECOND = 60
+AI_SEARCH_DEPTH = 3
+# Whether the AI searches its move after the reply it expects while the human thinks
+AI_PONDERING = True
+# Size of the AI's transposition table, which is copied to and from every search
+AI_TABLE_ENTRIES = 20_000
+# Opening book the AI plays from before it searches, see "utahchess.opening_book"
+OPENING_BOOK_PATH = os.environ.get("UTAHCHESS_BOOK") or None
+# Directory of endgame tablebases the AI looks positions up in, see
+# "utahchess.tablebase"
+TABLEBASE_PATH = os.environ.get("UTAHCHESS_TABLEBASES") or None
+
 CONTROLS_BOX_COLOR = "#DDFFFF"
 CONTROLS_BOX_OFFSET = 5
 OFFSET_FOR_BUTTONS = 80
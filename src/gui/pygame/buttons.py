@@ -61,3 +61,13 @@ LAST_MOVE_FAKE_BUTTON = pygame.Rect(
     (TILE_WIDTH * 8 + 2 * BORDER_X_OFFSET),
     BORDER_Y_OFFSET,
 )
+
+CONTROLS_BACKGROUND = pygame.Rect(
+    BORDER_X_OFFSET,
+    BORDER_Y_OFFSET * 2 + (COLUMNS * TILE_HEIGHT),
+    TILE_WIDTH * 8,
+    OFFSET_FOR_BUTTONS,
+)
+
+# Everything "draw_controls" draws on
+CONTROLS_AREA = CONTROLS_BACKGROUND.union(LAST_MOVE_FAKE_BUTTON)
@@ -14,7 +14,6 @@ from gui.constants import (
     FILE_FONT_COLOR,
     LAST_MOVE_FONT_COLOR,
     NEW_GAME_BUTTON_COLOR,
-    OFFSET_FOR_BUTTONS,
     RANK_FONT_COLOR,
     ROWS,
     TILE_HEIGHT,
@@ -24,6 +23,7 @@ from gui.constants import (
 )
 from gui.pygame.buttons import (
     AI_MOVE_BUTTON,
+    CONTROLS_BACKGROUND,
     CURRENT_PLAYER_FAKE_BUTTON,
     LAST_MOVE_FAKE_BUTTON,
     NEW_GAME_BUTTON,
@@ -78,46 +78,58 @@ def draw_controls(
     font: pygame.font.Font,
     current_player: str = None,
     last_move: str = None,
+    is_ai_thinking: bool = False,
 ) -> tuple[pygame.Rect, ...]:
 
     # Draw background for controls
     _draw_controls_background(screen=screen)
     new_game_button = _draw_new_game_button(screen=screen, font=font)
     undo_move_button = _draw_undo_move_button(screen=screen, font=font)
-    ai_move_button = _draw_ai_move_button(screen=screen, font=font)
+    ai_move_button = _draw_ai_move_button(
+        screen=screen, font=font, is_ai_thinking=is_ai_thinking
+    )
     _draw_current_player(screen=screen, font=font, current_player=current_player)
     _draw_last_move(screen=screen, font=font, last_move=last_move)
 
     return (new_game_button, undo_move_button, ai_move_button)
 
 
+def draw_search_progress(
+    screen: pygame.Surface, font: pygame.font.Font, progress: str
+) -> pygame.Rect:
+    """Draw the progress of the AI's search where the current player is shown."""
+    return _draw_text_box(
+        screen=screen, font=font, rect=CURRENT_PLAYER_FAKE_BUTTON, text=progress
+    )
+
+
+def draw_tile(screen: pygame.Surface, x: int, y: int) -> pygame.Rect:
+    """Draw the empty tile indexed by x and y, e.g. to remove a piece or highlight."""
+    rect = pygame.Rect(
+        BORDER_X_OFFSET + (x * TILE_WIDTH),
+        BORDER_Y_OFFSET + (y * TILE_HEIGHT),
+        TILE_WIDTH,
+        TILE_HEIGHT,
+    )
+    pygame.draw.rect(
+        screen,
+        WHITE_TILE_COLOR if (x + y) % 2 == 0 else BLACK_TILE_COLOR,
+        rect,
+    )
+    return rect
+
+
 def _draw_squares(screen: pygame.Surface) -> None:
-    for x in range(1, COLUMNS + 1):
-        for y in range(1, ROWS + 1):
-            rect = (
-                BORDER_X_OFFSET + ((x - 1) * TILE_WIDTH),
-                BORDER_Y_OFFSET + ((y - 1) * TILE_HEIGHT),
-                TILE_WIDTH,
-                TILE_HEIGHT,
-            )
-            pygame.draw.rect(
-                screen,
-                WHITE_TILE_COLOR if (x + y) % 2 == 0 else BLACK_TILE_COLOR,
-                rect,
-            )
+    for x in range(COLUMNS):
+        for y in range(ROWS):
+            draw_tile(screen=screen, x=x, y=y)
 
 
 def _draw_controls_background(screen: pygame.Surface) -> None:
-    rect = (
-        BORDER_X_OFFSET,
-        BORDER_Y_OFFSET * 2 + (COLUMNS * TILE_HEIGHT),
-        TILE_WIDTH * 8,
-        OFFSET_FOR_BUTTONS,
-    )
     pygame.draw.rect(
         screen,
         CONTROLS_BOX_COLOR,
-        rect,
+        CONTROLS_BACKGROUND,
     )
 
 
@@ -155,13 +167,17 @@ def _draw_undo_move_button(
     return UNDO_MOVE_BUTTON
 
 
-def _draw_ai_move_button(screen: pygame.Surface, font: pygame.font.Font) -> pygame.Rect:
+def _draw_ai_move_button(
+    screen: pygame.Surface, font: pygame.font.Font, is_ai_thinking: bool = False
+) -> pygame.Rect:
     pygame.draw.rect(
         screen,
         AI_MOVE_BUTTON_COLOR,
         AI_MOVE_BUTTON,
     )
-    text_rect = font.render("AI Move", True, BUTTON_FONT_COLOR)
+    text_rect = font.render(
+        "Move Now" if is_ai_thinking else "AI Move", True, BUTTON_FONT_COLOR
+    )
     button_center = AI_MOVE_BUTTON.center
     new_x = button_center[0] - text_rect.get_rect().width / 2
     new_y = button_center[1] - text_rect.get_rect().height / 2
@@ -172,11 +188,6 @@ def _draw_ai_move_button(screen: pygame.Surface, font: pygame.font.Font) -> pyga
 def _draw_current_player(
     screen: pygame.Surface, font: pygame.font.Font, current_player: str = None
 ) -> pygame.Rect:
-    pygame.draw.rect(
-        screen,
-        CONTROLS_BOX_COLOR,
-        CURRENT_PLAYER_FAKE_BUTTON,
-    )
     if not current_player:
         text_to_display = ""
     elif current_player == WHITE:
@@ -184,12 +195,31 @@ def _draw_current_player(
     elif current_player == BLACK:
         text_to_display = f"It's the AI's turn! Press the button to the left!"
 
-    text_rect = font.render(text_to_display, True, BUTTON_FONT_COLOR)
-    button_center = CURRENT_PLAYER_FAKE_BUTTON.center
+    return _draw_text_box(
+        screen=screen,
+        font=font,
+        rect=CURRENT_PLAYER_FAKE_BUTTON,
+        text=text_to_display,
+    )
+
+
+def _draw_text_box(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    rect: pygame.Rect,
+    text: str,
+) -> pygame.Rect:
+    pygame.draw.rect(
+        screen,
+        CONTROLS_BOX_COLOR,
+        rect,
+    )
+    text_rect = font.render(text, True, BUTTON_FONT_COLOR)
+    button_center = rect.center
     new_x = button_center[0] - text_rect.get_rect().width / 2
     new_y = button_center[1] - text_rect.get_rect().height / 2
     screen.blit(text_rect, (new_x, new_y))
-    return CURRENT_PLAYER_FAKE_BUTTON
+    return rect
 
 
 def _draw_last_move(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional
+from pathlib import Path
+from typing import Iterable
 
 import pygame
 
@@ -17,68 +18,119 @@ from gui.constants import (
     TILE_HEIGHT,
     TILE_WIDTH,
 )
-from gui.piece_to_assetname import piece_to_assetname
+from gui.piece_to_assetname import converter, piece_to_assetname
 from gui.pygame.click_handler import get_pixel_coordinates_from_integer_coordinates
+from gui.pygame.draw_constants import draw_tile
 from utahchess.board import Board
-from utahchess.legal_moves import is_checkmate
 from utahchess.move import Move
 
+ASSETS_DIRECTORY = Path(__file__).resolve().parent.parent / "assets"
 
-def draw_pieces(screen: pygame.Surface, board: Board):
+
+def load_sprites() -> dict[str, pygame.Surface]:
+    """Load the images of all pieces once, keyed by their asset name.
+
+    The display mode has to be set before, "convert_alpha" converts the images to
+    the display's pixel format so they are drawn quickly.
+    """
+    return {
+        assetname: pygame.image.load(str(ASSETS_DIRECTORY / assetname)).convert_alpha()
+        for assetname_per_color in converter.values()
+        for assetname in assetname_per_color.values()
+    }
+
+
+def draw_pieces(
+    screen: pygame.Surface, board: Board, sprites: dict[str, pygame.Surface]
+) -> None:
     for piece in board.all_pieces():
-        current_tile = piece.position
-        x = current_tile[0]
-        y = current_tile[1]
-        (
-            x_pixel,
-            y_pixel,
-        ) = get_pixel_coordinates_from_integer_coordinates(x=x, y=y)
-
-        assetname = piece_to_assetname(piece)
-        img = pygame.image.load(f"src\\gui\\assets\\{assetname}")
-        screen.blit(
-            img,
-            (
-                x_pixel + (TILE_WIDTH - PIECE_ASSET_WIDTH) / 2,
-                y_pixel + (TILE_HEIGHT - PIECE_ASSET_HEIGHT) / 2,
-            ),
+        _draw_piece(
+            screen=screen,
+            sprite=sprites[piece_to_assetname(piece)],
+            position=piece.position,
         )
 
 
+def draw_tiles(
+    screen: pygame.Surface,
+    board: Board,
+    positions: Iterable[tuple[int, int]],
+    sprites: dict[str, pygame.Surface],
+) -> list[pygame.Rect]:
+    """Redraw single tiles with the pieces standing on them.
+
+    Returns: The redrawn areas of the screen.
+    """
+    dirty_rects = []
+    for x, y in positions:
+        dirty_rects.append(draw_tile(screen=screen, x=x, y=y))
+        piece = board[x, y]
+        if piece is not None:
+            _draw_piece(
+                screen=screen,
+                sprite=sprites[piece_to_assetname(piece)],
+                position=(x, y),
+            )
+    return dirty_rects
+
+
+def get_tiles_changed_by_move(move: Move) -> set[tuple[int, int]]:
+    """Get all tiles whose content is changed by a move, e.g. four for castling."""
+    changed_tiles = set(move.pieces_to_delete)
+    for from_tile, to_tile in move.piece_moves:
+        changed_tiles.update((from_tile, to_tile))
+    return changed_tiles
+
+
 def highlight_legal_destinations(
     screen: pygame.Surface,
     legal_destinations: tuple[tuple[int, int], ...],
     x: int,
     y: int,
-) -> None:
-    """"""
-    for destination_tile in legal_destinations:
+) -> list[pygame.Rect]:
+    """Draw a border around all legal destinations of the piece at x and y.
+
+    Returns: The highlighted areas of the screen.
+    """
+    return [
         _highlight_rectangle(screen, destination_tile[0], destination_tile[1])
+        for destination_tile in legal_destinations
+    ]
 
 
 def notify_checkmate(
     screen: pygame.Surface,
-    board: Board,
     player_in_checkmate: str,
     winning_player: str,
     font: pygame.font.Font,
-    last_move: Optional[Move],
-):
-    if is_checkmate(
-        board=board, current_player=player_in_checkmate, last_move=last_move
-    ):
-        text_rect = font.render(
-            f"{player_in_checkmate} is in checkmate - {winning_player} wins!",
-            True,
-            CHECKMATE_FONT_COLOR,
-        )
-        screen_center = (MIDDLE_OF_BOARD_X, MIDDLE_OF_BOARD_Y)
-        new_x = screen_center[0] - text_rect.get_rect().width / 2
-        new_y = screen_center[1] - text_rect.get_rect().height / 2
-        screen.blit(text_rect, (new_x, new_y))
+) -> pygame.Rect:
+    text_rect = font.render(
+        f"{player_in_checkmate} is in checkmate - {winning_player} wins!",
+        True,
+        CHECKMATE_FONT_COLOR,
+    )
+    screen_center = (MIDDLE_OF_BOARD_X, MIDDLE_OF_BOARD_Y)
+    new_x = screen_center[0] - text_rect.get_rect().width / 2
+    new_y = screen_center[1] - text_rect.get_rect().height / 2
+    return screen.blit(text_rect, (new_x, new_y))
+
+
+def _draw_piece(
+    screen: pygame.Surface, sprite: pygame.Surface, position: tuple[int, int]
+) -> None:
+    x_pixel, y_pixel = get_pixel_coordinates_from_integer_coordinates(
+        x=position[0], y=position[1]
+    )
+    screen.blit(
+        sprite,
+        (
+            x_pixel + (TILE_WIDTH - PIECE_ASSET_WIDTH) / 2,
+            y_pixel + (TILE_HEIGHT - PIECE_ASSET_HEIGHT) / 2,
+        ),
+    )
 
 
-def _highlight_rectangle(screen: pygame.Surface, x: int, y: int):
+def _highlight_rectangle(screen: pygame.Surface, x: int, y: int) -> pygame.Rect:
     """Draws a border around the rectangle indexed by x and y."""
     rect = pygame.Rect(
         x * TILE_WIDTH + BORDER_X_OFFSET,
@@ -87,4 +139,4 @@ def _highlight_rectangle(screen: pygame.Surface, x: int, y: int):
         TILE_HEIGHT,
     )
     pygame.draw.rect(screen, HIGHLIGHT_COLOR, rect, HIGHLIGHT_THICKNESS)
-    pygame.display.flip()
+    return rect
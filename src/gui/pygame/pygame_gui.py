@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
 import pygame
 
-from gui.constants import FONT, HEIGHT, WIDTH
+from gui.constants import (
+    AI_PONDERING,
+    AI_SEARCH_DEPTH,
+    AI_TABLE_ENTRIES,
+    FONT,
+    FRAMES_PER_SECOND,
+    HEIGHT,
+    OPENING_BOOK_PATH,
+    TABLEBASE_PATH,
+    WIDTH,
+)
+from gui.pygame.buttons import CONTROLS_AREA
 from gui.pygame.click_handler import (
     convert_pixel_coordinates_to_indices,
     get_tile_indices_from_user_input,
@@ -14,47 +25,64 @@ from gui.pygame.draw_constants import (
     draw_controls,
     draw_empty_board,
     draw_rank_and_file,
+    draw_search_progress,
 )
 from gui.pygame.draw_current_game_state import (
     draw_pieces,
+    draw_tiles,
+    get_tiles_changed_by_move,
     highlight_legal_destinations,
+    load_sprites,
     notify_checkmate,
 )
 from utahchess import BLACK, WHITE
+from utahchess.async_search import SearchHandle, start_search
 from utahchess.board import Board, is_edible, is_occupied
-from utahchess.chess import ChessGame
-from utahchess.minimax import Node, create_children_from_parent, get_node_value, minimax
+from utahchess.chess import CHECKMATE, ChessGame, is_irreversible_move
+from utahchess.move import Move, make_move
+from utahchess.search import BOOK_DEPTH, SearchInfo, get_ponder_move
 from utahchess.tile_movement_utils import is_in_bounds
+from utahchess.transposition_table import TranspositionTable
 
 
 class PygameGUI:
-    game: ChessGame = ChessGame()
-
     def __init__(self):
         pygame.init()
+        self.game = ChessGame()
         self.font = FONT
         self.running = True
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.last_mouse_click_indices = None
         self.game_started = False
+        self.ai_search: Optional[SearchHandle] = None
+        # Search of the AI's next move after the reply it expects, see
+        # "_start_pondering"
+        self.ponder_search: Optional[SearchHandle] = None
+        self.ponder_move: Optional[Move] = None
+        # Pondering searches of replies the human did not play, kept until they
+        # send back their transposition table
+        self.stopped_searches: list[SearchHandle] = []
+        self.table = TranspositionTable(max_entries=AI_TABLE_ENTRIES)
+        self.clock = pygame.time.Clock()
+        self.sprites = load_sprites()
+        self.dirty_rects: list[pygame.Rect] = []
+        self.highlighted_tiles: tuple[tuple[int, int], ...] = ()
+        self.game_over_type: Optional[str] = None
 
-        draw_empty_board(screen=self.screen)
-        (
-            self.new_game_button,
-            self.undo_move_button,
-            self.ai_move_button,
-        ) = draw_controls(screen=self.screen, font=self.font)
-
-        draw_rank_and_file(screen=self.screen, font=self.font)
+        self.visualize_current_game_state()
         while self.running:
-            pygame.display.flip()
+            self._update_display()
+            self.clock.tick(FRAMES_PER_SECOND)
+            self._update_ai_search()
+            self._update_stopped_searches()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                    self._cancel_ai_search()
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    self.visualize_current_game_state()
+                    self._clear_highlighted_tiles()
 
                     x_pixel, y_pixel = get_user_input()
                     x_index, y_index = get_tile_indices_from_user_input()
@@ -70,7 +98,7 @@ class PygameGUI:
                         self.make_ai_move()
                         continue
 
-                    if self.game.get_current_player() == WHITE:
+                    if self.game_started and self.get_current_player() == WHITE:
                         # No button clicked and click is outside of board bounds, skip
                         if not is_in_bounds(position=(x_index, y_index)):
                             continue
@@ -90,36 +118,46 @@ class PygameGUI:
                         self.last_mouse_click_indices = last_mouse_click_indices
 
     def new_game(self) -> None:
+        self._cancel_ai_search()
         self.game.new_game()
         self.game_started = True
+        self._update_game_over_type()
         self.visualize_current_game_state()
 
     def undo_move(self) -> None:
+        self._cancel_ai_search()
+        undone_move = self.game.current_game_state.last_move
         self.game.undo_move()
-        self.visualize_current_game_state()
+        self._on_board_changed(changed_move=undone_move)
 
     def make_ai_move(self) -> None:
-        if self.game.get_current_player() == BLACK:
-            parent_node = Node(
-                name="initial_node",
-                parent=None,
-                board=self.get_current_board(),
-                last_move=None,
-                player=BLACK,
-            )
+        """Start the AI's search or, if it is already searching, make it move now.
 
-            suggested_node, value = minimax(
-                parent_node=parent_node,
-                value_function=get_node_value,
-                get_children=create_children_from_parent,
-                depth=3,
-                alpha=-float("inf"),
-                beta=float("inf"),
-                maximizing_player=True,
+        The search runs in a background process, its result is played once
+        "_update_ai_search" finds it finished. If the human played the reply the AI
+        pondered on, the pondering search becomes the AI's search, so its move is
+        often ready right away.
+        """
+        if self.ai_search is not None:
+            self.ai_search.stop()
+            return
+        if self.get_current_player() == BLACK and self.game_over_type is None:
+            if self.ponder_search is not None:
+                self.ai_search, self.ponder_search = self.ponder_search, None
+                self._draw_controls()
+                return
+            self.ai_search = start_search(
+                board=self.get_current_board(),
+                current_player=BLACK,
+                last_move=self.game.current_game_state.last_move,
+                max_depth=AI_SEARCH_DEPTH,
+                previous_position_hashes=self.game.get_reversible_position_hashes(),
+                halfmove_clock=self.game.current_game_state.halfmove_clock,
+                book_path=OPENING_BOOK_PATH,
+                tablebase_path=TABLEBASE_PATH,
+                table=self.table,
             )
-            print(suggested_node, value)
-            self.game.make_move(move_in_algebraic_notation=suggested_node.name)
-            self.visualize_current_game_state()
+            self._draw_controls()
 
     def get_current_board(self) -> Board:
         return self.game.current_game_state.board
@@ -131,7 +169,36 @@ class PygameGUI:
         return self.game.get_current_player()
 
     def visualize_current_game_state(self) -> None:
+        """Redraw the whole screen, e.g. when a new game starts."""
+        self.highlighted_tiles = ()
         draw_empty_board(screen=self.screen)
+        self._draw_controls()
+        if self.game_started:
+            draw_pieces(
+                screen=self.screen, board=self.get_current_board(), sprites=self.sprites
+            )
+            self._notify_checkmate()
+        draw_rank_and_file(screen=self.screen, font=self.font)
+        self.dirty_rects.append(self.screen.get_rect())
+
+    def _on_board_changed(self, changed_move: Optional[Move]) -> None:
+        """Redraw only what a move (or undoing it) changed.
+
+        Those are the tiles the move changed, the controls and, at the end of the
+        game, the checkmate notification.
+        """
+        was_checkmate = self.game_over_type == CHECKMATE
+        self._update_game_over_type()
+        if was_checkmate and self.game_over_type != CHECKMATE:
+            self.visualize_current_game_state()  # Remove the checkmate notification
+            return
+        self._clear_highlighted_tiles()
+        if changed_move is not None:
+            self._redraw_tiles(positions=get_tiles_changed_by_move(move=changed_move))
+        self._draw_controls()
+        self._notify_checkmate()
+
+    def _draw_controls(self) -> None:
         (
             self.new_game_button,
             self.undo_move_button,
@@ -141,18 +208,141 @@ class PygameGUI:
             font=self.font,
             current_player=self.get_current_player() if self.game_started else None,
             last_move=self.get_last_move() if self.game_started else None,
+            is_ai_thinking=self.ai_search is not None,
         )
-        if self.game_started:
-            draw_pieces(screen=self.screen, board=self.get_current_board())
-            notify_checkmate(
+        if self.ai_search is not None:
+            draw_search_progress(
                 screen=self.screen,
-                board=self.get_current_board(),
-                player_in_checkmate=self.get_current_player(),
-                winning_player=self.get_opposite_player(),
                 font=self.font,
-                last_move=self.game.current_game_state.last_move,
+                progress=_get_search_progress(info=self.ai_search.latest_info),
             )
-        draw_rank_and_file(screen=self.screen, font=self.font)
+        self.dirty_rects.append(CONTROLS_AREA)
+
+    def _notify_checkmate(self) -> None:
+        if self.game_over_type == CHECKMATE:
+            self.dirty_rects.append(
+                notify_checkmate(
+                    screen=self.screen,
+                    player_in_checkmate=self.get_current_player(),
+                    winning_player=self.get_opposite_player(),
+                    font=self.font,
+                )
+            )
+
+    def _update_game_over_type(self) -> None:
+        """Compute whether the game is over once per move instead of per frame."""
+        self.game_over_type = self.game.get_game_over_type()
+
+    def _redraw_tiles(self, positions: Iterable[tuple[int, int]]) -> None:
+        self.dirty_rects.extend(
+            draw_tiles(
+                screen=self.screen,
+                board=self.get_current_board(),
+                positions=positions,
+                sprites=self.sprites,
+            )
+        )
+
+    def _clear_highlighted_tiles(self) -> None:
+        if self.game_started and self.highlighted_tiles:
+            self._redraw_tiles(positions=self.highlighted_tiles)
+            self._notify_checkmate()
+        self.highlighted_tiles = ()
+
+    def _update_display(self) -> None:
+        """Copy only the areas drawn on since the last frame to the display."""
+        if self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+            self.dirty_rects = []
+
+    def _update_ai_search(self) -> None:
+        """Show the progress of the AI's search and play its move once finished."""
+        if self.ai_search is None:
+            return
+        new_infos = self.ai_search.poll()
+        if new_infos:
+            self.dirty_rects.append(
+                draw_search_progress(
+                    screen=self.screen,
+                    font=self.font,
+                    progress=_get_search_progress(info=new_infos[-1]),
+                )
+            )
+        if not self.ai_search.is_done:
+            return
+        result = self.ai_search.latest_info
+        if self.ai_search.table is not None:
+            self.table.update(self.ai_search.table)
+        self.ai_search = None
+        if result is None:
+            self._draw_controls()
+            return
+        ponder_move = get_ponder_move(
+            board=self.get_current_board(),
+            current_player=BLACK,
+            best_move=result.best_move,
+            table=self.table,
+            last_move=self.game.current_game_state.last_move,
+        )
+        self.game.make_move(move_in_algebraic_notation=result.best_move_identifier)
+        self._on_board_changed(changed_move=result.best_move)
+        if AI_PONDERING and ponder_move is not None and self.game_over_type is None:
+            self._start_pondering(ponder_move=ponder_move)
+
+    def _start_pondering(self, ponder_move: Move) -> None:
+        """Search the AI's next move after the reply it expects from the human."""
+        game_state = self.game.current_game_state
+        if is_irreversible_move(move=ponder_move):
+            previous_position_hashes: list[int] = []
+            halfmove_clock = 0
+        else:
+            previous_position_hashes = self.game.get_reversible_position_hashes() + [
+                game_state.position_hash
+            ]
+            halfmove_clock = game_state.halfmove_clock + 1
+        self.ponder_move = ponder_move
+        self.ponder_search = start_search(
+            board=make_move(board=game_state.board, move=ponder_move),
+            current_player=BLACK,
+            last_move=ponder_move,
+            max_depth=AI_SEARCH_DEPTH,
+            previous_position_hashes=previous_position_hashes,
+            halfmove_clock=halfmove_clock,
+            book_path=OPENING_BOOK_PATH,
+            tablebase_path=TABLEBASE_PATH,
+            table=self.table,
+        )
+
+    def _on_human_move(self, move: Move) -> None:
+        """Keep pondering if the human played the expected reply, else stop it.
+
+        A stopped search still sends back its transposition table, whose entries
+        are of use for the search of the move that was played.
+        """
+        if self.ponder_search is not None and move != self.ponder_move:
+            self.ponder_search.stop()
+            self.stopped_searches.append(self.ponder_search)
+            self.ponder_search = None
+        self.ponder_move = None
+
+    def _update_stopped_searches(self) -> None:
+        """Merge the transposition tables of stopped searches once they arrive."""
+        for search in self.stopped_searches:
+            search.poll()
+            if search.is_done and search.table is not None:
+                self.table.update(search.table)
+        self.stopped_searches = [
+            search for search in self.stopped_searches if not search.is_done
+        ]
+
+    def _cancel_ai_search(self) -> None:
+        if self.ai_search is not None:
+            self.ai_search.cancel()
+            self.ai_search = None
+        if self.ponder_search is not None:
+            self.ponder_search.cancel()
+            self.ponder_search = None
+            self.ponder_move = None
 
     def get_opposite_player(self) -> str:
         return BLACK if self.get_current_player() == WHITE else WHITE
@@ -162,12 +352,15 @@ class PygameGUI:
             legal_destinations = self.game.get_legal_destinations_for_piece(
                 position=(x, y)
             )
-            highlight_legal_destinations(
-                screen=self.screen,
-                legal_destinations=legal_destinations,
-                x=x,
-                y=y,
+            self.dirty_rects.extend(
+                highlight_legal_destinations(
+                    screen=self.screen,
+                    legal_destinations=legal_destinations,
+                    x=x,
+                    y=y,
+                )
             )
+            self.highlighted_tiles = legal_destinations
 
     def _make_move(self, x, y) -> None:
         if not is_occupied(self.get_current_board(), (x, y)) or is_edible(
@@ -175,23 +368,24 @@ class PygameGUI:
             position=(x, y),
             friendly_color=self.get_current_player(),
         ):
-            if self.last_mouse_click_indices:
-                potential_algebraic_move, _ = None, None
-                for (
-                    algebraic_move,
-                    move,
-                ) in self.game.current_game_state.legal_moves.items():
-                    if (
-                        move.piece_moves[0][1] == (x, y)
-                        and move.piece_moves[0][0] == self.last_mouse_click_indices
-                    ):
-                        potential_algebraic_move, _ = algebraic_move, move
-                if potential_algebraic_move:
-                    self.game.make_move(
-                        move_in_algebraic_notation=potential_algebraic_move
-                    )
+            if self.last_mouse_click_indices and self.game.make_move_from_squares(
+                from_square=self.last_mouse_click_indices, to_square=(x, y)
+            ):
+                last_move = self.game.current_game_state.last_move
+                self._on_board_changed(changed_move=last_move)
+                if last_move is not None:
+                    self._on_human_move(move=last_move)
+
 
-                self.visualize_current_game_state()
+def _get_search_progress(info: Optional[SearchInfo]) -> str:
+    if info is None:
+        return "AI is thinking..."
+    if info.depth == BOOK_DEPTH:
+        return f"Book move {info.best_move_identifier}"
+    return (
+        f"Depth {info.depth} | best {info.best_move_identifier} | "
+        f"{info.nodes_per_second:.0f} nodes/s"
+    )
 
 
 if __name__ == "__main__":
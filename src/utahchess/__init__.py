@@ -1,3 +1,10 @@
+import os
+
 __version__ = "0.0.1"
 WHITE = "white"
 BLACK = "black"
+
+if os.environ.get("UTAHCHESS_PROFILE", "0") not in ("", "0"):
+    from utahchess.profiling import enable_from_environment
+
+    enable_from_environment()
@@ -0,0 +1,274 @@
+"""Searches that run in a background process and can be awaited with asyncio.
+
+The search runs in its own process, so neither the event loop nor a GUI are blocked
+by it and it can be cancelled at any time:
+
+    handle = start_search(board=board, current_player=WHITE, time_limit=5)
+    async for info in handle:
+        print(info.depth, info.value, info.principal_variation, info.nodes)
+    result = await handle.result()
+
+"SearchHandle.poll" offers the same without asyncio, e.g. for a game loop.
+
+A transposition table passed to "start_search" is copied to the search process and
+sent back with the result, so consecutive searches of a game, including searches
+that were stopped, can build on each other's results, see "SearchHandle.table".
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+import time
+from multiprocessing.synchronize import Event
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from utahchess.board import Board
+from utahchess.move import Move
+from utahchess.opening_book import OpeningBook
+from utahchess.search import MAX_DEPTH, SearchInfo, iterative_deepening
+from utahchess.tablebase import Tablebases
+from utahchess.transposition_table import TranspositionTable
+
+POLL_INTERVAL_SECONDS = 0.01
+
+_INFO = "info"
+_DONE = "done"
+_ERROR = "error"
+
+
+class SearchHandle:
+    """Handle of a search running in a background process.
+
+    Use "start_search" to create one. Results of completed iterations arrive while
+    the search runs and can be iterated asynchronously.
+    """
+
+    def __init__(
+        self,
+        process: multiprocessing.process.BaseProcess,
+        message_queue: multiprocessing.Queue,
+        stop_event: Event,
+    ) -> None:
+        self.infos: list[SearchInfo] = []
+        self._process = process
+        self._message_queue = message_queue
+        self._stop_event = stop_event
+        self._is_done = False
+        self._is_cancelled = False
+        self._result: Optional[SearchInfo] = None
+        self._table: Optional[TranspositionTable] = None
+        self._error: Optional[str] = None
+
+    @property
+    def is_done(self) -> bool:
+        return self._is_done
+
+    @property
+    def latest_info(self) -> Optional[SearchInfo]:
+        return self.infos[-1] if self.infos else None
+
+    @property
+    def table(self) -> Optional[TranspositionTable]:
+        """Transposition table of the finished search, including its new entries.
+
+        None while the search runs, if it was started without a table, or if it was
+        cancelled or failed.
+        """
+        return self._table
+
+    def poll(self) -> list[SearchInfo]:
+        """Collect the results of iterations that completed since the last poll.
+
+        Never blocks, so it can be called from an event or game loop.
+
+        Returns: The newly completed iterations.
+        """
+        new_infos = []
+        while not self._is_done:
+            try:
+                message_type, payload = self._message_queue.get_nowait()
+            except queue.Empty:
+                if not self._process.is_alive() and self._message_queue.empty():
+                    self._finish(error="Search process ended unexpectedly.")
+                break
+            if message_type == _INFO:
+                new_infos.append(payload)
+            elif message_type == _DONE:
+                result, table = payload
+                self._finish(result=result, table=table)
+            else:
+                self._finish(error=payload)
+        self.infos.extend(new_infos)
+        return new_infos
+
+    def stop(self) -> None:
+        """Ask the search to stop, "result" then returns the best move found so far.
+
+        Unlike "cancel", the transposition table of the search is kept.
+        """
+        self._stop_event.set()
+
+    def cancel(self) -> None:
+        """Terminate the search immediately, "result" then raises CancelledError."""
+        if self._is_done:
+            return
+        self._stop_event.set()
+        self._process.terminate()
+        self._is_cancelled = True
+        self._finish()
+
+    async def result(self) -> Optional[SearchInfo]:
+        """Wait for the search to finish.
+
+        Returns: The result of the deepest completed iteration, or None if there is
+            no legal move or no iteration completed.
+
+        Raises:
+            asyncio.CancelledError: If the search was cancelled.
+            RuntimeError: If the search failed.
+        """
+        while not self._is_done:
+            self.poll()
+            if not self._is_done:
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        if self._is_cancelled:
+            raise asyncio.CancelledError()
+        if self._error is not None:
+            raise RuntimeError(self._error)
+        return self._result
+
+    async def __aiter__(self) -> AsyncIterator[SearchInfo]:
+        """Iterate over the results of all iterations as they complete."""
+        index = 0
+        while True:
+            self.poll()
+            while index < len(self.infos):
+                yield self.infos[index]
+                index += 1
+            if self._is_done:
+                return
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    def _finish(
+        self,
+        result: Optional[SearchInfo] = None,
+        table: Optional[TranspositionTable] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self._is_done = True
+        self._result = result
+        self._table = table
+        self._error = error
+        self._process.join()
+
+
+def start_search(
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move] = None,
+    max_depth: int = MAX_DEPTH,
+    time_limit: Optional[float] = None,
+    previous_position_hashes: Sequence[int] = (),
+    halfmove_clock: int = 0,
+    book_path: Optional[str] = None,
+    tablebase_path: Optional[str] = None,
+    table: Optional[TranspositionTable] = None,
+) -> SearchHandle:
+    """Start an iterative deepening search in a background process.
+
+    Args:
+        board: Board to search a move on.
+        current_player: Player to find a move for.
+        last_move: Last move that was executed on the board.
+        max_depth: Depth of the last iteration.
+        time_limit: Seconds after which the search stops, unlimited if None.
+        previous_position_hashes: Hashes of the positions of the game before the
+            board since the last irreversible move, see "iterative_deepening".
+        halfmove_clock: Number of halfmoves since the last capture or pawn move.
+        book_path: Path of an opening book to look the position up in before
+            searching, see "utahchess.opening_book".
+        tablebase_path: Directory of endgame tablebases to look positions up in, see
+            "utahchess.tablebase".
+        table: Transposition table to order moves by, e.g. of an earlier search of
+            the game. The search fills a copy of it, see "SearchHandle.table".
+
+    Returns: A handle to follow, stop or cancel the search.
+    """
+    message_queue: multiprocessing.Queue = multiprocessing.Queue()
+    stop_event = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_run_search,
+        kwargs={
+            "board": board,
+            "current_player": current_player,
+            "last_move": last_move,
+            "max_depth": max_depth,
+            "time_limit": time_limit,
+            "previous_position_hashes": tuple(previous_position_hashes),
+            "halfmove_clock": halfmove_clock,
+            "book_path": book_path,
+            "tablebase_path": tablebase_path,
+            "table": table,
+            "message_queue": message_queue,
+            "stop_event": stop_event,
+        },
+        daemon=True,
+    )
+    process.start()
+    return SearchHandle(
+        process=process, message_queue=message_queue, stop_event=stop_event
+    )
+
+
+def _run_search(
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move],
+    max_depth: int,
+    time_limit: Optional[float],
+    previous_position_hashes: Sequence[int],
+    halfmove_clock: int,
+    book_path: Optional[str],
+    tablebase_path: Optional[str],
+    table: Optional[TranspositionTable],
+    message_queue: multiprocessing.Queue,
+    stop_event: Event,
+) -> None:
+    """Run a search and send its progress to the parent process."""
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    def should_stop() -> bool:
+        return stop_event.is_set() or (
+            deadline is not None and time.perf_counter() >= deadline
+        )
+
+    message: tuple[str, Any]
+    try:
+        # Book and tablebases are opened in the search process, memory maps cannot
+        # be pickled
+        book = None if book_path is None else OpeningBook(path=book_path)
+        tablebases = (
+            None if tablebase_path is None else Tablebases(directory=tablebase_path)
+        )
+        result = iterative_deepening(
+            board=board,
+            current_player=current_player,
+            last_move=last_move,
+            max_depth=max_depth,
+            should_stop=should_stop,
+            on_iteration=lambda info: message_queue.put((_INFO, info)),
+            previous_position_hashes=previous_position_hashes,
+            halfmove_clock=halfmove_clock,
+            book=book,
+            tablebases=tablebases,
+            table=table,
+        )
+        if book is not None:
+            book.close()
+        if tablebases is not None:
+            tablebases.close()
+        message = (_DONE, (result, table))
+    except Exception as exception:
+        message = (_ERROR, repr(exception))
+    message_queue.put(message)
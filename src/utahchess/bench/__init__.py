@@ -0,0 +1,21 @@
+"""Benchmarks of the engine, run them with "python -m utahchess.bench"."""
+
+from utahchess.bench.harness import (
+    BenchmarkResult,
+    run_suites,
+    run_workload,
+    to_json,
+)
+from utahchess.bench.memory import measure_memory_per_game
+from utahchess.bench.suites import SUITES, Workload, perft
+
+__all__ = [
+    "BenchmarkResult",
+    "SUITES",
+    "Workload",
+    "measure_memory_per_game",
+    "perft",
+    "run_suites",
+    "run_workload",
+    "to_json",
+]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+from typing import Optional, Sequence
+
+from utahchess.bench.harness import run_suites, to_json
+from utahchess.bench.memory import measure_memory_per_game
+from utahchess.bench.suites import SUITES
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m utahchess.bench",
+        description="Benchmark the engine on a fixed set of positions.",
+    )
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        default=list(SUITES),
+        choices=list(SUITES),
+        metavar="SUITE",
+        help=f"Suites to run, any of {', '.join(SUITES)}. Runs all by default.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of measured runs per workload."
+    )
+    parser.add_argument(
+        "--depth", type=int, default=2, help="Depth of the perft and search suites."
+    )
+    parser.add_argument(
+        "--label", default="", help="Label of the run, e.g. the commit hash."
+    )
+    parser.add_argument(
+        "--output", help="Path of the JSON report. Printed to stdout if not given."
+    )
+    parser.add_argument(
+        "--memory-plies",
+        type=int,
+        help="Also measure the memory per stored game after that many plies.",
+    )
+    parser.add_argument(
+        "--memory-games",
+        type=int,
+        default=20,
+        help="Number of games stored to measure the memory per game.",
+    )
+    arguments = parser.parse_args(argv)
+
+    report = run_suites(
+        suites=arguments.suites,
+        repeat=arguments.repeat,
+        depth=arguments.depth,
+        label=arguments.label,
+    )
+    if arguments.memory_plies is not None:
+        report["memory"] = measure_memory_per_game(
+            plies=arguments.memory_plies, games=arguments.memory_games
+        )
+    report_json = to_json(report=report)
+    if arguments.output is None:
+        print(report_json)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(report_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
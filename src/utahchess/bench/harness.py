@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional, Sequence
+
+from utahchess.bench.suites import SUITES, Workload
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements of repeated runs of a single workload.
+
+    Latencies are wall clock seconds of single runs, nodes per second are computed
+    from the median latency.
+    """
+
+    suite: str
+    workload: str
+    runs: int
+    nodes: int
+    median_seconds: float
+    p95_seconds: float
+    min_seconds: float
+    nodes_per_second: float
+
+
+def run_workload(workload: Workload, repeat: int) -> BenchmarkResult:
+    """Run a workload repeatedly and measure it with "time.perf_counter".
+
+    Args:
+        workload: Workload to measure.
+        repeat: Number of measured runs. One additional warm-up run is not measured.
+
+    Returns: The measurements of the workload.
+    """
+    workload.run()
+    latencies = []
+    nodes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nodes = workload.run()
+        latencies.append(time.perf_counter() - start)
+    median = statistics.median(latencies)
+    return BenchmarkResult(
+        suite=workload.suite,
+        workload=workload.name,
+        runs=repeat,
+        nodes=nodes,
+        median_seconds=median,
+        p95_seconds=get_percentile(values=latencies, percentile=95),
+        min_seconds=min(latencies),
+        nodes_per_second=nodes / median if median > 0 else float("inf"),
+    )
+
+
+def run_suites(
+    suites: Sequence[str], repeat: int = 5, depth: int = 2, label: str = ""
+) -> dict:
+    """Run benchmark suites and collect a report that can be serialized to JSON.
+
+    Args:
+        suites: Names of the suites to run, see "SUITES".
+        repeat: Number of measured runs per workload.
+        depth: Depth for perft and search suites.
+        label: Free text to identify the run, e.g. a commit hash.
+
+    Returns: The report containing environment information, all results and the
+        peak resident set size of the process.
+
+    Raises:
+        ValueError: If a suite does not exist.
+    """
+    unknown_suites = [suite for suite in suites if suite not in SUITES]
+    if unknown_suites:
+        raise ValueError(f"Unknown benchmark suites {unknown_suites}.")
+    results = [
+        run_workload(workload=workload, repeat=repeat)
+        for suite in suites
+        for workload in SUITES[suite](depth)
+    ]
+    return {
+        "label": label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "depth": depth,
+        "peak_rss_bytes": get_peak_rss(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def get_percentile(values: Sequence[float], percentile: float) -> float:
+    """Get a percentile of values with the nearest-rank method."""
+    sorted_values = sorted(values)
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def get_peak_rss() -> Optional[int]:
+    """Get the peak resident set size of the process in bytes, if available."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def to_json(report: dict) -> str:
+    return json.dumps(report, indent=2)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+import tracemalloc
+
+from utahchess.chess import ChessGame
+from utahchess.game_manager import GameManager, snapshot_game
+
+
+def play_random_game(plies: int, seed: int = 0) -> ChessGame:
+    """Play random legal moves from the initial position.
+
+    Args:
+        plies: Number of moves to play. Fewer are played if the game ends before.
+        seed: Seed of the random moves.
+
+    Returns: The game after the moves.
+    """
+    rng = random.Random(seed)
+    game = ChessGame()
+    game.new_game()
+    for _ in range(plies):
+        legal_moves = game.get_legal_moves()
+        if not legal_moves:
+            break
+        game.make_move(move_in_algebraic_notation=rng.choice(legal_moves))
+    return game
+
+
+def measure_memory_per_game(plies: int = 100, games: int = 20, seed: int = 0) -> dict:
+    """Measure the memory a "GameManager" needs per game at a ply count.
+
+    One random game is played and restored from its snapshot into a game manager
+    "games" times. Memory is measured with "tracemalloc", so it includes all
+    objects a game keeps alive but not objects shared by all games.
+
+    Args:
+        plies: Number of moves of each game.
+        games: Number of games to store.
+        seed: Seed of the random moves.
+
+    Returns: Plies actually played, number of games, bytes per game and bytes per
+        snapshot.
+    """
+    snapshot = snapshot_game(game=play_random_game(plies=plies, seed=seed))
+    manager = GameManager()
+    manager.restore(snapshot=snapshot)  # Warm up caches shared by all games
+
+    tracemalloc.start()
+    try:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        for _ in range(games):
+            manager.restore(snapshot=snapshot)
+        end_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    game_id = next(iter(manager))
+    return {
+        "plies": len(manager.get_game(game_id=game_id).history),
+        "games": games,
+        "bytes_per_game": (end_bytes - start_bytes) / games,
+        "snapshot_bytes": len(snapshot),
+    }
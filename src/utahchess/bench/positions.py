@@ -0,0 +1,19 @@
+"""Fixed positions and games the benchmark suites run on.
+
+Positions must not change between commits, otherwise results are not comparable.
+None of them allows a pawn promotion within a few plies, which the engine does not
+support.
+"""
+
+BENCHMARK_POSITIONS = {
+    "initial": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "italian": "r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "kiwipete": "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "rook_endgame": "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+}
+
+REPLAY_GAMES = {
+    "ruy_lopez": (
+        "e4 e5 Nf3 Nc6 Bb5 a6 Ba4 Nf6 O-O Be7 Re1 b5 Bb3 d6 c3 O-O h3 Nb8 d4 Nbd7"
+    ).split(),
+}
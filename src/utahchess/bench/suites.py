@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.bench.positions import BENCHMARK_POSITIONS, REPLAY_GAMES
+from utahchess.board import Board
+from utahchess.chess import ChessGame
+from utahchess.legal_moves import get_legal_moves, get_move_per_algebraic_identifier
+from utahchess.minimax import (
+    Node,
+    create_children_from_parent,
+    get_board_value,
+    get_node_value,
+    minimax,
+)
+from utahchess.move import Move, make_move
+from utahchess.pgn import PgnGame, replay_game
+from utahchess.search_stats import SearchStats
+
+EVALUATIONS_PER_RUN = 100
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A single measurable unit of work of a suite.
+
+    Calling "run" does the work once and returns the number of nodes it processed,
+    e.g. leaf positions for perft or evaluated boards for evaluation throughput.
+    """
+
+    suite: str
+    name: str
+    run: Callable[[], int]
+
+
+def perft(
+    board: Board, current_player: str, last_move: Optional[Move], depth: int
+) -> int:
+    """Count the leaf positions of the legal move tree up to a given depth.
+
+    See https://www.chessprogramming.org/Perft for reference numbers.
+
+    Args:
+        board: Board to start from.
+        current_player: Player whose turn it is.
+        last_move: Last move that was executed on the board.
+        depth: Number of plies to look ahead.
+
+    Returns: Number of positions reached after exactly "depth" plies.
+    """
+    if depth == 0:
+        return 1
+    legal_moves = get_legal_moves(
+        board=board, current_player=current_player, last_move=last_move
+    )
+    if depth == 1:
+        return sum(1 for _ in legal_moves)
+    next_player = WHITE if current_player == BLACK else BLACK
+    return sum(
+        perft(
+            board=make_move(board=board, move=move),
+            current_player=next_player,
+            last_move=move,
+            depth=depth - 1,
+        )
+        for move in legal_moves
+    )
+
+
+def get_perft_workloads(depth: int) -> list[Workload]:
+    return [
+        Workload(suite="perft", name=name, run=partial(_run_perft, game, depth))
+        for name, game in _get_games().items()
+    ]
+
+
+def get_search_workloads(depth: int) -> list[Workload]:
+    return [
+        Workload(suite="search", name=name, run=partial(_run_search, game, depth))
+        for name, game in _get_games().items()
+    ]
+
+
+def get_evaluation_workloads(depth: int) -> list[Workload]:
+    return [
+        Workload(suite="evaluation", name=name, run=partial(_run_evaluation, game))
+        for name, game in _get_games().items()
+    ]
+
+
+def get_san_workloads(depth: int) -> list[Workload]:
+    return [
+        Workload(suite="san", name=name, run=partial(_run_san, game))
+        for name, game in _get_games().items()
+    ]
+
+
+def get_replay_workloads(depth: int) -> list[Workload]:
+    return [
+        Workload(suite="replay", name=name, run=partial(_run_replay, tuple(moves)))
+        for name, moves in REPLAY_GAMES.items()
+    ]
+
+
+SUITES: dict[str, Callable[[int], list[Workload]]] = {
+    "perft": get_perft_workloads,
+    "search": get_search_workloads,
+    "evaluation": get_evaluation_workloads,
+    "san": get_san_workloads,
+    "replay": get_replay_workloads,
+}
+
+
+def _get_games() -> dict[str, ChessGame]:
+    return {name: ChessGame.from_fen(fen) for name, fen in BENCHMARK_POSITIONS.items()}
+
+
+def _run_perft(game: ChessGame, depth: int) -> int:
+    return perft(
+        board=game.current_game_state.board,
+        current_player=game.current_game_state.current_player,
+        last_move=game.current_game_state.last_move,
+        depth=depth,
+    )
+
+
+def _run_search(game: ChessGame, depth: int) -> int:
+    stats = SearchStats()
+    minimax(
+        parent_node=Node(
+            name="initial_node",
+            parent=None,
+            board=game.current_game_state.board,
+            last_move=game.current_game_state.last_move,
+            player=game.current_game_state.current_player,
+        ),
+        value_function=get_node_value,
+        get_children=create_children_from_parent,
+        depth=depth,
+        maximizing_player=True,
+        alpha=-float("inf"),
+        beta=float("inf"),
+        stats=stats,
+    )
+    return stats.nodes
+
+
+def _run_evaluation(game: ChessGame) -> int:
+    for _ in range(EVALUATIONS_PER_RUN):
+        get_board_value(
+            board=game.current_game_state.board,
+            player_that_just_made_the_move=game.get_next_player(),
+            last_move=game.current_game_state.last_move,
+        )
+    return EVALUATIONS_PER_RUN
+
+
+def _run_san(game: ChessGame) -> int:
+    return len(
+        get_move_per_algebraic_identifier(
+            board=game.current_game_state.board,
+            current_player=game.current_game_state.current_player,
+            last_move=game.current_game_state.last_move,
+        )
+    )
+
+
+def _run_replay(moves: tuple[str, ...]) -> int:
+    return len(replay_game(pgn_game=PgnGame(moves=moves)).history)
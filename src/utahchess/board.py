@@ -1,13 +1,56 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Generator, Iterable, Optional
 
-from utahchess.piece import Piece, create_piece_instance_from_string, get_initial_pieces
+from utahchess import BLACK, WHITE
+from utahchess.piece import (
+    King,
+    Piece,
+    Rook,
+    create_piece_instance_from_string,
+    get_initial_pieces,
+)
 from utahchess.utils import get_unicode_character, x_index_to_file, y_index_to_rank
 
 NO_RANKS_AND_FILES = 8
 
+FEN_CASTLING_TILES = {
+    "K": (("K", 4, 7), ("R", 7, 7)),
+    "Q": (("K", 4, 7), ("R", 0, 7)),
+    "k": (("k", 4, 0), ("r", 7, 0)),
+    "q": (("k", 4, 0), ("r", 0, 0)),
+}
+
+
+def _fen_character_to_board_string(character: str) -> str:
+    """Get the board string of a FEN piece character, e.g. "wp" for "P"."""
+    return ("b" if character.islower() else "w") + character.lower()
+
+
+# Pieces are immutable, so every piece a FEN can describe is created once up front.
+# Kings and rooks are only in starting position if castling availability says so.
+FEN_PIECES = {
+    (character, x, y): create_piece_instance_from_string(
+        position=(x, y), string=_fen_character_to_board_string(character)
+    )
+    for character in "PNBQpnbq"
+    for x in range(NO_RANKS_AND_FILES)
+    for y in range(NO_RANKS_AND_FILES)
+}
+FEN_CASTLING_PIECES = {
+    (character, x, y, is_in_start_position): (King if character in "Kk" else Rook)(
+        position=(x, y),
+        color=BLACK if character.islower() else WHITE,
+        is_in_start_position=is_in_start_position,
+    )
+    for character in "KRkr"
+    for x in range(NO_RANKS_AND_FILES)
+    for y in range(NO_RANKS_AND_FILES)
+    for is_in_start_position in (True, False)
+}
+
 
 @dataclass(frozen=True)
 class Board:
@@ -59,6 +102,51 @@ class Board:
 
         object.__setattr__(self, "_board", tuple(tuple(column) for column in _board))
 
+    @classmethod
+    def from_fen(cls, fen: str) -> Board:
+        """Create a board from a string in Forsyth-Edwards Notation (FEN).
+
+        Only the piece placement and castling availability fields are used, side to
+        move and en passant square are handled by "utahchess.chess.ChessGame.from_fen".
+        The placement field is read rank by rank and parsed ranks are cached, which
+        makes bulk loading of positions much faster than using board strings.
+        Castling availability decides whether kings and rooks are in starting
+        position. Missing fields default to "no castling".
+
+        Args:
+            fen: FEN string, e.g.
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1".
+
+        Returns: The board described by the FEN string.
+
+        Raises:
+            ValueError: If the piece placement field is malformed.
+        """
+        fields = fen.split()
+        if not fields:
+            raise ValueError("Cannot create board from an empty FEN string.")
+        ranks = fields[0].split("/")
+        if len(ranks) != NO_RANKS_AND_FILES:
+            raise ValueError(f"Piece placement of FEN '{fen}' does not have 8 ranks.")
+        castling_availability = fields[2] if len(fields) > 2 else "-"
+        # Positional arguments keep the cache lookups cheap
+        _board = tuple(
+            zip(
+                _parse_fen_rank(ranks[0], 0, castling_availability),
+                _parse_fen_rank(ranks[1], 1, "-"),
+                _parse_fen_rank(ranks[2], 2, "-"),
+                _parse_fen_rank(ranks[3], 3, "-"),
+                _parse_fen_rank(ranks[4], 4, "-"),
+                _parse_fen_rank(ranks[5], 5, "-"),
+                _parse_fen_rank(ranks[6], 6, "-"),
+                _parse_fen_rank(ranks[7], 7, castling_availability),
+            )
+        )
+
+        board = object.__new__(cls)
+        object.__setattr__(board, "_board", _board)
+        return board
+
     def __getitem__(self, indices: tuple[int, int]) -> Optional[Piece]:
         x, y = indices
         return self._board[x][y]
@@ -140,6 +228,49 @@ class Board:
         )
         return board_string
 
+    def to_fen(
+        self,
+        current_player: str = WHITE,
+        en_passant_square: str = "-",
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ) -> str:
+        """Get representation of the board in Forsyth-Edwards Notation (FEN).
+
+        Castling availability is derived from kings and rooks that are still in
+        starting position. Fields the board does not know about can be passed in.
+
+        Args:
+            current_player: Player whose turn it is.
+            en_passant_square: En passant target square, e.g. "e3", or "-".
+            halfmove_clock: Number of halfmoves since the last capture or pawn move.
+            fullmove_number: Number of the current full move, starting at 1.
+
+        Returns: A FEN string that can be used with "Board.from_fen".
+        """
+        ranks = []
+        for y in range(NO_RANKS_AND_FILES):
+            rank = ""
+            empty_tiles = 0
+            for x in range(NO_RANKS_AND_FILES):
+                piece = self._board[x][y]
+                if piece is None:
+                    empty_tiles += 1
+                    continue
+                if empty_tiles:
+                    rank += str(empty_tiles)
+                    empty_tiles = 0
+                identifier = piece.to_string()[1]  # type: ignore
+                rank += identifier.upper() if piece.color == WHITE else identifier
+            if empty_tiles:
+                rank += str(empty_tiles)
+            ranks.append(rank)
+        return (
+            f"{'/'.join(ranks)} {'w' if current_player == WHITE else 'b'} "
+            f"{self._get_fen_castling_availability()} {en_passant_square} "
+            f"{halfmove_clock} {fullmove_number}"
+        )
+
     def __repr__(self) -> str:
         representation = (
             "          "
@@ -158,6 +289,17 @@ class Board:
         representation + "  " + "--------  " * (NO_RANKS_AND_FILES + 1)
         return representation
 
+    def _get_fen_castling_availability(self) -> str:
+        """Get FEN castling field from kings and rooks in starting position."""
+        castling_availability = ""
+        for character, tiles in FEN_CASTLING_TILES.items():
+            if all(
+                self[x, y] == FEN_CASTLING_PIECES[(piece_character, x, y, True)]
+                for piece_character, x, y in tiles
+            ):
+                castling_availability += character
+        return castling_availability or "-"
+
     def _initialize_from_string(
         self, board_string: str
     ) -> tuple[tuple[Piece, ...], ...]:
@@ -175,6 +317,39 @@ class Board:
         return tuple(tuple(column) for column in _board)  # type: ignore
 
 
+@lru_cache(maxsize=2**16)
+def _parse_fen_rank(
+    rank: str, y: int, castling_availability: str
+) -> tuple[Optional[Piece], ...]:
+    """Get the pieces of one rank of a FEN's piece placement field.
+
+    Ranks repeat a lot between positions (e.g. "8" or "pppppppp"), so results are
+    cached. Castling availability only matters for the first and last rank.
+    """
+    castling_tiles = {
+        tile
+        for character in castling_availability
+        for tile in FEN_CASTLING_TILES.get(character, ())
+    }
+    pieces: list[Optional[Piece]] = []
+    for character in rank:
+        if character in "12345678":
+            pieces.extend([None] * int(character))
+            continue
+        x = len(pieces)
+        piece = FEN_PIECES.get((character, x, y))
+        if piece is None:
+            piece = FEN_CASTLING_PIECES.get(
+                (character, x, y, (character, x, y) in castling_tiles)
+            )
+            if piece is None:
+                raise ValueError(f"Invalid piece placement '{rank}' in FEN.")
+        pieces.append(piece)
+    if len(pieces) != NO_RANKS_AND_FILES:
+        raise ValueError(f"Rank '{rank}' in FEN does not cover 8 tiles.")
+    return tuple(pieces)
+
+
 def is_edible(board: Board, position: tuple[int, int], friendly_color: str) -> bool:
     """Get if a position on the board is edible.
 
@@ -1,44 +1,136 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Sequence
 
 from utahchess import BLACK, WHITE
 from utahchess.board import Board
-from utahchess.legal_moves import get_move_per_algebraic_identifier, is_checkmate
-from utahchess.move import Move, make_move
+from utahchess.legal_moves import (
+    get_legal_moves,
+    get_move_per_algebraic_identifier,
+    get_moves_per_square,
+    is_checkmate,
+)
+from utahchess.move import (
+    REGULAR_MOVE,
+    Move,
+    get_captured_pieces,
+    make_move,
+    unmake_move,
+)
 from utahchess.move_validation import is_check
+from utahchess.piece import Pawn, Piece
+from utahchess.tile_movement_utils import is_in_bounds
+from utahchess.utils import (
+    file_to_x_index,
+    rank_to_y_index,
+    x_index_to_file,
+    y_index_to_rank,
+)
+from utahchess.zobrist import get_position_hash
 
 CHECKMATE = "checkmate"
 STALEMATE = "stalemate"
+THREEFOLD_REPETITION = "threefold repetition"
+FIFTY_MOVE_RULE = "fifty-move rule"
+DRAWS = (STALEMATE, THREEFOLD_REPETITION, FIFTY_MOVE_RULE)
+
+# Halfmoves without capture or pawn move after which the game is drawn
+FIFTY_MOVE_RULE_HALFMOVES = 100
 
 
 class ChessGame:
+    """A game of chess.
+
+    Only the current game state is kept in full. Every move made is recorded in the
+    history together with what is needed to take it back, so a long game does not
+    keep every previous board and its legal moves alive.
+
+    Attributes:
+        current_game_state: State of the game after the last move.
+        initial_game_state: State of the game before the first move.
+        history: All moves made so far, oldest first.
+    """
+
+    __slots__ = ("current_game_state", "initial_game_state", "history")
+
     current_game_state: GameState
-    previous_game_states: list[GameState] = []
+    initial_game_state: GameState
+    history: list[HistoryEntry]
+
+    def __init__(self) -> None:
+        self.history = []
 
     def new_game(self) -> None:
         """Initialize a new game of chess."""
         board = Board()
         current_player = WHITE
         turn = 1
-        legal_moves = get_move_per_algebraic_identifier(
-            board=board, current_player=current_player
-        )
+        self.history = []
         self.current_game_state = GameState(
             board=board,
             current_player=current_player,
             turn=turn,
-            legal_moves=legal_moves,
         )
+        self.initial_game_state = self.current_game_state
         return
 
+    @classmethod
+    def from_fen(cls, fen: str) -> ChessGame:
+        """Create a game of chess from a string in Forsyth-Edwards Notation (FEN).
+
+        The en passant square is translated into a synthetic last move, namely the
+        enemy pawn's double step across that square, so that en passant moves are
+        computed correctly for the first move of the game.
+
+        Args:
+            fen: FEN string, e.g.
+                "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1".
+
+        Returns: A game of chess with the position described by the FEN string.
+
+        Raises:
+            ValueError: If the FEN string is malformed.
+        """
+        fields = fen.split()
+        board = Board.from_fen(fen)
+        current_player = BLACK if len(fields) > 1 and fields[1] == "b" else WHITE
+        last_move = _get_last_move_from_en_passant_square(
+            board=board,
+            en_passant_square=fields[3] if len(fields) > 3 else "-",
+            current_player=current_player,
+        )
+        try:
+            halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        except ValueError:
+            raise ValueError(f"Invalid halfmove clock in FEN '{fen}'.")
+        try:
+            turn = int(fields[5]) if len(fields) > 5 else 1
+        except ValueError:
+            raise ValueError(f"Invalid fullmove number in FEN '{fen}'.")
+
+        game = cls()
+        game.current_game_state = GameState(
+            board=board,
+            current_player=current_player,
+            turn=turn,
+            last_move=last_move,
+            halfmove_clock=halfmove_clock,
+        )
+        game.initial_game_state = game.current_game_state
+        return game
+
+    def to_fen(self) -> str:
+        """Get the current game state in Forsyth-Edwards Notation (FEN)."""
+        return self.current_game_state.to_fen()
+
     def make_move(self, move_in_algebraic_notation: str) -> bool:
         """Try out move in algebraic notation on the current board.
 
         Current game state is replaced with the game state after the move, if it was
-        successful. The game state prior to the move is appended to the previous game
-        states. Legal moves on the board after the successful move are computed.
+        successful. The move is appended to the history. Legal moves on the board
+        after the move are computed when they are first needed.
 
         Args:
             move_in_algebraic_notation: Move which will be tried out.
@@ -51,62 +143,167 @@ class ChessGame:
             move_in_algebraic_notation=move_in_algebraic_notation,
         )
         if successful_move:
-            next_player = self.get_next_player()
-            self.previous_game_states.append(self.current_game_state)
-            self.current_game_state = GameState(
-                board=board_after_move,
-                last_move=last_move,
-                last_move_algebraic=move_in_algebraic_notation,
-                current_player=next_player,
-                turn=self._increment_turn(
-                    turn=self.current_game_state.turn,
-                    current_player=self.current_game_state.current_player,
-                ),
-                legal_moves=get_move_per_algebraic_identifier(
-                    board=board_after_move,
-                    current_player=next_player,
-                    last_move=last_move,
-                ),
+            self._push_move(
+                move=last_move,  # type: ignore
+                algebraic_identifier=move_in_algebraic_notation,
+                board_after_move=board_after_move,
             )
             return successful_move
         return False
 
+    def make_move_from_squares(
+        self, from_square: tuple[int, int], to_square: tuple[int, int]
+    ) -> bool:
+        """Try out the move of a piece between two squares on the current board.
+
+        The move is looked up in the legal moves of the current game state by its
+        squares, e.g. (4, 6) and (4, 4) for "e4", and made like by "make_move".
+
+        Args:
+            from_square: Square the moving piece moves from, for castling the king's.
+            to_square: Square the moving piece moves to.
+
+        Returns: True if the move was allowed, otherwise False.
+        """
+        moves_from_square = self.current_game_state.moves_per_square.get(
+            from_square, {}
+        )
+        if to_square not in moves_from_square:
+            return False
+        return self.make_move(
+            move_in_algebraic_notation=moves_from_square[to_square][0]
+        )
+
+    def replay_move(
+        self,
+        from_square: tuple[int, int],
+        to_square: tuple[int, int],
+        algebraic_identifier: str,
+    ) -> None:
+        """Make a move whose algebraic identifier is already known.
+
+        Unlike "make_move" this does not need the algebraic identifiers of all legal
+        moves, which makes it much faster to restore a game from its moves.
+
+        Args:
+            from_square: Square the moving piece moves from, for castling the king's.
+            to_square: Square the moving piece moves to.
+            algebraic_identifier: Algebraic identifier of the move.
+
+        Raises:
+            ValueError: If no legal move moves a piece between the squares.
+        """
+        for move in get_legal_moves(
+            board=self.current_game_state.board,
+            current_player=self.get_current_player(),
+            last_move=self.current_game_state.last_move,
+        ):
+            if move.piece_moves[0] == (from_square, to_square):
+                self._push_move(
+                    move=move,
+                    algebraic_identifier=algebraic_identifier,
+                    board_after_move=make_move(
+                        board=self.current_game_state.board, move=move
+                    ),
+                )
+                return
+        raise ValueError(
+            f"No legal move from {from_square} to {to_square} for "
+            f"'{algebraic_identifier}'."
+        )
+
     def get_next_player(self) -> str:
         return WHITE if self.get_current_player() == BLACK else BLACK
 
     def is_game_over(self) -> bool:
-        """Get whether game is either in checkmate or stalemate."""
-        return is_checkmate(
+        """Get whether game is in checkmate, stalemate or drawn by a rule."""
+        return self.get_game_over_type() is not None
+
+    def get_game_over_type(self) -> Optional[str]:
+        """Get why the game is over.
+
+        Returns: One of CHECKMATE, STALEMATE, THREEFOLD_REPETITION and
+            FIFTY_MOVE_RULE, or None if the game is not over.
+        """
+        if is_checkmate(
             board=self.current_game_state.board,
             current_player=self.get_current_player(),
             last_move=self.current_game_state.last_move,
-        ) or is_stalemate(
+        ):
+            return CHECKMATE
+        if is_stalemate(
             board=self.current_game_state.board,
             current_player=self.get_current_player(),
             legal_moves_for_current_player=tuple(
                 self.current_game_state.legal_moves.keys()
             ),
+        ):
+            return STALEMATE
+        if self.is_threefold_repetition():
+            return THREEFOLD_REPETITION
+        if self.current_game_state.halfmove_clock >= FIFTY_MOVE_RULE_HALFMOVES:
+            return FIFTY_MOVE_RULE
+        return None
+
+    def is_threefold_repetition(self) -> bool:
+        """Get whether the current position occurred at least three times."""
+        return (
+            self.get_reversible_position_hashes().count(
+                self.current_game_state.position_hash
+            )
+            >= 2
         )
 
-    def get_game_over_type(self) -> Optional[str]:
-        if self.is_game_over():
-            return (
-                CHECKMATE
-                if is_checkmate(
-                    board=self.current_game_state.board,
-                    current_player=self.get_current_player(),
-                    last_move=self.current_game_state.last_move,
-                )
-                else STALEMATE
+    def get_reversible_position_hashes(self) -> list[int]:
+        """Get the hashes of the positions that the current position could repeat.
+
+        Those are the positions since the last capture or pawn move, as no position
+        before such an irreversible move can occur again.
+
+        Returns: Zobrist hashes of the positions before the current one, oldest first.
+        """
+        position_hashes = []
+        history_index = len(self.history) - 1
+        for _ in range(self.current_game_state.halfmove_clock):
+            if history_index < 0:
+                break
+            history_index -= 1
+            position_hashes.append(
+                self.history[history_index].position_hash
+                if history_index >= 0
+                else self.initial_game_state.position_hash
             )
-        return None
+        return position_hashes[::-1]
 
     def undo_move(self) -> None:
-        """Revert game state back to previous game state."""
-        self.current_game_state = (
-            self.previous_game_states.pop()  # type: ignore
-            if self.previous_game_states
-            else None
+        """Revert game state back to previous game state.
+
+        The previous board is restored by unmaking the last move, its legal moves are
+        computed again when they are first needed. Nothing happens if no move was
+        made yet.
+        """
+        if not self.history:
+            return
+        last_entry = self.history.pop()
+        previous_entry = self.history[-1] if self.history else None
+        current_player = self.get_next_player()
+        self.current_game_state = GameState(
+            board=unmake_move(
+                board=self.current_game_state.board,
+                move=last_entry.move,
+                captured_pieces=last_entry.captured_pieces,
+            ),
+            current_player=current_player,
+            turn=self.current_game_state.turn - (1 if current_player == BLACK else 0),
+            last_move=(
+                self.initial_game_state.last_move
+                if previous_entry is None
+                else previous_entry.move
+            ),
+            last_move_algebraic=(
+                None if previous_entry is None else previous_entry.algebraic_identifier
+            ),
+            halfmove_clock=last_entry.previous_halfmove_clock,
         )
 
     def get_current_player(self) -> str:
@@ -124,15 +321,41 @@ class ChessGame:
         Castling moves are considered king moves and so the legal destination of a
         castling move will show up as a legal destination of the king, never the rook.
         """
-        return tuple(
-            legal_move.piece_moves[0][1]
-            for legal_move in self.current_game_state.legal_moves.values()
-            if legal_move.piece_moves[0][0] == position
-        )
+        return tuple(self.current_game_state.moves_per_square.get(position, {}))
 
     def __repr__(self) -> str:
         return self.current_game_state.__repr__()
 
+    def _push_move(
+        self, move: Move, algebraic_identifier: str, board_after_move: Board
+    ) -> None:
+        captured_pieces = get_captured_pieces(
+            board=self.current_game_state.board, move=move
+        )
+        previous_halfmove_clock = self.current_game_state.halfmove_clock
+        self.current_game_state = GameState(
+            board=board_after_move,
+            last_move=move,
+            last_move_algebraic=algebraic_identifier,
+            current_player=self.get_next_player(),
+            turn=self._increment_turn(
+                turn=self.current_game_state.turn,
+                current_player=self.current_game_state.current_player,
+            ),
+            halfmove_clock=(
+                0 if is_irreversible_move(move=move) else previous_halfmove_clock + 1
+            ),
+        )
+        self.history.append(
+            HistoryEntry(
+                move=move,
+                algebraic_identifier=algebraic_identifier,
+                captured_pieces=captured_pieces,
+                position_hash=self.current_game_state.position_hash,
+                previous_halfmove_clock=previous_halfmove_clock,
+            )
+        )
+
     def _increment_turn(self, turn: int, current_player: str) -> int:
         if current_player == BLACK:
             return turn + 1
@@ -140,16 +363,96 @@ class ChessGame:
             return turn
 
 
+@dataclass(frozen=True)
+class HistoryEntry:
+    """A move made in a game of chess and what is needed to take it back.
+
+    Attributes:
+        move: The move.
+        algebraic_identifier: Algebraic identifier the move was made with.
+        captured_pieces: Pieces the move captured, to put them back on undo.
+        position_hash: Zobrist hash of the position after the move.
+        previous_halfmove_clock: Halfmove clock before the move.
+    """
+
+    __slots__ = (
+        "move",
+        "algebraic_identifier",
+        "captured_pieces",
+        "position_hash",
+        "previous_halfmove_clock",
+    )
+
+    move: Move
+    algebraic_identifier: str
+    captured_pieces: tuple[Piece, ...]
+    position_hash: int
+    previous_halfmove_clock: int
+
+
 @dataclass(frozen=True)
 class GameState:
-    """Game state within the context of a chess game."""
+    """Game state within the context of a chess game.
+
+    Legal moves and the position hash are computed when they are first needed and
+    kept from then on.
+    """
 
     board: Board
     current_player: str
     turn: int
-    legal_moves: dict[str, Move]
     last_move: Optional[Move] = None
     last_move_algebraic: Optional[str] = None
+    halfmove_clock: int = 0
+
+    @property
+    def legal_moves(self) -> dict[str, Move]:
+        """Get a map from algebraic identifiers to legal moves."""
+        return self._legal_moves_and_moves_per_square[0]
+
+    @property
+    def moves_per_square(
+        self,
+    ) -> dict[tuple[int, int], dict[tuple[int, int], tuple[str, Move]]]:
+        """Get the legal moves indexed by squares.
+
+        Returns: A map from the square the moving piece moves from, to the square it
+            moves to, to the algebraic identifier and the move.
+        """
+        return self._legal_moves_and_moves_per_square[1]
+
+    @cached_property
+    def position_hash(self) -> int:
+        return get_position_hash(
+            board=self.board,
+            current_player=self.current_player,
+            last_move=self.last_move,
+        )
+
+    @cached_property
+    def _legal_moves_and_moves_per_square(
+        self,
+    ) -> tuple[
+        dict[str, Move],
+        dict[tuple[int, int], dict[tuple[int, int], tuple[str, Move]]],
+    ]:
+        legal_moves = get_move_per_algebraic_identifier(
+            board=self.board,
+            current_player=self.current_player,
+            last_move=self.last_move,
+        )
+        return legal_moves, get_moves_per_square(
+            move_per_algebraic_identifier=legal_moves
+        )
+
+    def to_fen(self) -> str:
+        """Get the game state in Forsyth-Edwards Notation (FEN)."""
+        return self.board.to_fen(
+            current_player=self.current_player,
+            en_passant_square=_get_en_passant_square(last_move=self.last_move),
+            halfmove_clock=self.halfmove_clock,
+            fullmove_number=self.turn,
+        )
 
     def __repr__(self) -> str:
         return (
@@ -187,6 +490,53 @@ def _try_move(
         return board, False, None
 
 
+def _get_last_move_from_en_passant_square(
+    board: Board, en_passant_square: str, current_player: str
+) -> Optional[Move]:
+    """Get a synthetic double step of the enemy pawn across the en passant square."""
+    if en_passant_square == "-":
+        return None
+    try:
+        x = file_to_x_index(file=en_passant_square[0])
+        y = rank_to_y_index(rank=en_passant_square[1])
+    except (IndexError, ValueError):
+        raise ValueError(f"Invalid en passant square '{en_passant_square}'.")
+    enemy_player = WHITE if current_player == BLACK else BLACK
+    movement_direction = -1 if enemy_player == WHITE else 1
+    from_position = (x, y - movement_direction)
+    to_position = (x, y + movement_direction)
+    pawn = board[to_position] if is_in_bounds(position=to_position) else None
+    if pawn is None or pawn.piece_type != "Pawn" or pawn.color != enemy_player:
+        raise ValueError(
+            f"En passant square '{en_passant_square}' is not behind an enemy pawn."
+        )
+    return Move(
+        type=REGULAR_MOVE,
+        piece_moves=((from_position, to_position),),
+        moving_pieces=(
+            Pawn(position=from_position, color=enemy_player, is_in_start_position=True),
+        ),
+        is_capturing_move=False,
+        allows_en_passant=True,
+    )
+
+
+def _get_en_passant_square(last_move: Optional[Move]) -> str:
+    """Get the FEN en passant square a last move allows, or "-" if there is none."""
+    if last_move is None or not last_move.allows_en_passant:
+        return "-"
+    (x, y_from), (_, y_to) = last_move.piece_moves[0]
+    return f"{x_index_to_file(x=x)}{y_index_to_rank(y=(y_from + y_to) // 2)}"
+
+
+def is_irreversible_move(move: Move) -> bool:
+    """Get whether a move resets the halfmove clock, i.e. captures or moves a pawn.
+
+    No position before such a move can occur again.
+    """
+    return move.is_capturing_move or move.moving_pieces[0].piece_type == "Pawn"
+
+
 def is_stalemate(
     board: Board,
     current_player: str,
@@ -0,0 +1,174 @@
+"""Many games of chess in one process, e.g. for a server.
+
+Games are stored by ID and can be saved to and restored from compact snapshots:
+
+    manager = GameManager()
+    game_id = manager.new_game()
+    manager.get_game(game_id).make_move(move_in_algebraic_notation="e4")
+    snapshot = manager.snapshot(game_id)
+    restored_game_id = manager.restore(snapshot)
+"""
+from __future__ import annotations
+
+import struct
+import uuid
+from typing import Iterator, Optional
+
+from utahchess.chess import ChessGame
+from utahchess.pgn import INITIAL_FEN
+
+SNAPSHOT_MAGIC = b"UTAHGAM1"
+# Length of the initial FEN and number of moves
+SNAPSHOT_HEADER = struct.Struct("<HI")
+# Squares the moving piece moves from and to and length of the algebraic identifier
+SNAPSHOT_MOVE = struct.Struct("<BBB")
+
+
+class GameManager:
+    """Games of chess stored by ID."""
+
+    def __init__(self) -> None:
+        self._games: dict[str, ChessGame] = {}
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._games
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._games)
+
+    def new_game(self, fen: Optional[str] = None) -> str:
+        """Start a new game.
+
+        Args:
+            fen: Position to start from in Forsyth-Edwards Notation (FEN). The
+                initial position if None.
+
+        Returns: ID of the new game.
+        """
+        return self.add_game(game=ChessGame.from_fen(fen or INITIAL_FEN))
+
+    def add_game(self, game: ChessGame, game_id: Optional[str] = None) -> str:
+        """Store a game, replacing any game with the same ID.
+
+        Args:
+            game: Game to store.
+            game_id: ID to store the game by. A new unique ID if None.
+
+        Returns: ID of the game.
+        """
+        game_id = uuid.uuid4().hex if game_id is None else game_id
+        self._games[game_id] = game
+        return game_id
+
+    def get_game(self, game_id: str) -> ChessGame:
+        """Get a game by ID.
+
+        Raises:
+            KeyError: If there is no game with that ID.
+        """
+        return self._games[game_id]
+
+    def remove_game(self, game_id: str) -> ChessGame:
+        """Remove a game and return it.
+
+        Raises:
+            KeyError: If there is no game with that ID.
+        """
+        return self._games.pop(game_id)
+
+    def snapshot(self, game_id: str) -> bytes:
+        """Get a snapshot of a game, see "snapshot_game".
+
+        Raises:
+            KeyError: If there is no game with that ID.
+        """
+        return snapshot_game(game=self._games[game_id])
+
+    def restore(self, snapshot: bytes, game_id: Optional[str] = None) -> str:
+        """Restore a game from a snapshot and store it.
+
+        Args:
+            snapshot: Snapshot as returned by "snapshot".
+            game_id: ID to store the game by. A new unique ID if None.
+
+        Returns: ID of the restored game.
+
+        Raises:
+            ValueError: If the snapshot is invalid.
+        """
+        return self.add_game(game=restore_game(snapshot=snapshot), game_id=game_id)
+
+
+def snapshot_game(game: ChessGame) -> bytes:
+    """Save a game to bytes.
+
+    A snapshot holds the initial position as FEN and, per move, the squares the
+    moving piece moves from and to and its algebraic identifier. That is about
+    five bytes per move.
+
+    Args:
+        game: Game to save.
+
+    Returns: The snapshot.
+    """
+    fen = game.initial_game_state.to_fen().encode()
+    parts = [
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_HEADER.pack(len(fen), len(game.history)),
+        fen,
+    ]
+    for history_entry in game.history:
+        (from_x, from_y), (to_x, to_y) = history_entry.move.piece_moves[0]
+        algebraic_identifier = history_entry.algebraic_identifier.encode()
+        parts.append(
+            SNAPSHOT_MOVE.pack(
+                from_x * 8 + from_y, to_x * 8 + to_y, len(algebraic_identifier)
+            )
+        )
+        parts.append(algebraic_identifier)
+    return b"".join(parts)
+
+
+def restore_game(snapshot: bytes) -> ChessGame:
+    """Restore a game from bytes as returned by "snapshot_game".
+
+    The moves are replayed without computing the algebraic identifiers of all legal
+    moves, so restoring is much faster than replaying the game move by move.
+
+    Args:
+        snapshot: Snapshot of the game.
+
+    Returns: The restored game.
+
+    Raises:
+        ValueError: If the snapshot is invalid or contains an illegal move.
+    """
+    if not snapshot.startswith(SNAPSHOT_MAGIC):
+        raise ValueError("Not a snapshot of a game of chess.")
+    offset = len(SNAPSHOT_MAGIC)
+    try:
+        fen_length, number_of_moves = SNAPSHOT_HEADER.unpack_from(snapshot, offset)
+        offset += SNAPSHOT_HEADER.size
+        game = ChessGame.from_fen(snapshot[offset : offset + fen_length].decode())
+        offset += fen_length
+        for _ in range(number_of_moves):
+            from_square, to_square, identifier_length = SNAPSHOT_MOVE.unpack_from(
+                snapshot, offset
+            )
+            offset += SNAPSHOT_MOVE.size
+            game.replay_move(
+                from_square=divmod(from_square, 8),
+                to_square=divmod(to_square, 8),
+                algebraic_identifier=snapshot[
+                    offset : offset + identifier_length
+                ].decode(),
+            )
+            offset += identifier_length
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ValueError(f"Snapshot of a game of chess is truncated: {error}")
+    if offset != len(snapshot):
+        raise ValueError("Snapshot of a game of chess has trailing bytes.")
+    return game
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import Generator, Optional
+from typing import Generator, Iterable, Optional
 
 from utahchess import BLACK, WHITE
 from utahchess.algebraic_notation import get_algebraic_identifer
 from utahchess.board import Board
 from utahchess.castling import get_castling_moves
 from utahchess.en_passant import get_en_passant_moves
-from utahchess.move import Move, make_move
-from utahchess.move_validation import is_check
-from utahchess.regular_move import get_regular_moves
+from utahchess.move import EN_PASSANT_MOVE, REGULAR_MOVE, Move, make_move
+from utahchess.move_candidates import get_move_candidates
+from utahchess.move_validation import is_check, is_valid_move
+from utahchess.regular_move import create_regular_move, get_regular_moves
 from utahchess.utils import x_index_to_file, y_index_to_rank
 
 
 def get_move_per_algebraic_identifier(
-    board: Board, current_player: str, last_move: Optional[Move] = None
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move] = None,
+    legal_moves: Optional[Iterable[Move]] = None,
 ) -> dict[str, Move]:
     """Get a map of algebraic identifiers to moves for current player.
 
@@ -23,11 +27,16 @@ def get_move_per_algebraic_identifier(
         board: Board on which to compute all legal moves.
         current_player: Player for which to get all legal moves.
         last_move: Last move that was executed on the board.
+        legal_moves: Legal moves on the board as returned by "get_legal_moves", if
+            they were already computed.
 
     Returns: A map from algebraic identifiers to each legal move possible on the board.
     """
     ambiguous_mapping = _get_ambiguous_algebraic_notation_mapping(
-        board=board, current_player=current_player, last_move=last_move
+        board=board,
+        current_player=current_player,
+        last_move=last_move,
+        legal_moves=legal_moves,
     )
     mapping: dict[str, Move] = {}
     for algebraic_identifer, moves in ambiguous_mapping.items():
@@ -42,6 +51,112 @@ def get_move_per_algebraic_identifier(
     return mapping
 
 
+def get_algebraic_identifier(
+    board: Board, move: Move, current_player: str, last_move: Optional[Move] = None
+) -> str:
+    """Get the unambiguous algebraic identifier of a single legal move.
+
+    The identifier is the same as in "get_move_per_algebraic_identifier", but only
+    the moves of other pieces of the same type to the same tile are generated to
+    disambiguate it. That is much cheaper if only some moves need an identifier.
+
+    Args:
+        board: Board on which the move is made.
+        move: Legal move to get the identifier of.
+        current_player: Player making the move.
+        last_move: Last move that was executed on the board.
+
+    Returns: The algebraic identifier of the move.
+    """
+    ambiguous_identifier = get_algebraic_identifer(
+        move=move,
+        board=board,
+        check_or_checkmate=_get_check_or_checkmate_identifier(
+            board=board, move=move, current_player=current_player
+        ),
+    )
+    moves_with_same_identifier = [move] + [
+        other_move
+        for other_move in _get_moves_to_same_tile(
+            board=board, move=move, last_move=last_move
+        )
+        if get_algebraic_identifer(
+            move=other_move,
+            board=board,
+            check_or_checkmate=_get_check_or_checkmate_identifier(
+                board=board, move=other_move, current_player=current_player
+            ),
+        )
+        == ambiguous_identifier
+    ]
+    for algebraic_identifier, disambiguated_move in _disambiguate_moves(
+        board=board,
+        ambiguous_identifier=ambiguous_identifier,
+        moves_to_disambiguate=moves_with_same_identifier,
+    ).items():
+        if disambiguated_move == move:
+            return algebraic_identifier
+    raise Exception(f"Move {move} could not be disambiguated.")
+
+
+def is_legal_move(
+    board: Board, move: Move, current_player: str, last_move: Optional[Move] = None
+) -> bool:
+    """Get whether a move is legal without generating all legal moves.
+
+    Useful for moves found on other boards, e.g. moves remembered by a search.
+
+    Args:
+        board: Board on which the move would be made.
+        move: Move to check.
+        current_player: Player to move.
+        last_move: Last move that was executed on the board.
+
+    Returns: Flag indicating whether the move is legal on the board.
+    """
+    if move.type == EN_PASSANT_MOVE:
+        return move in get_en_passant_moves(board=board, last_move=last_move)
+    if move.type != REGULAR_MOVE:
+        return move in get_castling_moves(board=board, current_player=current_player)
+    from_position, to_position = move.piece_moves[0]
+    piece = board[from_position]
+    return (
+        piece is not None
+        and piece.color == current_player
+        and move.piece_moves[0]
+        in get_move_candidates(board=board, position=from_position)
+        and move == create_regular_move(board=board, move_candidate=move.piece_moves[0])
+        and is_valid_move(board=board, move=move)
+    )
+
+
+def get_moves_per_square(
+    move_per_algebraic_identifier: dict[str, Move]
+) -> dict[tuple[int, int], dict[tuple[int, int], tuple[str, Move]]]:
+    """Index legal moves by the squares the moving piece moves from and to.
+
+    Castling moves are indexed by the king's move, so they are found like any other
+    king move.
+
+    Args:
+        move_per_algebraic_identifier: Legal moves as returned by
+            "get_move_per_algebraic_identifier".
+
+    Returns: A map from the square a piece moves from, to the square it moves to, to
+        the algebraic identifier and the move.
+    """
+    moves_per_square: dict[
+        tuple[int, int], dict[tuple[int, int], tuple[str, Move]]
+    ] = {}
+    for algebraic_identifier, move in move_per_algebraic_identifier.items():
+        from_square, to_square = move.piece_moves[0]
+        moves_per_square.setdefault(from_square, {})[to_square] = (
+            algebraic_identifier,
+            move,
+        )
+    return moves_per_square
+
+
 def is_checkmate(board: Board, current_player: str, last_move: Optional[Move]) -> bool:
     """Check if current player is in checkmate.
 
@@ -54,7 +169,7 @@ def is_checkmate(board: Board, current_player: str, last_move: Optional[Move]) -
     """
 
     def all_possible_boards():
-        for potential_move in _get_all_legal_moves(
+        for potential_move in get_legal_moves(
             board=board, current_player=current_player, last_move=last_move
         ):
             yield make_move(board=board, move=potential_move)
@@ -65,9 +180,18 @@ def is_checkmate(board: Board, current_player: str, last_move: Optional[Move]) -
     return is_check(board=board, current_player=current_player)
 
 
-def _get_all_legal_moves(
-    board: Board, current_player: str, last_move: Optional[Move]
+def get_legal_moves(
+    board: Board, current_player: str, last_move: Optional[Move] = None
 ) -> Generator[Move, None, None]:
+    """Get all legal moves for current player without computing their identifiers.
+
+    Args:
+        board: Board on which to compute all legal moves.
+        current_player: Player for which to get all legal moves.
+        last_move: Last move that was executed on the board.
+
+    Returns: All legal moves on the board for current player.
+    """
     regular_moves = get_regular_moves(board=board, current_player=current_player)
     castling_moves = get_castling_moves(board=board, current_player=current_player)
     en_passant_moves = get_en_passant_moves(board=board, last_move=last_move)
@@ -75,17 +199,22 @@ def _get_all_legal_moves(
 
 
 def _get_ambiguous_algebraic_notation_mapping(
-    board: Board, current_player: str, last_move: Optional[Move]
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move],
+    legal_moves: Optional[Iterable[Move]] = None,
 ) -> dict[str, list[Move]]:
     """Get a map of algebraic identifiers to lists of moves.
 
     All moves with the same algebraic identifier (without rank or file) are mapped to
     the same key in the mapping.
     """
+    if legal_moves is None:
+        legal_moves = get_legal_moves(
+            board=board, current_player=current_player, last_move=last_move
+        )
     mapping: dict[str, list[Move]] = {}
-    for legal_move in _get_all_legal_moves(
-        board=board, current_player=current_player, last_move=last_move
-    ):
+    for legal_move in legal_moves:
         ambiguous_identifer = get_algebraic_identifer(
             move=legal_move,
             board=board,
@@ -143,6 +272,35 @@ def _disambiguate_moves(
     )
 
 
+def _get_moves_to_same_tile(
+    board: Board, move: Move, last_move: Optional[Move]
+) -> Generator[Move, None, None]:
+    """Get the other legal moves of the same kind and piece type to the same tile."""
+    if move.type == EN_PASSANT_MOVE:
+        for en_passant_move in get_en_passant_moves(board=board, last_move=last_move):
+            if en_passant_move != move:
+                yield en_passant_move
+        return
+    if move.type != REGULAR_MOVE:
+        return
+    (from_position, to_position), moving_piece = (
+        move.piece_moves[0],
+        move.moving_pieces[0],
+    )
+    for piece in board.all_pieces():
+        if (
+            piece.position == from_position
+            or piece.color != moving_piece.color
+            or piece.piece_type != moving_piece.piece_type
+        ):
+            continue
+        move_candidate = (piece.position, to_position)
+        if move_candidate in get_move_candidates(board=board, position=piece.position):
+            other_move = create_regular_move(board=board, move_candidate=move_candidate)
+            if is_valid_move(board=board, move=other_move):
+                yield other_move
+
+
 def _get_moving_piece_file(move: Move) -> str:
     x_from, y_from = move.piece_moves[0][0]
     return x_index_to_file(x=x_from)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+import time
 from itertools import product
 from typing import Any, Callable, Generator, Iterable, Optional
 
 from utahchess import BLACK, WHITE
 from utahchess.board import Board
-from utahchess.legal_moves import get_move_per_algebraic_identifier, is_checkmate
+from utahchess.legal_moves import (
+    get_algebraic_identifier,
+    get_legal_moves,
+    is_checkmate,
+)
 from utahchess.move import Move, make_move
+from utahchess.move_validation import gives_check, is_check
+from utahchess.search_stats import SearchStats
+from utahchess.static_exchange import see
+from utahchess.transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
 
 PAWN_VALUE = 1
 BISHOP_VALUE = 3
@@ -15,6 +28,7 @@ KNIGHT_VALUE = 3
 ROOK_VALUE = 5
 QUEEN_VALUE = 9
 CHECKMATE_VALUE = float("inf")
+DRAW_VALUE = 0.0
 
 CENTER_OF_BOARD_POSITIONS = tuple(product((2, 3, 4, 5), (2, 3, 4, 5)))
 CENTER_OF_BOARD_VALUE = 0.25
@@ -25,6 +39,10 @@ EDGE_POSITIONS = tuple(product((0, 1, 6, 7), (0, 1, 6, 7))) + tuple(
 EDGE_VALUE = -0.25
 
 
+class SearchAborted(Exception):
+    """Raised by "minimax" when its "should_stop" callback returns True."""
+
+
 class Node:
     def __init__(self, parent: Optional[Node], name: str, **kwargs):
         self.parent = parent
@@ -39,6 +57,67 @@ class Node:
         return getattr(self, attribute_name)
 
 
+class ChildNode(Node):
+    """Node of the board after a move on the board of its parent node.
+
+    Only the parent node and the move are stored when the node is created. The board
+    is made on first access and the name, i.e. the algebraic identifier of the move,
+    is only computed when it is requested, e.g. for the node returned by a search.
+    Computing it includes a checkmate test, which is far more expensive than the
+    move itself.
+
+    Args:
+        parent: Node of the board the move is made on.
+        last_move: Legal move on the board of the parent node.
+        stats: Statistics to add the time spent on the board and the name to.
+    """
+
+    parent: Node
+
+    def __init__(
+        self,
+        parent: Node,
+        last_move: Move,
+        stats: Optional[SearchStats] = None,
+        **kwargs,
+    ):
+        self.parent = parent
+        self.last_move = last_move
+        self.player = _get_enemy_color(friendly_color=parent.player)
+        self.stats = stats
+        self._board: Optional[Board] = None
+        self._name: Optional[str] = None
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @property
+    def board(self) -> Board:
+        if self._board is None:
+            start = time.perf_counter()
+            self._board = make_move(board=self.parent.board, move=self.last_move)
+            if self.stats is not None:
+                self.stats.move_generation_seconds += time.perf_counter() - start
+        return self._board
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            start = time.perf_counter()
+            self._name = get_algebraic_identifier(
+                board=self.parent.board,
+                move=self.last_move,
+                current_player=self.parent.player,
+                last_move=self.parent.last_move,
+            )
+            if self.stats is not None:
+                self.stats.san_seconds += time.perf_counter() - start
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+
 def minimax(
     parent_node: Node,
     value_function: Callable[..., float],
@@ -48,7 +127,10 @@ def minimax(
     alpha: float,
     beta: float,
     prune: bool = True,
-) -> tuple[Node, float]:
+    stats: Optional[SearchStats] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    table: Optional[TranspositionTable] = None,
+) -> tuple[Optional[Node], float]:
     """Get the optimal course of action for a given parent and value function.
 
     General purpose implementation of the minimax algorithm with alpha-beta pruning.
@@ -58,7 +140,8 @@ def minimax(
 
     Args:
         parent_node: Initial node.
-        value_function: Function to evaluate the value of a node.
+        value_function: Function to evaluate the value of a node. It is called for
+            nodes at the maximum depth and for nodes without children.
         get_children: Function which creates all children for a node.
         depth: How deep to look for optimal course of action for.
         maximizing_player: If the algorithm is trying to maximize or minimize the
@@ -66,17 +149,87 @@ def minimax(
         alpha: Alpha parameter for alpha-beta pruning.
         beta: Beta parameter for alpha-beta pruning.
         prune: Whether to use alpha-beta pruning or not.
+        stats: Statistics to fill in during the search. Nothing is recorded if None.
+        should_stop: Function called before visiting a node. The search is aborted
+            as soon as it returns True.
+        table: Transposition table to store the result and best child's move of
+            every expanded node in, e.g. to search that move first later on. Nodes
+            need a "position_hash" attribute then. Values are stored to the player
+            to move, i.e. negated for nodes of the minimizing player.
 
     Returns: The optimal course of action, i.e. the child which should be considered
-        and the associated optimal node value.
+        and the associated optimal node value. The child is None if the initial node
+        has no children.
+
+    Raises:
+        SearchAborted: If the search was aborted by "should_stop".
     """
+    if stats is None:
+        return _minimax(
+            parent_node=parent_node,
+            value_function=value_function,
+            get_children=get_children,
+            depth=depth,
+            maximizing_player=maximizing_player,
+            alpha=alpha,
+            beta=beta,
+            prune=prune,
+            stats=None,
+            should_stop=should_stop,
+            table=table,
+            ply=0,
+        )
+    start = time.perf_counter()
+    try:
+        return _minimax(
+            parent_node=parent_node,
+            value_function=value_function,
+            get_children=get_children,
+            depth=depth,
+            maximizing_player=maximizing_player,
+            alpha=alpha,
+            beta=beta,
+            prune=prune,
+            stats=stats,
+            should_stop=should_stop,
+            table=table,
+            ply=0,
+        )
+    finally:
+        stats.elapsed_seconds += time.perf_counter() - start
+
+
+def _minimax(
+    parent_node: Node,
+    value_function: Callable[..., float],
+    get_children: Callable[..., Iterable[Node]],
+    depth: int,
+    maximizing_player: bool,
+    alpha: float,
+    beta: float,
+    prune: bool,
+    stats: Optional[SearchStats],
+    should_stop: Optional[Callable[[], bool]],
+    table: Optional[TranspositionTable],
+    ply: int,
+) -> tuple[Optional[Node], float]:
+    """See "minimax", "ply" is the distance of the parent node from the root."""
+    if should_stop is not None and should_stop():
+        raise SearchAborted()
+    if stats is not None:
+        stats.record_node(ply=ply)
     if depth == 0:
-        return parent_node, value_function(node=parent_node)
+        return parent_node, evaluate_node(
+            node=parent_node, value_function=value_function, stats=stats
+        )
 
+    if stats is not None:
+        stats.expanded_nodes += 1
+    original_alpha, original_beta = alpha, beta
     best_move: Any = None
     best_value = -float("inf") if maximizing_player else +float("inf")
-    for child_node in get_children(parent_node=parent_node):
-        _, eval = minimax(
+    for child_index, child_node in enumerate(get_children(parent_node=parent_node)):
+        _, eval = _minimax(
             parent_node=child_node,
             value_function=value_function,
             get_children=get_children,
@@ -85,64 +238,139 @@ def minimax(
             alpha=alpha,
             beta=beta,
             prune=prune,
+            stats=stats,
+            should_stop=should_stop,
+            table=table,
+            ply=ply + 1,
         )
         if maximizing_player:
-            if eval > best_value:
+            if eval > best_value or best_move is None:
                 best_value = eval
                 best_move = child_node
             alpha = max(alpha, best_value)
         else:
-            if eval < best_value:
+            if eval < best_value or best_move is None:
                 best_value = eval
                 best_move = child_node
             beta = min(beta, best_value)
         if alpha >= beta:
             if prune:
+                if stats is not None:
+                    stats.record_cutoff(move_index=child_index)
                 break
+    if best_move is None:
+        # No children, e.g. checkmate, stalemate or a draw by repetition
+        return best_move, evaluate_node(
+            node=parent_node, value_function=value_function, stats=stats
+        )
+    if table is not None:
+        _store_result(
+            table=table,
+            node=parent_node,
+            best_child=best_move,
+            value=best_value,
+            depth=depth,
+            maximizing_player=maximizing_player,
+            alpha=original_alpha,
+            beta=original_beta,
+        )
     return best_move, best_value
 
 
+def _store_result(
+    table: TranspositionTable,
+    node: Node,
+    best_child: Node,
+    value: float,
+    depth: int,
+    maximizing_player: bool,
+    alpha: float,
+    beta: float,
+) -> None:
+    """Store the result of an expanded node to the player to move at the node.
+
+    A value at or below alpha is an upper bound and one at or above beta a lower
+    bound of the true value, whichever player the node belongs to.
+    """
+    if value <= alpha:
+        bound = UPPER_BOUND
+    elif value >= beta:
+        bound = LOWER_BOUND
+    else:
+        bound = EXACT
+    if not maximizing_player:
+        value = -value
+        bound = {UPPER_BOUND: LOWER_BOUND, LOWER_BOUND: UPPER_BOUND}.get(bound, bound)
+    table.store(
+        position_hash=node.position_hash,
+        depth=depth,
+        value=value,
+        bound=bound,
+        best_move=best_child.last_move,
+    )
+
+
+def evaluate_node(
+    node: Node, value_function: Callable[..., float], stats: Optional[SearchStats]
+) -> float:
+    """Evaluate a node, adding the time and the call to "stats" if given."""
+    if stats is None:
+        return value_function(node=node)
+    start = time.perf_counter()
+    value = value_function(node=node)
+    stats.evaluation_seconds += time.perf_counter() - start
+    stats.evaluation_calls += 1
+    return value
+
+
 def create_children_from_parent(
-    parent_node: Node, ordered: bool = True
+    parent_node: Node, ordered: bool = True, stats: Optional[SearchStats] = None
 ) -> Generator[Node, None, None]:
     """Create all possible child boards for a given parent board.
 
+    The children are "ChildNode"s, so their boards and names are only computed once
+    they are accessed. Children that are pruned before they are searched cost little
+    more than their move.
+
     Args:
         parent_node: Parent node containing its board, the last move that was executed
             on that board and the current player.
         ordered: Whether or not to order the children by their potential. Generally
             when alpha-beta pruning it is better to look at nodes that are potentially
             high value first to decrease computation time.
+        stats: Statistics to add the time spent on move generation and algebraic
+            identifiers to. Nothing is recorded if None.
 
     Returns: All possible boards for the given parent board, potentially ordered by
         their individual potential.
     """
-    parent_board = parent_node.board
-    parent_last_move = parent_node.last_move
-    parent_player = parent_node.player
-    move_per_algebraic_identifier = get_move_per_algebraic_identifier(
-        board=parent_board,
-        current_player=parent_player,
-        last_move=parent_last_move,
+    start = time.perf_counter()
+    legal_moves: Iterable[Move] = get_legal_moves(
+        board=parent_node.board,
+        current_player=parent_node.player,
+        last_move=parent_node.last_move,
     )
-    return (
-        Node(
-            parent=parent_node,
-            name=algebraic_identifier,
-            board=make_move(board=parent_board, move=legal_move),
-            last_move=legal_move,
-            player=_get_enemy_color(friendly_color=parent_player),
+    if ordered:
+        legal_moves = _order_moves_by_potential(
+            moves=legal_moves,
+            board=parent_node.board,
+            current_player=parent_node.player,
         )
-        for algebraic_identifier, legal_move in (
-            _order_moves_by_potential(moves_mapping=move_per_algebraic_identifier)
-            if ordered
-            else move_per_algebraic_identifier
-        ).items()
+    elif stats is not None:
+        legal_moves = tuple(legal_moves)
+    if stats is not None:
+        stats.move_generation_seconds += time.perf_counter() - start
+    return (
+        ChildNode(parent=parent_node, last_move=legal_move, stats=stats)
+        for legal_move in legal_moves
     )
 
 
 def get_board_value(
-    board: Board, player_that_just_made_the_move: str, last_move: Optional[Move]
+    board: Board,
+    player_that_just_made_the_move: str,
+    last_move: Optional[Move],
+    current_player: Optional[str] = None,
 ) -> float:
     """Get ad-hoc evaluation of a board.
 
@@ -154,19 +382,24 @@ def get_board_value(
         board: Board to evaluate.
         player_that_just_made_the_move: Player that made the move to arrive at the
             current board configuration.
+        last_move: Last move that was executed on the board.
+        current_player: Player to move, if known. If they have no legal moves and are
+            not in check, the board is a stalemate and valued "DRAW_VALUE".
 
     Returns: The value of the board to the player that just made the move.
     """
-    if is_checkmate(
-        board=board,
-        current_player=_get_enemy_color(friendly_color=player_that_just_made_the_move),
-        last_move=last_move,
-    ):
-        return +CHECKMATE_VALUE
-    elif is_checkmate(
-        board=board, current_player=player_that_just_made_the_move, last_move=last_move
+    # Whether a player has a legal move is needed for checkmate anyway, so testing
+    # for stalemate only adds a test for check once there is none
+    for player, checkmate_value in (
+        (_get_enemy_color(friendly_color=player_that_just_made_the_move), +1),
+        (player_that_just_made_the_move, -1),
     ):
-        return -CHECKMATE_VALUE
+        if _has_legal_move(board=board, current_player=player, last_move=last_move):
+            continue
+        if is_check(board=board, current_player=player):
+            return checkmate_value * CHECKMATE_VALUE
+        if player == current_player:
+            return DRAW_VALUE
 
     value: float = 0.0
     for piece in board.all_pieces():
@@ -188,37 +421,142 @@ def get_board_value(
     return value
 
 
-def get_node_value(node: Node):
-    """Get ad-hoc evaluation of a given node containing a chess board."""
+def get_node_value(node: Node, player: Optional[str] = None):
+    """Get ad-hoc evaluation of a given node containing a chess board.
+
+    The node is evaluated from the perspective of the player that just made the move,
+    unless a player is given. Pass the player to move at the root node to get values
+    that can be maximized at every depth.
+    """
     return get_board_value(
         board=node.board,
-        player_that_just_made_the_move=_get_enemy_color(friendly_color=node.player),
+        player_that_just_made_the_move=(
+            _get_enemy_color(friendly_color=node.player) if player is None else player
+        ),
         last_move=node.last_move,
+        current_player=node.player,
     )
 
 
-def _order_moves_by_potential(moves_mapping: dict[str, Move]) -> OrderedDict[str, Move]:
-    """Get ad-hoc ordering of moves mapping to process high-potential moves first."""
+def get_quiescence_value(node: Node, player: Optional[str] = None) -> float:
+    """Get evaluation of a given node after resolving pending captures.
+
+    A node at the maximum depth is misjudged if a capture is pending, e.g. if its
+    last move captured a defended pawn with a queen. Instead of evaluating the board
+    right away, captures are searched until no capture is left that does not lose
+    material by its static exchange evaluation. Captures that lose material are
+    pruned. The player to move may always decline to capture.
+
+    The node is evaluated from the perspective of the player that just made the move,
+    unless a player is given, see "get_node_value".
+    """
+    value = _quiescence(
+        board=node.board,
+        current_player=node.player,
+        last_move=node.last_move,
+        alpha=-float("inf"),
+        beta=float("inf"),
+    )
+    return value if player == node.player else -value
+
+
+def _quiescence(
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move],
+    alpha: float,
+    beta: float,
+) -> float:
+    """Get the value of a board to the player to move after resolving captures."""
+    # The value to a player is the negated value to their enemy
+    best_value = get_board_value(
+        board=board,
+        player_that_just_made_the_move=current_player,
+        last_move=last_move,
+        current_player=current_player,
+    )
+    if best_value >= beta or abs(best_value) == CHECKMATE_VALUE:
+        return best_value
+    alpha = max(alpha, best_value)
+    captures = sorted(
+        (
+            (see(board=board, move=move), move)
+            for move in get_legal_moves(
+                board=board, current_player=current_player, last_move=last_move
+            )
+            if move.is_capturing_move
+        ),
+        key=lambda capture: capture[0],
+        reverse=True,
+    )
+    for exchange_value, move in captures:
+        if exchange_value < 0:
+            break  # All remaining captures lose material
+        value = -_quiescence(
+            board=make_move(board=board, move=move),
+            current_player=_get_enemy_color(friendly_color=current_player),
+            last_move=move,
+            alpha=-beta,
+            beta=-alpha,
+        )
+        best_value = max(best_value, value)
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+    return best_value
+
+
+def _order_moves_by_potential(
+    moves: Iterable[Move], board: Board, current_player: str
+) -> list[Move]:
+    """Get ad-hoc ordering of moves to process high-potential moves first.
+
+    Checkmate moves come first, then captures that do not lose material by their
+    static exchange evaluation, then all other moves and captures that lose material
+    last. Captures are ordered by their static exchange evaluation. Only moves that
+    give check are tested for checkmate.
+    """
     checkmate_moves = []
-    pawn_captures = []
-    other_captures = []
+    good_captures = []
     rest = []
-    for algebraic_identifier, move in moves_mapping.items():
+    bad_captures = []
+    for move in moves:
         # Checkmate moves
-        if algebraic_identifier[-1] == "#":
-            checkmate_moves.append((algebraic_identifier, move))
-        # Pawn captures
-        elif algebraic_identifier[0] == "x":
-            pawn_captures.append((algebraic_identifier, move))
-        # Other captures
-        elif algebraic_identifier[0] != "x" and "x" in algebraic_identifier:
-            other_captures.append((algebraic_identifier, move))
+        if gives_check(board=board, move=move) and is_checkmate(
+            board=make_move(board=board, move=move),
+            current_player=_get_enemy_color(friendly_color=current_player),
+            last_move=move,
+        ):
+            checkmate_moves.append(move)
+        # Captures
+        elif move.is_capturing_move:
+            exchange_value = see(board=board, move=move)
+            if exchange_value >= 0:
+                good_captures.append((exchange_value, move))
+            else:
+                bad_captures.append((exchange_value, move))
         # Leftovers
         else:
-            rest.append((algebraic_identifier, move))
+            rest.append(move)
+    good_captures.sort(key=lambda capture: capture[0], reverse=True)
+    bad_captures.sort(key=lambda capture: capture[0], reverse=True)
 
-    ordered_moves = checkmate_moves + pawn_captures + other_captures + rest
-    return OrderedDict(ordered_moves)
+    return (
+        checkmate_moves
+        + [move for _, move in good_captures]
+        + rest
+        + [move for _, move in bad_captures]
+    )
+
+
+def _has_legal_move(
+    board: Board, current_player: str, last_move: Optional[Move]
+) -> bool:
+    for _ in get_legal_moves(
+        board=board, current_player=current_player, last_move=last_move
+    ):
+        return True
+    return False
 
 
 def _get_enemy_color(friendly_color: str) -> str:
@@ -35,3 +35,51 @@ def make_move(board: Board, move: Move) -> Board:
     for piece_to_delete in move.pieces_to_delete:
         board = board.delete_piece(position=piece_to_delete)
     return board
+
+
+def get_captured_pieces(board: Board, move: Move) -> tuple[Piece, ...]:
+    """Get the pieces a move removes from the board.
+
+    Together with the move itself they are all that is needed to unmake the move.
+
+    Args:
+        board: Board before the move is made.
+        move: Move that is about to be made.
+
+    Returns: The pieces captured by the move, usually none or one.
+    """
+    captured_pieces = []
+    for _, to_position in move.piece_moves:
+        piece = board[to_position]
+        if piece is not None:
+            captured_pieces.append(piece)
+    for piece_to_delete in move.pieces_to_delete:
+        piece = board[piece_to_delete]
+        if piece is not None:
+            captured_pieces.append(piece)
+    return tuple(captured_pieces)
+
+
+def unmake_move(board: Board, move: Move, captured_pieces: tuple[Piece, ...]) -> Board:
+    """Take back a move, the inverse of "make_move".
+
+    Args:
+        board: Board after the move was made.
+        move: Move to take back.
+        captured_pieces: Pieces captured by the move as returned by
+            "get_captured_pieces" before the move was made.
+
+    Returns: A copy of the board before the move was made.
+    """
+    destinations = {to_position for _, to_position in move.piece_moves}
+    return Board(
+        pieces=(
+            *(
+                piece
+                for piece in board.all_pieces()
+                if piece.position not in destinations
+            ),
+            *move.moving_pieces,
+            *captured_pieces,
+        )
+    )
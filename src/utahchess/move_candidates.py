@@ -56,6 +56,16 @@ def get_all_move_candidates(
     )  # type: ignore
 
 
+def get_move_candidates(
+    board: Board, position: tuple[int, int]
+) -> Generator[tuple[tuple[int, int], tuple[int, int]], None, None]:
+    """Get all move candidates for the piece on a specific position."""
+    piece = board[position]
+    if piece is None:
+        raise Exception(f"Piece at position {position} is None.")
+    return _get_move_candidate_function(piece=piece)(board=board, position=position)
+
+
 def get_pawn_move_candidates(
     board: Board, position: tuple[int, int]
 ) -> Generator[tuple[tuple[int, int], tuple[int, int]], None, None]:
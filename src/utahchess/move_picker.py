@@ -0,0 +1,141 @@
+"""Staged generation of legal moves for searches with alpha-beta pruning.
+
+Most nodes of a search with good move ordering are cut off by their first or second
+move, so generating, validating and naming all of their moves up front is mostly
+wasted. "pick_moves" yields moves in stages and only generates a stage once the
+previous one is exhausted:
+
+    1. The best move a transposition table remembers for the position
+    2. Captures that do not lose material by their static exchange evaluation
+    3. Killer moves, i.e. quiet moves that caused cutoffs in sibling positions
+    4. All other quiet moves, including castling
+    5. Captures that lose material
+"""
+from __future__ import annotations
+
+from typing import Generator, Iterable, Optional
+
+from utahchess.board import Board
+from utahchess.castling import get_castling_moves
+from utahchess.en_passant import get_en_passant_moves
+from utahchess.legal_moves import is_legal_move
+from utahchess.move import REGULAR_MOVE, Move
+from utahchess.move_candidates import get_all_move_candidates
+from utahchess.move_validation import is_valid_move
+from utahchess.regular_move import create_regular_move
+from utahchess.static_exchange import see
+
+KILLER_MOVES_PER_PLY = 2
+
+
+class KillerMoves:
+    """Quiet moves that caused a cutoff, per distance from the root node.
+
+    Positions at the same distance from the root node are often alike, so a move
+    refuting one of them is worth trying early in the others.
+
+    Args:
+        moves_per_ply: Number of moves to remember per ply, most recent first.
+    """
+
+    def __init__(self, moves_per_ply: int = KILLER_MOVES_PER_PLY) -> None:
+        self.moves_per_ply = moves_per_ply
+        self._moves: dict[int, tuple[Move, ...]] = {}
+
+    def get(self, ply: int) -> tuple[Move, ...]:
+        return self._moves.get(ply, ())
+
+    def add(self, ply: int, move: Move) -> None:
+        """Remember a move that caused a cutoff, captures are ignored."""
+        if move.is_capturing_move or move.type != REGULAR_MOVE:
+            return
+        moves = self._moves.get(ply, ())
+        if move in moves:
+            return
+        self._moves[ply] = (move, *moves)[: self.moves_per_ply]
+
+
+def pick_moves(
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move] = None,
+    table_move: Optional[Move] = None,
+    killer_moves: Iterable[Move] = (),
+) -> Generator[Move, None, None]:
+    """Get all legal moves, most promising first, generating them in stages.
+
+    Args:
+        board: Board on which to get the legal moves.
+        current_player: Player for which to get the legal moves.
+        last_move: Last move that was executed on the board.
+        table_move: Best move a transposition table remembers for the position. It
+            is yielded first if it is legal.
+        killer_moves: Quiet moves that caused cutoffs in sibling positions. They are
+            yielded after the good captures if they are legal.
+
+    Returns: Every legal move exactly once.
+    """
+    if table_move is not None and is_legal_move(
+        board=board, move=table_move, current_player=current_player, last_move=last_move
+    ):
+        yield table_move
+    else:
+        table_move = None
+
+    move_candidates = tuple(
+        get_all_move_candidates(board=board, current_player=current_player)
+    )
+    captures = [
+        move
+        for move in (
+            create_regular_move(board=board, move_candidate=move_candidate)
+            for move_candidate in move_candidates
+            if board[move_candidate[1]] is not None
+        )
+        if is_valid_move(board=board, move=move)
+    ]
+    captures.extend(get_en_passant_moves(board=board, last_move=last_move))
+    scored_captures = sorted(
+        (
+            (see(board=board, move=move), move)
+            for move in captures
+            if move != table_move
+        ),
+        key=lambda scored_capture: scored_capture[0],
+        reverse=True,
+    )
+    bad_captures = []
+    for exchange_value, move in scored_captures:
+        if exchange_value < 0:
+            bad_captures.append(move)
+        else:
+            yield move
+
+    quiet_move_candidates = [
+        move_candidate
+        for move_candidate in move_candidates
+        if board[move_candidate[1]] is None
+    ]
+    picked_moves = {table_move}
+    for killer_move in killer_moves:
+        if (
+            killer_move not in picked_moves
+            and killer_move.piece_moves[0] in quiet_move_candidates
+            and killer_move
+            == create_regular_move(
+                board=board, move_candidate=killer_move.piece_moves[0]
+            )
+            and is_valid_move(board=board, move=killer_move)
+        ):
+            picked_moves.add(killer_move)
+            yield killer_move
+
+    for move_candidate in quiet_move_candidates:
+        move = create_regular_move(board=board, move_candidate=move_candidate)
+        if move not in picked_moves and is_valid_move(board=board, move=move):
+            yield move
+    for move in get_castling_moves(board=board, current_player=current_player):
+        if move != table_move:
+            yield move
+
+    yield from bad_captures
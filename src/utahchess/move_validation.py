@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+from typing import Callable, Optional
+
 from utahchess import BLACK, WHITE
 from utahchess.board import Board
 from utahchess.move import Move
-from utahchess.move_candidates import get_all_move_candidates
+from utahchess.move_candidates import KING_MOVEMENT_VECTORS, KNIGHT_MOVEMENT_VECTORS
+from utahchess.piece import Piece
+from utahchess.tile_movement_utils import is_in_bounds
+
+STRAIGHT_MOVEMENT_VECTORS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+DIAGONAL_MOVEMENT_VECTORS = ((1, 1), (-1, -1), (1, -1), (-1, 1))
+
+STEPPING_ATTACKERS: tuple[tuple[tuple[tuple[int, int], ...], tuple[str, ...]], ...] = (
+    (KNIGHT_MOVEMENT_VECTORS, ("Knight",)),
+    (KING_MOVEMENT_VECTORS, ("King",)),
+)
+SLIDING_ATTACKERS: tuple[tuple[tuple[tuple[int, int], ...], tuple[str, ...]], ...] = (
+    (STRAIGHT_MOVEMENT_VECTORS, ("Rook", "Queen")),
+    (DIAGONAL_MOVEMENT_VECTORS, ("Bishop", "Queen")),
+)
 
 
 def is_check(board: Board, current_player: str) -> bool:
@@ -19,12 +35,69 @@ def is_check(board: Board, current_player: str) -> bool:
     Returns: Flag indicating whether the current player is in check or not.
     """
     enemy_color = WHITE if current_player == BLACK else BLACK
-    return find_current_players_king_position(
-        board=board, current_player=current_player
-    ) in [
-        move[1]
-        for move in get_all_move_candidates(board=board, current_player=enemy_color)
-    ]
+    return is_attacked(
+        board=board,
+        position=find_current_players_king_position(
+            board=board, current_player=current_player
+        ),
+        attacking_player=enemy_color,
+    )
+
+
+def is_attacked(board: Board, position: tuple[int, int], attacking_player: str) -> bool:
+    """Get whether a position is attacked by any piece of the attacking player.
+
+    Instead of generating all move candidates of the attacking player, this looks
+    outwards from the position for pieces that could capture on it.
+
+    Args:
+        board: Board on which to check.
+        position: Position that is possibly attacked.
+        attacking_player: Player whose pieces are possibly attacking.
+
+    Returns: Flag indicating whether the position is attacked or not.
+    """
+    return _is_attacked(
+        get_piece=board.__getitem__,
+        position=position,
+        attacking_player=attacking_player,
+    )
+
+
+def gives_check(board: Board, move: Move) -> bool:
+    """Get whether a move puts the enemy king in check, without making the move.
+
+    The squares the move changes are looked up before the board, which is cheaper
+    than making the move and calling "is_check" on the new board.
+
+    Args:
+        board: Board on which the move would be executed.
+        move: Legal move which is checked.
+
+    Returns: Flag indicating whether the enemy king is in check after the move.
+    """
+    moving_player = move.moving_pieces[0].color
+    enemy_color = WHITE if moving_player == BLACK else BLACK
+    changed_pieces: dict[tuple[int, int], Optional[Piece]] = {
+        position: None for position in move.pieces_to_delete
+    }
+    for from_position, _ in move.piece_moves:
+        changed_pieces[from_position] = None
+    for (_, to_position), moving_piece in zip(move.piece_moves, move.moving_pieces):
+        changed_pieces[to_position] = moving_piece
+
+    def get_piece(position: tuple[int, int]) -> Optional[Piece]:
+        if position in changed_pieces:
+            return changed_pieces[position]
+        return board[position]
+
+    return _is_attacked(
+        get_piece=get_piece,
+        position=find_current_players_king_position(
+            board=board, current_player=enemy_color
+        ),
+        attacking_player=moving_player,
+    )
 
 
 def is_valid_move(board: Board, move: Move) -> bool:
@@ -58,3 +131,63 @@ def find_current_players_king_position(
         if piece.piece_type == "King" and piece.color == current_player:
             return piece.position
     raise Exception(f"No King found for {current_player}")
+
+
+def _is_attacked(
+    get_piece: Callable[[tuple[int, int]], Optional[Piece]],
+    position: tuple[int, int],
+    attacking_player: str,
+) -> bool:
+    """See "is_attacked", pieces are looked up with "get_piece"."""
+    x, y = position
+    # Pawns move towards lower y indices for white and capture diagonally
+    pawn_y = y + 1 if attacking_player == WHITE else y - 1
+    for pawn_x in (x - 1, x + 1):
+        if _is_attacking_piece(
+            get_piece=get_piece,
+            position=(pawn_x, pawn_y),
+            attacking_player=attacking_player,
+            piece_types=("Pawn",),
+        ):
+            return True
+
+    for movement_vectors, piece_types in STEPPING_ATTACKERS:
+        for x_offset, y_offset in movement_vectors:
+            if _is_attacking_piece(
+                get_piece=get_piece,
+                position=(x + x_offset, y + y_offset),
+                attacking_player=attacking_player,
+                piece_types=piece_types,
+            ):
+                return True
+
+    for movement_vectors, piece_types in SLIDING_ATTACKERS:
+        for x_offset, y_offset in movement_vectors:
+            next_tile = (x + x_offset, y + y_offset)
+            while is_in_bounds(position=next_tile) and get_piece(next_tile) is None:
+                next_tile = (next_tile[0] + x_offset, next_tile[1] + y_offset)
+            if _is_attacking_piece(
+                get_piece=get_piece,
+                position=next_tile,
+                attacking_player=attacking_player,
+                piece_types=piece_types,
+            ):
+                return True
+    return False
+
+
+def _is_attacking_piece(
+    get_piece: Callable[[tuple[int, int]], Optional[Piece]],
+    position: tuple[int, int],
+    attacking_player: str,
+    piece_types: tuple[str, ...],
+) -> bool:
+    """Get whether there is a piece of the attacking player and given types."""
+    if not is_in_bounds(position=position):
+        return False
+    piece = get_piece(position)
+    return (
+        piece is not None
+        and piece.color == attacking_player
+        and piece.piece_type in piece_types
+    )
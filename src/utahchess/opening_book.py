@@ -0,0 +1,306 @@
+"""Opening book of moves played in a collection of games.
+
+The book is a binary file of fixed size entries of (key, move, weight), sorted by
+key. The key is the Zobrist hash of the position, see "utahchess.zobrist", the
+move is encoded in 12 bits and the weight is the number of games in which the move
+was played in the position. The file is memory-mapped and entries of a position are
+found by binary search, so looking up a move takes microseconds and only the pages
+of the file that are searched are loaded.
+
+Build a book from a PGN file with:
+
+    python -m utahchess.opening_book games.pgn book.bin
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import random
+import struct
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+from utahchess.board import NO_RANKS_AND_FILES, Board
+from utahchess.castling import get_castling_moves
+from utahchess.chess import ChessGame
+from utahchess.en_passant import get_en_passant_moves
+from utahchess.legal_moves import is_legal_move
+from utahchess.move import Move
+from utahchess.pgn import PgnGame, find_algebraic_identifier, read_games_from_path
+from utahchess.regular_move import create_regular_move
+from utahchess.zobrist import get_position_hash
+
+MAGIC = b"UTAHBOOK"
+# Key, move and weight, big-endian so the file is the same on every machine
+ENTRY_STRUCT = struct.Struct(">QHH")
+MAX_WEIGHT = 2**16 - 1
+DEFAULT_MAX_PLIES = 20
+
+
+@dataclass(frozen=True)
+class BookEntry:
+    """Move of an opening book.
+
+    Attributes:
+        key: Zobrist hash of the position the move is played in.
+        move: The move, encoded by "encode_book_move".
+        weight: Number of games in which the move was played in the position.
+    """
+
+    key: int
+    move: int
+    weight: int
+
+
+def encode_book_move(move: Move) -> int:
+    """Encode a move in 12 bits.
+
+    The upper six bits are the index of the square the moving piece moves from, the
+    lower six bits the index of the square it moves to, counting from a8 rank by
+    rank. Castling moves are encoded by the king's move.
+    """
+    (from_x, from_y), (to_x, to_y) = move.piece_moves[0]
+    from_square = from_y * NO_RANKS_AND_FILES + from_x
+    to_square = to_y * NO_RANKS_AND_FILES + to_x
+    return from_square << 6 | to_square
+
+
+def decode_book_move(
+    board: Board, book_move: int, current_player: str, last_move: Optional[Move] = None
+) -> Optional[Move]:
+    """Get the legal move for a move encoded by "encode_book_move".
+
+    Args:
+        board: Board the move is played on.
+        book_move: The encoded move.
+        current_player: Player to move.
+        last_move: Last move that was executed on the board.
+
+    Returns: The legal move, None if the encoded move is not legal on the board, e.g.
+        for an entry of a different position with the same hash.
+    """
+    from_square, to_square = book_move >> 6, book_move & 63
+    from_position = (
+        from_square % NO_RANKS_AND_FILES,
+        from_square // NO_RANKS_AND_FILES,
+    )
+    to_position = (to_square % NO_RANKS_AND_FILES, to_square // NO_RANKS_AND_FILES)
+    piece = board[from_position]
+    if piece is None or piece.color != current_player:
+        return None
+    if piece.piece_type == "King" and abs(to_position[0] - from_position[0]) == 2:
+        candidates: Iterable[Move] = get_castling_moves(
+            board=board, current_player=current_player
+        )
+    elif (
+        piece.piece_type == "Pawn"
+        and to_position[0] != from_position[0]
+        and board[to_position] is None
+    ):
+        candidates = get_en_passant_moves(board=board, last_move=last_move)
+    else:
+        candidates = (
+            create_regular_move(
+                board=board, move_candidate=(from_position, to_position)
+            ),
+        )
+    for move in candidates:
+        if move.piece_moves[0] == (from_position, to_position) and is_legal_move(
+            board=board, move=move, current_player=current_player, last_move=last_move
+        ):
+            return move
+    return None
+
+
+class OpeningBook:
+    """Opening book read from a file written by "write_book".
+
+    Use it as a context manager or call "close" to unmap the file.
+
+    Args:
+        path: Path of the book.
+
+    Raises:
+        ValueError: If the file is not an opening book.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mapped_file[: len(MAGIC)] != MAGIC:
+            self._mapped_file.close()
+            raise ValueError(f"File '{path}' is not an opening book.")
+        self._num_entries = (len(self._mapped_file) - len(MAGIC)) // ENTRY_STRUCT.size
+
+    def __len__(self) -> int:
+        return self._num_entries
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mapped_file.close()
+
+    def get_entries(self, position_hash: int) -> list[BookEntry]:
+        """Get the entries of a position, most played first."""
+        # Binary search for the first entry with the key
+        low, high = 0, self._num_entries
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_entry(index=middle)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+        entries = []
+        for index in range(low, self._num_entries):
+            key, book_move, weight = self._read_entry(index=index)
+            if key != position_hash:
+                break
+            entries.append(BookEntry(key=key, move=book_move, weight=weight))
+        return entries
+
+    def choose_move(
+        self,
+        board: Board,
+        current_player: str,
+        last_move: Optional[Move] = None,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Move]:
+        """Choose one of the book moves of a position at random by their weights.
+
+        Args:
+            board: Board to choose a move on.
+            current_player: Player to move.
+            last_move: Last move that was executed on the board.
+            rng: Random number generator to choose with, e.g. a seeded one for
+                repeatable games. The "random" module if None.
+
+        Returns: A legal move of the book, None if the position is not in the book.
+        """
+        position_hash = get_position_hash(
+            board=board, current_player=current_player, last_move=last_move
+        )
+        entries = [
+            entry
+            for entry in self.get_entries(position_hash=position_hash)
+            if entry.weight > 0
+        ]
+        # Only the chosen move is validated, entries of other positions with the
+        # same hash are rare
+        while entries:
+            entry = (random if rng is None else rng).choices(
+                entries, weights=[entry.weight for entry in entries]
+            )[0]
+            move = decode_book_move(
+                board=board,
+                book_move=entry.move,
+                current_player=current_player,
+                last_move=last_move,
+            )
+            if move is not None:
+                return move
+            entries.remove(entry)
+        return None
+
+    def _read_entry(self, index: int) -> tuple[int, int, int]:
+        return ENTRY_STRUCT.unpack_from(
+            self._mapped_file, len(MAGIC) + index * ENTRY_STRUCT.size
+        )
+
+
+def build_book(
+    pgn_games: Iterable[PgnGame], max_plies: int = DEFAULT_MAX_PLIES
+) -> list[BookEntry]:
+    """Count the moves played in the first plies of games.
+
+    A game is only followed up to its first move that is illegal or not supported
+    by the engine, e.g. a promotion.
+
+    Args:
+        pgn_games: Games to build the book from, e.g. from "read_games_from_path".
+        max_plies: Number of plies of each game to add to the book.
+
+    Returns: An entry for every move played in a position, weighted by the number of
+        games it was played in.
+    """
+    weights: Counter[tuple[int, int]] = Counter()
+    for pgn_game in pgn_games:
+        if "FEN" in pgn_game.headers:
+            game = ChessGame.from_fen(pgn_game.headers["FEN"])
+        else:
+            game = ChessGame()
+            game.new_game()
+        for san in pgn_game.moves[:max_plies]:
+            game_state = game.current_game_state
+            try:
+                algebraic_identifier = find_algebraic_identifier(
+                    san=san, legal_moves=game_state.legal_moves
+                )
+            except ValueError:
+                break
+            move = game_state.legal_moves[algebraic_identifier]
+            weights[(game_state.position_hash, encode_book_move(move=move))] += 1
+            game.make_move(move_in_algebraic_notation=algebraic_identifier)
+    return [
+        BookEntry(key=key, move=book_move, weight=weight)
+        for (key, book_move), weight in weights.items()
+    ]
+
+
+def write_book(path: str, entries: Iterable[BookEntry]) -> int:
+    """Write an opening book.
+
+    Entries are sorted by key and, within a position, by weight. Entries of the same
+    move in the same position are merged, weights are capped at "MAX_WEIGHT".
+
+    Args:
+        path: Path of the file to write.
+        entries: Entries of the book, e.g. from "build_book".
+
+    Returns: The number of entries written.
+    """
+    weights: Counter[tuple[int, int]] = Counter()
+    for entry in entries:
+        weights[(entry.key, entry.move)] += entry.weight
+    sorted_entries = sorted(
+        weights.items(), key=lambda item: (item[0][0], -item[1], item[0][1])
+    )
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        for (key, book_move), weight in sorted_entries:
+            file.write(ENTRY_STRUCT.pack(key, book_move, min(weight, MAX_WEIGHT)))
+    return len(sorted_entries)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m utahchess.opening_book",
+        description="Build an opening book from the games of a PGN file.",
+    )
+    parser.add_argument("pgn_path", help="Path of the PGN file to read.")
+    parser.add_argument("book_path", help="Path of the opening book to write.")
+    parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=DEFAULT_MAX_PLIES,
+        help="Number of plies of each game to add to the book.",
+    )
+    arguments = parser.parse_args(argv)
+
+    num_entries = write_book(
+        path=arguments.book_path,
+        entries=build_book(
+            pgn_games=read_games_from_path(path=arguments.pgn_path),
+            max_plies=arguments.max_plies,
+        ),
+    )
+    print(f"Wrote {num_entries} entries to {arguments.book_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Generator, Iterable, Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.chess import CHECKMATE, DRAWS, ChessGame
+from utahchess.move import LONG_CASTLING, SHORT_CASTLING, Move
+from utahchess.utils import file_to_x_index, rank_to_y_index, x_index_to_file
+
+INITIAL_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+SEVEN_TAG_ROSTER = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+SEVEN_TAG_ROSTER_DEFAULTS = {"Date": "????.??.??"}
+MAX_LINE_LENGTH = 80
+
+PIECE_TYPES = {
+    "K": "King",
+    "Q": "Queen",
+    "R": "Rook",
+    "B": "Bishop",
+    "N": "Knight",
+}
+
+HEADER_PATTERN = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]\s*$')
+COMMENT_PATTERN = re.compile(r"\{[^}]*\}|;[^\n]*")
+VARIATION_PATTERN = re.compile(r"\([^()]*\)")
+MOVE_NUMBER_PATTERN = re.compile(r"\d+\.+")
+NAG_PATTERN = re.compile(r"\$\d+")
+EN_PASSANT_PATTERN = re.compile(r"\s*e\.?p\.?$")
+SAN_PATTERN = re.compile(
+    r"^(?P<piece>[KQRBN])?(?P<file>[a-h])?(?P<rank>[1-8])?(?P<capture>x)?"
+    r"(?P<destination>[a-h][1-8])(?P<promotion>=?[QRBN])?$"
+)
+
+
+@dataclass(frozen=True)
+class PgnGame:
+    """A game of chess as read from a PGN file.
+
+    Moves are kept in standard algebraic notation (SAN) as they appear in the file.
+    Use "replay_game" to play them on a "ChessGame".
+    """
+
+    headers: dict[str, str] = field(default_factory=dict)
+    moves: tuple[str, ...] = ()
+    result: str = "*"
+
+
+def read_games(lines: Iterable[str]) -> Generator[PgnGame, None, None]:
+    """Read games from PGN text one at a time.
+
+    The text is consumed lazily, so open files of arbitrary size can be passed in
+    without loading them into memory. Comments, variations, NAGs and move numbers
+    are skipped.
+
+    Args:
+        lines: Lines of PGN text, e.g. an open file.
+
+    Yields:
+        Every game in the PGN text.
+    """
+    headers: dict[str, str] = {}
+    movetext: list[str] = []
+    is_inside_comment = False
+    for line in lines:
+        stripped_line = line.strip()
+        if stripped_line.startswith("%") or (not stripped_line and not movetext):
+            continue  # Escaped line or blank line between games
+        if stripped_line.startswith("[") and not is_inside_comment:
+            if movetext:  # Header of the next game while the last had no result
+                yield _create_game(headers=headers, movetext=movetext)
+                headers, movetext = {}, []
+            match = HEADER_PATTERN.match(stripped_line)
+            if match is not None:
+                headers[match.group(1)] = _unescape_header_value(match.group(2))
+            continue
+        movetext.append(line)
+        is_inside_comment = _get_is_inside_comment(
+            line=stripped_line, was_inside_comment=is_inside_comment
+        )
+        if stripped_line.endswith(RESULTS) and not is_inside_comment:
+            yield _create_game(headers=headers, movetext=movetext)
+            headers, movetext = {}, []
+    if headers or movetext:
+        yield _create_game(headers=headers, movetext=movetext)
+
+
+def read_games_from_path(path: str) -> Generator[PgnGame, None, None]:
+    """Read games from a PGN file one at a time, see "read_games"."""
+    with open(path, "r", encoding="utf-8", errors="replace") as file:
+        yield from read_games(lines=file)
+
+
+def replay_game(pgn_game: PgnGame) -> ChessGame:
+    """Play all moves of a PGN game on a new game of chess.
+
+    Args:
+        pgn_game: Game to replay. A "FEN" header is used as starting position.
+
+    Returns: A game of chess after all moves of the PGN game were made.
+
+    Raises:
+        ValueError: If a move is not legal or not supported by the engine.
+    """
+    if "FEN" in pgn_game.headers:
+        game = ChessGame.from_fen(pgn_game.headers["FEN"])
+    else:
+        game = ChessGame()
+        game.new_game()
+    for san in pgn_game.moves:
+        game.make_move(
+            move_in_algebraic_notation=find_algebraic_identifier(
+                san=san, legal_moves=game.current_game_state.legal_moves
+            )
+        )
+    return game
+
+
+def find_algebraic_identifier(san: str, legal_moves: dict[str, Move]) -> str:
+    """Get the engine's algebraic identifier of a move in standard notation.
+
+    The engine's identifiers differ from standard algebraic notation (SAN) in a few
+    ways, e.g. en passant moves end in " e.p." and pawn captures only carry the file
+    of the moving pawn when needed for disambiguation. The SAN move is therefore
+    matched against the legal moves themselves. Check and checkmate flags,
+    annotations like "!?" as well as unnecessary disambiguation are tolerated.
+
+    Args:
+        san: Move in standard algebraic notation, e.g. "exd6", "Nbd2" or "O-O+".
+        legal_moves: A mapping of legal moves in algebraic notation to moves.
+
+    Returns: The key of the move in the legal moves.
+
+    Raises:
+        ValueError: If no or more than one legal move matches.
+    """
+    cleaned_san = EN_PASSANT_PATTERN.sub("", san.rstrip("+#!?")).replace("0", "O")
+    if cleaned_san in ("O-O", "O-O-O"):
+        castling_type = SHORT_CASTLING if cleaned_san == "O-O" else LONG_CASTLING
+        candidates = [
+            algebraic_identifier
+            for algebraic_identifier, move in legal_moves.items()
+            if move.type == castling_type
+        ]
+    else:
+        match = SAN_PATTERN.match(cleaned_san)
+        if match is None:
+            raise ValueError(f"Could not parse move '{san}'.")
+        if match.group("promotion"):
+            raise ValueError(f"Promotion '{san}' is not supported by the engine.")
+        piece_type = PIECE_TYPES.get(match.group("piece") or "", "Pawn")
+        destination = match.group("destination")
+        candidates = [
+            algebraic_identifier
+            for algebraic_identifier, move in legal_moves.items()
+            if move.moving_pieces[0].piece_type == piece_type
+            and move.type not in (SHORT_CASTLING, LONG_CASTLING)
+            and move.piece_moves[0][1]
+            == (file_to_x_index(destination[0]), rank_to_y_index(destination[1]))
+            and (
+                not match.group("file")
+                or move.piece_moves[0][0][0] == file_to_x_index(match.group("file"))
+            )
+            and (
+                not match.group("rank")
+                or move.piece_moves[0][0][1] == rank_to_y_index(match.group("rank"))
+            )
+        ]
+    if len(candidates) != 1:
+        raise ValueError(
+            f"Move '{san}' matches {len(candidates)} legal moves instead of one."
+        )
+    return candidates[0]
+
+
+def to_standard_algebraic_notation(algebraic_identifier: str, move: Move) -> str:
+    """Get standard algebraic notation (SAN) for one of the engine's identifiers."""
+    san = algebraic_identifier.replace(" e.p.", "")
+    if (
+        move.moving_pieces[0].piece_type == "Pawn"
+        and move.is_capturing_move
+        and san.startswith("x")
+    ):
+        san = x_index_to_file(x=move.piece_moves[0][0][0]) + san
+    return san
+
+
+def write_game(game: ChessGame, headers: Optional[dict[str, str]] = None) -> str:
+    """Get a game of chess in PGN.
+
+    Moves are taken from the history of the game. The seven tag roster
+    is always written, missing tags are filled with "?". If the game did not start
+    from the initial position a "FEN" header is added.
+
+    Args:
+        game: Game to write.
+        headers: Additional headers or values for the seven tag roster.
+
+    Returns: The game in PGN, followed by an empty line to separate it from the next.
+    """
+    initial_state = game.initial_game_state
+    initial_fen = initial_state.to_fen()
+    result = _get_result(game=game)
+
+    all_headers = {
+        tag: SEVEN_TAG_ROSTER_DEFAULTS.get(tag, "?") for tag in SEVEN_TAG_ROSTER
+    }
+    all_headers.update(headers or {})
+    all_headers["Result"] = result
+    if initial_fen != INITIAL_FEN:
+        all_headers.update({"SetUp": "1", "FEN": initial_fen})
+
+    tokens = []
+    current_player, turn = initial_state.current_player, initial_state.turn
+    for index, history_entry in enumerate(game.history):
+        if current_player == WHITE:
+            tokens.append(f"{turn}.")
+        elif index == 0:
+            tokens.append(f"{turn}...")
+        tokens.append(
+            to_standard_algebraic_notation(
+                algebraic_identifier=history_entry.algebraic_identifier,
+                move=history_entry.move,
+            )
+        )
+        if current_player == BLACK:
+            turn += 1
+        current_player = BLACK if current_player == WHITE else WHITE
+    tokens.append(result)
+
+    header_lines = [
+        f'[{tag} "{_escape_header_value(value=value)}"]'
+        for tag, value in all_headers.items()
+    ]
+    return "\n".join(header_lines + [""] + _wrap_tokens(tokens=tokens) + [""]) + "\n"
+
+
+def _create_game(headers: dict[str, str], movetext: list[str]) -> PgnGame:
+    text = COMMENT_PATTERN.sub(" ", "".join(movetext))
+    while VARIATION_PATTERN.search(text):
+        text = VARIATION_PATTERN.sub(" ", text)
+    text = NAG_PATTERN.sub(" ", MOVE_NUMBER_PATTERN.sub(" ", text))
+    tokens = text.split()
+    result = headers.get("Result", "*")
+    if tokens and tokens[-1] in RESULTS:
+        result = tokens.pop()
+    return PgnGame(headers=headers, moves=tuple(tokens), result=result)
+
+
+def _escape_header_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _unescape_header_value(value: str) -> str:
+    return value.replace('\\"', '"').replace("\\\\", "\\")
+
+
+def _get_is_inside_comment(line: str, was_inside_comment: bool) -> bool:
+    """Get whether a brace comment is still open at the end of a line."""
+    opening, closing = line.rfind("{"), line.rfind("}")
+    if opening == closing == -1:
+        return was_inside_comment
+    return opening > closing
+
+
+def _get_result(game: ChessGame) -> str:
+    game_over_type = game.get_game_over_type()
+    if game_over_type == CHECKMATE:
+        return "0-1" if game.get_current_player() == WHITE else "1-0"
+    if game_over_type in DRAWS:
+        return "1/2-1/2"
+    return "*"
+
+
+def _wrap_tokens(tokens: list[str]) -> list[str]:
+    lines, line = [], ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > MAX_LINE_LENGTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    if line:
+        lines.append(line)
+    return lines
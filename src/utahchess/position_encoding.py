@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import mmap
+from functools import lru_cache
+from typing import Generator, Iterable, Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.board import NO_RANKS_AND_FILES, Board
+from utahchess.utils import FILE_POSSIBILITIES
+
+MAGIC = b"UTAHPOS1"
+SQUARES_SIZE = 32
+RECORD_SIZE = SQUARES_SIZE + 2
+
+# One nibble per square, bit 3 set for black pieces
+PIECE_NIBBLES = {"P": 1, "N": 2, "B": 3, "R": 4, "Q": 5, "K": 6}
+PIECE_NIBBLES.update(
+    {character.lower(): nibble | 8 for character, nibble in PIECE_NIBBLES.items()}
+)
+NIBBLE_PIECES = {nibble: character for character, nibble in PIECE_NIBBLES.items()}
+
+BLACK_TO_MOVE_FLAG = 1
+CASTLING_FLAGS = {"K": 2, "Q": 4, "k": 8, "q": 16}
+
+
+def encode_board(
+    board: Board, current_player: str = WHITE, en_passant_square: str = "-"
+) -> bytes:
+    """Encode a board into a fixed size record of 34 bytes.
+
+    The first 32 bytes hold one nibble per square, starting at a8 and going rank by
+    rank like a FEN. The 33rd byte holds side to move and castling availability,
+    the last byte the file of the en passant square plus one, or zero.
+
+    Args:
+        board: Board to encode.
+        current_player: Player whose turn it is.
+        en_passant_square: En passant target square, e.g. "e3", or "-".
+
+    Returns: The encoded board.
+    """
+    return encode_fen(
+        fen=board.to_fen(
+            current_player=current_player, en_passant_square=en_passant_square
+        )
+    )
+
+
+def encode_fen(fen: str) -> bytes:
+    """Encode a position in Forsyth-Edwards Notation (FEN), see "encode_board".
+
+    Halfmove clock and fullmove number are not encoded.
+    """
+    fields = fen.split()
+    if not fields:
+        raise ValueError("Cannot encode an empty FEN string.")
+    side_to_move = fields[1] if len(fields) > 1 else "w"
+    castling_availability = fields[2] if len(fields) > 2 else "-"
+    en_passant_square = fields[3] if len(fields) > 3 else "-"
+
+    nibbles = []
+    for character in fields[0]:
+        if character in "12345678":
+            nibbles.extend([0] * int(character))
+        elif character != "/":
+            try:
+                nibbles.append(PIECE_NIBBLES[character])
+            except KeyError:
+                raise ValueError(f"Invalid piece placement in FEN '{fen}'.")
+    if len(nibbles) != NO_RANKS_AND_FILES * NO_RANKS_AND_FILES:
+        raise ValueError(f"Piece placement of FEN '{fen}' does not cover 64 tiles.")
+
+    flags = BLACK_TO_MOVE_FLAG if side_to_move == "b" else 0
+    for character in castling_availability:
+        flags |= CASTLING_FLAGS.get(character, 0)
+    en_passant_file = (
+        0
+        if en_passant_square == "-"
+        else FILE_POSSIBILITIES.index(en_passant_square[0]) + 1
+    )
+    return bytes(
+        [nibbles[i] << 4 | nibbles[i + 1] for i in range(0, len(nibbles), 2)]
+        + [flags, en_passant_file]
+    )
+
+
+def decode_fen(data: bytes) -> str:
+    """Decode a record created by "encode_board" into a FEN string."""
+    if len(data) != RECORD_SIZE:
+        raise ValueError(f"Encoded position has {len(data)} instead of 34 bytes.")
+    flags, en_passant_file = data[SQUARES_SIZE], data[SQUARES_SIZE + 1]
+    current_player = BLACK if flags & BLACK_TO_MOVE_FLAG else WHITE
+    castling_availability = "".join(
+        character for character, flag in CASTLING_FLAGS.items() if flags & flag
+    )
+    en_passant_square = "-"
+    if en_passant_file:
+        en_passant_rank = "3" if current_player == BLACK else "6"
+        en_passant_square = FILE_POSSIBILITIES[en_passant_file - 1] + en_passant_rank
+    return (
+        "/".join(_decode_rank(data[i : i + 4]) for i in range(0, SQUARES_SIZE, 4))
+        + f" {'b' if current_player == BLACK else 'w'} "
+        + f"{castling_availability or '-'} {en_passant_square} 0 1"
+    )
+
+
+def decode_board(data: bytes) -> Board:
+    """Decode a record created by "encode_board" into a board."""
+    return Board.from_fen(decode_fen(data=data))
+
+
+def write_positions(path: str, encoded_positions: Iterable[bytes]) -> int:
+    """Write encoded positions into a single file.
+
+    Positions are written as they come, so a generator of positions is streamed to
+    disk without keeping all of them in memory.
+
+    Args:
+        path: Path of the file to write.
+        encoded_positions: Records created by "encode_board".
+
+    Returns: The number of positions written.
+    """
+    count = 0
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        for encoded_position in encoded_positions:
+            if len(encoded_position) != RECORD_SIZE:
+                raise ValueError(
+                    f"Encoded position has {len(encoded_position)} instead of 34 "
+                    f"bytes."
+                )
+            file.write(encoded_position)
+            count += 1
+    return count
+
+
+def read_encoded_positions(
+    path: str, start: int = 0, stop: Optional[int] = None
+) -> Generator[bytes, None, None]:
+    """Read records from a file written by "write_positions".
+
+    The file is memory-mapped, so only the records that are read are loaded.
+
+    Args:
+        path: Path of the file to read.
+        start: Index of the first position to read.
+        stop: Index after the last position to read. Reads until the end if None.
+
+    Yields:
+        Records created by "encode_board".
+    """
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped_file:
+        if mapped_file[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"File '{path}' is not a file of encoded positions.")
+        num_positions = (len(mapped_file) - len(MAGIC)) // RECORD_SIZE
+        stop = num_positions if stop is None else min(stop, num_positions)
+        for index in range(start, stop):
+            offset = len(MAGIC) + index * RECORD_SIZE
+            yield mapped_file[offset : offset + RECORD_SIZE]
+
+
+def read_positions(
+    path: str, start: int = 0, stop: Optional[int] = None
+) -> Generator[Board, None, None]:
+    """Read boards lazily from a file written by "write_positions".
+
+    See "read_encoded_positions" for the arguments.
+    """
+    for encoded_position in read_encoded_positions(path=path, start=start, stop=stop):
+        yield decode_board(data=encoded_position)
+
+
+def count_positions(path: str) -> int:
+    """Get the number of positions in a file written by "write_positions"."""
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"File '{path}' is not a file of encoded positions.")
+        file.seek(0, 2)
+        return (file.tell() - len(MAGIC)) // RECORD_SIZE
+
+
+@lru_cache(maxsize=2**16)
+def _decode_rank(data: bytes) -> str:
+    """Get the FEN of one rank, encoded in four bytes."""
+    rank = ""
+    empty_tiles = 0
+    for byte in data:
+        for nibble in (byte >> 4, byte & 15):
+            if nibble == 0:
+                empty_tiles += 1
+                continue
+            if empty_tiles:
+                rank += str(empty_tiles)
+                empty_tiles = 0
+            rank += NIBBLE_PIECES[nibble]
+    if empty_tiles:
+        rank += str(empty_tiles)
+    return rank
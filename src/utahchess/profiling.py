@@ -0,0 +1,201 @@
+"""Opt-in profiling of the engine's hot functions.
+
+Profiling replaces the hot functions in all loaded "utahchess" modules with wrappers
+that count calls and measure time with "time.perf_counter_ns". Nothing is wrapped
+unless profiling is enabled, so there is no overhead otherwise.
+
+Use the "Profiler" as a context manager:
+
+    with Profiler() as profiler:
+        game = ChessGame()
+        game.new_game()
+        game.get_legal_moves()
+    print(profiler.get_report())
+
+or set the environment variable UTAHCHESS_PROFILE=1 to profile a whole process and
+print a report to stderr at exit. If UTAHCHESS_PROFILE_TRACE is set to a path, a
+trace in the Chrome trace event format is written there as well. It can be viewed
+with chrome://tracing or https://ui.perfetto.dev.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from importlib import import_module
+from typing import Any, Callable, Iterator, Optional
+
+PROFILED_FUNCTIONS = (
+    ("utahchess.move_candidates", "get_all_move_candidates"),
+    ("utahchess.move_validation", "is_valid_move"),
+    ("utahchess.move_validation", "is_check"),
+    ("utahchess.legal_moves", "is_checkmate"),
+    ("utahchess.move", "make_move"),
+    ("utahchess.algebraic_notation", "get_algebraic_identifer"),
+    ("utahchess.minimax", "get_board_value"),
+)
+
+PROFILE_ENVIRONMENT_VARIABLE = "UTAHCHESS_PROFILE"
+TRACE_ENVIRONMENT_VARIABLE = "UTAHCHESS_PROFILE_TRACE"
+
+_active_profiler: Optional[Profiler] = None
+
+
+class Profiler:
+    """Counts calls of and time spent in the engine's hot functions.
+
+    Times are inclusive, e.g. time spent in "is_check" while running "is_checkmate"
+    counts towards both. Functions returning iterators, like
+    "get_all_move_candidates", are timed while their iterators are consumed.
+
+    Args:
+        trace: Whether to record every call as an event for "write_chrome_trace".
+            This takes a lot of memory for long runs.
+    """
+
+    def __init__(self, trace: bool = False) -> None:
+        self.trace = trace
+        self.calls: Counter[str] = Counter()
+        self.total_ns: Counter[str] = Counter()
+        self.trace_events: list[dict[str, Any]] = []
+        self._original_per_wrapper_id: dict[int, Callable] = {}
+
+    def __enter__(self) -> Profiler:
+        self.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        """Replace the profiled functions with wrappers in all loaded modules.
+
+        Raises:
+            RuntimeError: If another profiler is enabled already.
+        """
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("Another profiler is enabled already.")
+        _active_profiler = self
+
+        wrapper_per_function_id = {}
+        for module_name, function_name in PROFILED_FUNCTIONS:
+            function = getattr(import_module(module_name), function_name)
+            wrapper = self._wrap(function=function, name=function_name)
+            wrapper_per_function_id[id(function)] = wrapper
+            self._original_per_wrapper_id[id(wrapper)] = function
+        _replace_functions(replacement_per_function_id=wrapper_per_function_id)
+
+    def disable(self) -> None:
+        """Restore the original functions in all loaded modules.
+
+        This includes modules that were imported while the profiler was enabled.
+        """
+        global _active_profiler
+        _replace_functions(replacement_per_function_id=self._original_per_wrapper_id)
+        self._original_per_wrapper_id = {}
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def get_report(self) -> str:
+        """Get a flat report of calls and time per function, slowest first."""
+        lines = [f"{'function':<28}{'calls':>12}{'total ms':>14}{'mean us':>12}"]
+        for name, total_ns in self.total_ns.most_common():
+            calls = self.calls[name]
+            lines.append(
+                f"{name:<28}{calls:>12}{total_ns / 1e6:>14.1f}"
+                f"{total_ns / calls / 1e3:>12.2f}"
+            )
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write recorded calls in the Chrome trace event format.
+
+        Raises:
+            ValueError: If the profiler does not record a trace.
+        """
+        if not self.trace:
+            raise ValueError("Profiler was created without trace=True.")
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.trace_events}, file)
+
+    def _record(self, name: str, start_ns: int, end_ns: int) -> None:
+        self.total_ns[name] += end_ns - start_ns
+        if self.trace:
+            self.trace_events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": start_ns / 1e3,
+                    "dur": (end_ns - start_ns) / 1e3,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    def _wrap(self, function: Callable, name: str) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            start_ns = time.perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                self._record(
+                    name=name, start_ns=start_ns, end_ns=time.perf_counter_ns()
+                )
+            if isinstance(result, Iterator):
+                return self._time_iterator(iterator=result, name=name)
+            return result
+
+        return wrapper
+
+    def _time_iterator(self, iterator: Iterator, name: str) -> Iterator:
+        while True:
+            start_ns = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._record(
+                    name=name, start_ns=start_ns, end_ns=time.perf_counter_ns()
+                )
+            yield item
+
+
+def _replace_functions(replacement_per_function_id: dict[int, Callable]) -> None:
+    """Replace functions by identity in all loaded "utahchess" modules."""
+    for module_name, module in list(sys.modules.items()):
+        if module_name != "utahchess" and not module_name.startswith("utahchess."):
+            continue
+        for attribute_name, value in list(vars(module).items()):
+            replacement = replacement_per_function_id.get(id(value))
+            if replacement is not None:
+                setattr(module, attribute_name, replacement)
+
+
+def enable_from_environment() -> Optional[Profiler]:
+    """Enable profiling for the whole process if UTAHCHESS_PROFILE is set.
+
+    Returns: The enabled profiler, or None if profiling is not requested.
+    """
+    if os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "0") in ("", "0"):
+        return None
+    trace_path = os.environ.get(TRACE_ENVIRONMENT_VARIABLE)
+    profiler = Profiler(trace=bool(trace_path))
+    profiler.enable()
+
+    def report() -> None:
+        profiler.disable()
+        print(profiler.get_report(), file=sys.stderr)
+        if trace_path:
+            profiler.write_chrome_trace(path=trace_path)
+
+    atexit.register(report)
+    return profiler
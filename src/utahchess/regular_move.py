@@ -23,23 +23,37 @@ def get_regular_moves(board: Board, current_player: str) -> Generator[Move, None
     for move_candidate in get_all_move_candidates(
         board=board, current_player=current_player
     ):
-        from_position, to_position = move_candidate
-        from_piece = board[from_position]
-        if from_piece is None:
-            raise Exception(f"Piece at {from_position} unexpectedly None.")
-        potential_move = Move(
-            type=REGULAR_MOVE,
-            piece_moves=(move_candidate,),
-            moving_pieces=(from_piece,),
-            is_capturing_move=False if board[to_position] is None else True,
-            allows_en_passant=_get_allows_en_passant_flag(
-                piece_moves=(move_candidate,), moving_pieces=(from_piece,)
-            ),
-        )
+        potential_move = create_regular_move(board=board, move_candidate=move_candidate)
         if is_valid_move(board=board, move=potential_move):
             yield potential_move
 
 
+def create_regular_move(
+    board: Board, move_candidate: tuple[tuple[int, int], tuple[int, int]]
+) -> Move:
+    """Create the regular move of a move candidate without validating it.
+
+    Args:
+        board: Board on which the move would be made.
+        move_candidate: Initial and destination tile of the moving piece.
+
+    Returns: The move, which may leave the moving player's king in check.
+    """
+    from_position, to_position = move_candidate
+    from_piece = board[from_position]
+    if from_piece is None:
+        raise Exception(f"Piece at {from_position} unexpectedly None.")
+    return Move(
+        type=REGULAR_MOVE,
+        piece_moves=(move_candidate,),
+        moving_pieces=(from_piece,),
+        is_capturing_move=False if board[to_position] is None else True,
+        allows_en_passant=_get_allows_en_passant_flag(
+            piece_moves=(move_candidate,), moving_pieces=(from_piece,)
+        ),
+    )
+
+
 def _get_allows_en_passant_flag(
     moving_pieces: tuple[Piece],
     piece_moves: tuple[tuple[tuple[int, int], tuple[int, int]]],
@@ -0,0 +1,916 @@
+from __future__ import annotations
+
+import math
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import AbstractSet, Callable, Generator, Iterable, Optional, Sequence
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.chess import FIFTY_MOVE_RULE_HALFMOVES, is_irreversible_move
+from utahchess.legal_moves import (
+    get_algebraic_identifier,
+    get_legal_moves,
+    is_legal_move,
+)
+from utahchess.minimax import (
+    CHECKMATE_VALUE,
+    DRAW_VALUE,
+    ChildNode,
+    Node,
+    SearchAborted,
+    create_children_from_parent,
+    evaluate_node,
+    get_node_value,
+    get_quiescence_value,
+    minimax,
+)
+from utahchess.move import Move, make_move
+from utahchess.move_picker import KillerMoves, pick_moves
+from utahchess.opening_book import OpeningBook
+from utahchess.search_stats import SearchStats
+from utahchess.tablebase import (
+    DRAW,
+    MAX_PLIES_TO_MATE,
+    WIN,
+    TablebaseResult,
+    Tablebases,
+)
+from utahchess.time_manager import TimeManager
+from utahchess.transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+from utahchess.zobrist import get_position_hash
+
+MAX_DEPTH = 64
+# Depth of the results of "iterative_deepening" that were found in an opening book
+BOOK_DEPTH = 0
+# Value of a position a tablebase knows to be won, less the plies to checkmate from
+# the root node, so shorter mates are preferred
+TABLEBASE_WIN_VALUE = 1000.0
+# Half widths in pawns of the windows around the expected value of an iteration,
+# tried in turn on the side the value falls outside of before an unbounded window
+ASPIRATION_WINDOWS = (0.5, 2.0)
+# Width of the windows of "mtdf". Values of the value function are multiples of a
+# quarter pawn, so a narrower window decides between two values in one search.
+MTDF_WINDOW = 0.125
+
+
+@dataclass(frozen=True)
+class SearchInfo:
+    """Result of one completed iteration of "iterative_deepening".
+
+    Attributes:
+        depth: Depth of the iteration.
+        value: Value of the best move to the player to move at the root.
+        best_move_identifier: Algebraic identifier of the best move.
+        best_move: The best move.
+        nodes: Number of nodes visited since the search started.
+        elapsed_seconds: Time since the search started.
+        principal_variation: Algebraic identifiers of the moves of the expected
+            line, the best move followed by the best replies the transposition
+            table remembers. Only the best move without a table.
+        principal_variation_moves: The moves of the expected line.
+    """
+
+    depth: int
+    value: float
+    best_move_identifier: str
+    best_move: Move
+    nodes: int
+    elapsed_seconds: float
+    principal_variation: tuple[str, ...]
+    principal_variation_moves: tuple[Move, ...]
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+@dataclass(frozen=True)
+class AnalysisLine:
+    """One of the best lines of the root found by "multipv_search".
+
+    Attributes:
+        depth: Depth the line was searched to.
+        rank: Rank of the line, one for the best line.
+        value: Value of the line to the player to move at the root.
+        best_move: First move of the line.
+        principal_variation: Algebraic identifiers of the moves of the line, the
+            first move followed by the best replies the transposition table
+            remembers.
+    """
+
+    depth: int
+    rank: int
+    value: float
+    best_move: Move
+    principal_variation: tuple[str, ...]
+
+
+def iterative_deepening(
+    board: Board,
+    current_player: str,
+    last_move: Optional[Move] = None,
+    max_depth: int = MAX_DEPTH,
+    should_stop: Optional[Callable[[], bool]] = None,
+    on_iteration: Optional[Callable[[SearchInfo], None]] = None,
+    stats: Optional[SearchStats] = None,
+    previous_position_hashes: Sequence[int] = (),
+    halfmove_clock: int = 0,
+    aspiration_windows: Sequence[float] = (),
+    quiescence: bool = False,
+    book: Optional[OpeningBook] = None,
+    tablebases: Optional[Tablebases] = None,
+    table: Optional[TranspositionTable] = None,
+    time_manager: Optional[TimeManager] = None,
+) -> Optional[SearchInfo]:
+    """Search with increasing depth until the maximum depth or until stopped.
+
+    Every iteration searches the best move of the previous one first. An iteration
+    that is aborted by "should_stop" is discarded, the result of the last completed
+    one is returned. The search ends early once a forced checkmate is found.
+
+    Positions that repeat a position of the game or of the search since the last
+    irreversible move, and positions drawn by the fifty-move rule, are scored as
+    draws and not searched any deeper. So are positions found in a tablebase, which
+    are scored by their exact result, see "TABLEBASE_WIN_VALUE". If the board itself
+    is in a tablebase, the search ends after the first iteration.
+
+    With a transposition table, every node searches the best move the table
+    remembers first, e.g. from an earlier search of the same game, and the best move
+    of every expanded node is stored. Values of positions depend on the moves that
+    led to them through the draw detection, so stored values do not end searches.
+
+    With "aspiration_windows", e.g. "ASPIRATION_WINDOWS", the search starts from the
+    third iteration on with a narrow window around the value of the iteration two
+    plies shallower. That iteration ended on a move of the same player, so its value
+    is closer than the one of the previous iteration. Values outside of the window
+    are only bounds, so that side of the window is widened and the depth searched
+    again. Without stored values to end the searches of known positions early, the
+    re-searches cost more than the narrow windows save, so this is off by default.
+
+    Args:
+        board: Board to search a move on.
+        current_player: Player to find a move for.
+        last_move: Last move that was executed on the board.
+        max_depth: Depth of the last iteration.
+        should_stop: Function called before visiting each node. The search stops as
+            soon as it returns True.
+        on_iteration: Function called with the result of each completed iteration.
+        stats: Statistics to fill in during the search.
+        previous_position_hashes: Zobrist hashes of the positions of the game before
+            the board since the last irreversible move, oldest first, see
+            "ChessGame.get_reversible_position_hashes".
+        halfmove_clock: Number of halfmoves since the last capture or pawn move.
+        aspiration_windows: Half widths of the windows around the expected value of
+            an iteration, from narrowest to widest. After the widest one that
+            side of the window is unbounded. Every iteration searches with an
+            unbounded window if empty, the default.
+        quiescence: Whether to resolve pending captures at the maximum depth before
+            evaluating, see "get_quiescence_value". Slower per node, but does not
+            misjudge positions in the middle of an exchange.
+        book: Opening book to look the position up in before searching. A move of
+            the book is returned without searching as a result of depth "BOOK_DEPTH"
+            and value zero.
+        tablebases: Endgame tablebases to look positions up in, see
+            "utahchess.tablebase".
+        table: Transposition table to order moves by and fill, see above. Pass the
+            same table to the searches of a game to reuse their results.
+        time_manager: Time limits of the search under a chess clock. Every
+            completed iteration is reported to it, the next one only starts if it
+            agrees, and an iteration is aborted once its time is up.
+
+    Returns: The result of the deepest completed iteration, or None if no iteration
+        completed or there is no legal move.
+    """
+    stats = SearchStats() if stats is None else stats
+    if book is not None:
+        book_move = book.choose_move(
+            board=board, current_player=current_player, last_move=last_move
+        )
+        if book_move is not None:
+            book_move_identifier = get_algebraic_identifier(
+                board=board,
+                move=book_move,
+                current_player=current_player,
+                last_move=last_move,
+            )
+            book_info = SearchInfo(
+                depth=BOOK_DEPTH,
+                value=0.0,
+                best_move_identifier=book_move_identifier,
+                best_move=book_move,
+                nodes=0,
+                elapsed_seconds=stats.elapsed_seconds,
+                principal_variation=(book_move_identifier,),
+                principal_variation_moves=(book_move,),
+            )
+            if on_iteration is not None:
+                on_iteration(book_info)
+            return book_info
+    root_node = Node(
+        name="root",
+        parent=None,
+        board=board,
+        last_move=last_move,
+        player=current_player,
+        position_hash=get_position_hash(
+            board=board, current_player=current_player, last_move=last_move
+        ),
+        halfmove_clock=halfmove_clock,
+        is_draw=False,
+        tablebase_result=None,
+    )
+    is_in_tablebase = (
+        tablebases is not None
+        and tablebases.probe(board=board, current_player=current_player) is not None
+    )
+    if time_manager is not None:
+        should_stop = partial(
+            _should_stop_or_time_up,
+            should_stop=should_stop,
+            time_manager=time_manager,
+        )
+        num_legal_moves = sum(
+            1
+            for _ in get_legal_moves(
+                board=board, current_player=current_player, last_move=last_move
+            )
+        )
+    result: Optional[SearchInfo] = None
+    values: list[float] = []
+    for depth in range(1, max_depth + 1):
+        try:
+            best_node, value = _search_with_aspiration_windows(
+                root_node=root_node,
+                value_function=partial(
+                    _get_node_value,
+                    player=current_player,
+                    value_function=(
+                        get_quiescence_value if quiescence else get_node_value
+                    ),
+                ),
+                get_children=partial(
+                    _create_children_best_move_first,
+                    root_node=root_node,
+                    best_move=None if result is None else result.best_move,
+                    previous_position_hashes=previous_position_hashes,
+                    tablebases=tablebases,
+                    table=table,
+                    stats=stats,
+                ),
+                depth=depth,
+                expected_value=values[-2] if len(values) >= 2 else None,
+                aspiration_windows=aspiration_windows,
+                stats=stats,
+                should_stop=should_stop,
+                table=table,
+            )
+        except SearchAborted:
+            break
+        if best_node is None:
+            break  # No legal moves
+        values.append(value)
+        principal_variation_moves = (
+            (best_node.last_move,)
+            if table is None
+            else _get_principal_variation(
+                board=board,
+                player=current_player,
+                last_move=last_move,
+                first_move=best_node.last_move,
+                table=table,
+                max_length=depth,
+            )
+        )
+        result = SearchInfo(
+            depth=depth,
+            value=value,
+            best_move_identifier=best_node.name,
+            best_move=best_node.last_move,
+            nodes=stats.nodes,
+            elapsed_seconds=stats.elapsed_seconds,
+            principal_variation=_get_algebraic_identifiers(
+                board=board,
+                player=current_player,
+                last_move=last_move,
+                moves=principal_variation_moves,
+            ),
+            principal_variation_moves=principal_variation_moves,
+        )
+        if on_iteration is not None:
+            on_iteration(result)
+        if abs(value) == CHECKMATE_VALUE or is_in_tablebase:
+            break
+        if time_manager is not None:
+            time_manager.on_iteration(
+                best_move=result.best_move,
+                value=value,
+                num_legal_moves=num_legal_moves,
+            )
+            if not time_manager.should_start_iteration():
+                break
+    return result
+
+
+def _should_stop_or_time_up(
+    should_stop: Optional[Callable[[], bool]], time_manager: TimeManager
+) -> bool:
+    return (should_stop is not None and should_stop()) or time_manager.is_time_up()
+
+
+def mtdf(
+    board: Board,
+    player: str,
+    first_guess: float,
+    depth: int,
+    last_move: Optional[Move] = None,
+    table: Optional[TranspositionTable] = None,
+    stats: Optional[SearchStats] = None,
+    tablebases: Optional[Tablebases] = None,
+    excluded_moves: AbstractSet[Move] = frozenset(),
+    killer_moves: Optional[KillerMoves] = None,
+) -> tuple[Optional[Node], float]:
+    """Get the best move and its value with the MTD(f) algorithm.
+
+    Instead of one search with a full window, MTD(f) converges on the minimax value
+    through searches with windows of width "MTDF_WINDOW" around a guess. Each of
+    them only proves whether the value is above or below the guess, so it prunes
+    far more than a full window search. A transposition table keeps the results of
+    earlier searches, so the same tree is not searched from scratch every time.
+    For more information see here:
+        https://people.csail.mit.edu/plaat/mtdf.html
+
+    Unlike "iterative_deepening", repetitions and the fifty-move rule are not scored
+    as draws, since results of the transposition table must not depend on the
+    moves that led to a position.
+
+    Args:
+        board: Board to search a move on.
+        player: Player to find a move for.
+        first_guess: Guess of the value, e.g. the value of the previous depth. The
+            closer it is, the fewer searches are needed.
+        depth: How deep to search.
+        last_move: Last move that was executed on the board.
+        table: Transposition table to use and fill. Pass the same table to searches
+            of consecutive depths or moves to reuse their results. A new table if
+            None.
+        stats: Statistics to fill in during the search. Nothing is recorded if None.
+        tablebases: Endgame tablebases to look positions below the root node up in.
+            Positions found in them are not searched any deeper.
+        excluded_moves: Moves of the root not to search, e.g. the best moves of the
+            lines found before by "multipv_search". The result of the root is not
+            stored in the table if any are excluded.
+        killer_moves: Killer moves to use and fill, e.g. of an earlier search of the
+            same position. New ones if None.
+
+    Returns: The child node of the best move and its value to the player. The child
+        is None if there is no legal move that is not excluded.
+    """
+    table = TranspositionTable() if table is None else table
+    killer_moves = KillerMoves() if killer_moves is None else killer_moves
+    root_node = Node(
+        name="root",
+        parent=None,
+        board=board,
+        last_move=last_move,
+        player=player,
+        position_hash=get_position_hash(
+            board=board, current_player=player, last_move=last_move
+        ),
+    )
+    start = time.perf_counter()
+    best_node: Optional[Node] = None
+    value = first_guess
+    lower_bound, upper_bound = -float("inf"), float("inf")
+    try:
+        while lower_bound < upper_bound:
+            beta = max(value, lower_bound + MTDF_WINDOW, -sys.float_info.max)
+            alpha = beta - MTDF_WINDOW
+            if alpha == beta:
+                alpha = -float("inf")  # No finite value is below beta
+            node, value = _alpha_beta_with_memory(
+                node=root_node,
+                depth=depth,
+                alpha=alpha,
+                beta=beta,
+                table=table,
+                killer_moves=killer_moves,
+                stats=stats,
+                tablebases=tablebases,
+                excluded_moves=excluded_moves,
+                ply=0,
+            )
+            if node is not None:
+                best_node = node
+            if value < beta:
+                upper_bound = value
+            else:
+                lower_bound = value
+    finally:
+        if stats is not None:
+            stats.elapsed_seconds += time.perf_counter() - start
+    return best_node, value
+
+
+def multipv_search(
+    board: Board,
+    player: str,
+    depth: int,
+    multipv: int,
+    last_move: Optional[Move] = None,
+    table: Optional[TranspositionTable] = None,
+    stats: Optional[SearchStats] = None,
+    tablebases: Optional[Tablebases] = None,
+    on_iteration: Optional[Callable[[list[AnalysisLine]], None]] = None,
+) -> list[AnalysisLine]:
+    """Get the best moves of a board with their values and principal variations.
+
+    Every depth up to the given one is searched in turn. At each depth the lines are
+    found one after another by "mtdf", each searching the root without the first
+    moves of the lines found before. A line starts from a window around its value at
+    the previous depth, or around the value of the line before it. All lines and
+    depths share the transposition table and the killer moves, so searching the
+    root again for every line mostly reuses stored results.
+
+    Args:
+        board: Board to analyse.
+        player: Player to move.
+        depth: Depth of the last iteration.
+        multipv: Number of lines to find.
+        last_move: Last move that was executed on the board.
+        table: Transposition table to use and fill. A new table if None.
+        stats: Statistics to fill in during the search. Nothing is recorded if None.
+        tablebases: Endgame tablebases to look positions below the root node up in.
+        on_iteration: Function called with the lines of each completed depth.
+
+    Returns: The lines of the last depth, best first. Fewer than "multipv" if there
+        are fewer legal moves.
+
+    Raises:
+        ValueError: If fewer than one line is requested.
+    """
+    if multipv < 1:
+        raise ValueError("A multi-PV search needs at least one line.")
+    table = TranspositionTable() if table is None else table
+    killer_moves = KillerMoves()
+    lines: list[AnalysisLine] = []
+    for iteration_depth in range(1, depth + 1):
+        previous_values = [line.value for line in lines]
+        lines = []
+        for line_index in range(multipv):
+            if line_index < len(previous_values):
+                first_guess = previous_values[line_index]
+            else:
+                first_guess = lines[-1].value if lines else 0.0
+            best_node, value = mtdf(
+                board=board,
+                player=player,
+                first_guess=first_guess,
+                depth=iteration_depth,
+                last_move=last_move,
+                table=table,
+                stats=stats,
+                tablebases=tablebases,
+                excluded_moves=frozenset(line.best_move for line in lines),
+                killer_moves=killer_moves,
+            )
+            if best_node is None:
+                break  # Every legal move has a line
+            lines.append(
+                AnalysisLine(
+                    depth=iteration_depth,
+                    rank=line_index + 1,
+                    value=value,
+                    best_move=best_node.last_move,
+                    principal_variation=_get_algebraic_identifiers(
+                        board=board,
+                        player=player,
+                        last_move=last_move,
+                        moves=_get_principal_variation(
+                            board=board,
+                            player=player,
+                            last_move=last_move,
+                            first_move=best_node.last_move,
+                            table=table,
+                            max_length=iteration_depth,
+                        ),
+                    ),
+                )
+            )
+        if on_iteration is not None:
+            on_iteration(lines)
+    return lines
+
+
+def get_ponder_move(
+    board: Board,
+    current_player: str,
+    best_move: Move,
+    table: TranspositionTable,
+    last_move: Optional[Move] = None,
+) -> Optional[Move]:
+    """Get the expected reply to a move, i.e. the move to ponder on.
+
+    Args:
+        board: Board the move is played on.
+        current_player: Player making the move.
+        best_move: The move, e.g. the best move of a search.
+        table: Transposition table of the search, see "iterative_deepening".
+        last_move: Last move that was executed on the board.
+
+    Returns: The best reply the table remembers, None if it remembers none or the
+        remembered one is not legal, e.g. for a different position with the same
+        hash.
+    """
+    board = make_move(board=board, move=best_move)
+    enemy = WHITE if current_player == BLACK else BLACK
+    entry = table.get(
+        get_position_hash(board=board, current_player=enemy, last_move=best_move)
+    )
+    if (
+        entry is None
+        or entry.best_move is None
+        or not is_legal_move(
+            board=board, move=entry.best_move, current_player=enemy, last_move=best_move
+        )
+    ):
+        return None
+    return entry.best_move
+
+
+def _get_principal_variation(
+    board: Board,
+    player: str,
+    last_move: Optional[Move],
+    first_move: Move,
+    table: TranspositionTable,
+    max_length: int,
+) -> tuple[Move, ...]:
+    """Follow the best moves a transposition table remembers after a root move.
+
+    The line ends at a position without a remembered move, at an illegal move, e.g.
+    of a different position with the same hash, or at a repeated position.
+    """
+    moves: list[Move] = []
+    position_hashes = set()
+    move: Optional[Move] = first_move
+    while move is not None and len(moves) < max_length:
+        moves.append(move)
+        board = make_move(board=board, move=move)
+        player = WHITE if player == BLACK else BLACK
+        last_move = move
+        position_hash = get_position_hash(
+            board=board, current_player=player, last_move=last_move
+        )
+        entry = table.get(position_hash)
+        if position_hash in position_hashes or entry is None:
+            break
+        position_hashes.add(position_hash)
+        move = entry.best_move
+        if move is not None and not is_legal_move(
+            board=board, move=move, current_player=player, last_move=last_move
+        ):
+            break
+    return tuple(moves)
+
+
+def _get_algebraic_identifiers(
+    board: Board, player: str, last_move: Optional[Move], moves: Iterable[Move]
+) -> tuple[str, ...]:
+    """Get the algebraic identifiers of a line of moves played from a board."""
+    identifiers: list[str] = []
+    for move in moves:
+        identifiers.append(
+            get_algebraic_identifier(
+                board=board, move=move, current_player=player, last_move=last_move
+            )
+        )
+        board = make_move(board=board, move=move)
+        player = WHITE if player == BLACK else BLACK
+        last_move = move
+    return tuple(identifiers)
+
+
+def _alpha_beta_with_memory(
+    node: Node,
+    depth: int,
+    alpha: float,
+    beta: float,
+    table: TranspositionTable,
+    killer_moves: KillerMoves,
+    stats: Optional[SearchStats],
+    tablebases: Optional[Tablebases],
+    ply: int,
+    excluded_moves: AbstractSet[Move] = frozenset(),
+) -> tuple[Optional[Node], float]:
+    """Search a node with alpha-beta pruning and a transposition table.
+
+    Moves are generated in stages by "pick_moves", starting with the best move the
+    transposition table remembers and the killer moves of the ply.
+
+    Values are always to the player to move at the node, so results can be stored
+    and reused regardless of which player the search is for. Stored results only
+    end the search of a node below the root node, as the root node has to return
+    its best child. Results of tablebases are exact, so they end the search of a
+    node before the transposition table is consulted. Excluded moves are only
+    skipped at the root node.
+    """
+    if stats is not None:
+        stats.record_node(ply=ply)
+    if tablebases is not None and ply > 0:
+        tablebase_result = tablebases.probe(
+            board=node.board, current_player=node.player
+        )
+        if tablebase_result is not None:
+            if stats is not None:
+                stats.tablebase_hits += 1
+            return None, _get_tablebase_value(result=tablebase_result, ply=ply)
+    entry = table.get(node.position_hash)
+    if entry is not None and entry.depth >= depth and ply > 0:
+        if stats is not None:
+            stats.tt_hits += 1
+        if (
+            entry.bound == EXACT
+            or (entry.bound == LOWER_BOUND and entry.value >= beta)
+            or (entry.bound == UPPER_BOUND and entry.value <= alpha)
+        ):
+            return None, entry.value
+
+    best_node: Optional[Node] = None
+    best_value = -float("inf")
+    if depth > 0:
+        if stats is not None:
+            stats.expanded_nodes += 1
+        moves = pick_moves(
+            board=node.board,
+            current_player=node.player,
+            last_move=node.last_move,
+            table_move=None if entry is None else entry.best_move,
+            killer_moves=killer_moves.get(ply=ply),
+        )
+        if ply == 0 and excluded_moves:
+            moves = (move for move in moves if move not in excluded_moves)
+        window_alpha = alpha
+        for move_index, move in enumerate(moves):
+            child_node = _create_child_node(parent_node=node, move=move, stats=stats)
+            _, child_value = _alpha_beta_with_memory(
+                node=child_node,
+                depth=depth - 1,
+                alpha=-beta,
+                beta=-window_alpha,
+                table=table,
+                killer_moves=killer_moves,
+                stats=stats,
+                tablebases=tablebases,
+                ply=ply + 1,
+            )
+            if -child_value > best_value or best_node is None:
+                best_value = -child_value
+                best_node = child_node
+            window_alpha = max(window_alpha, best_value)
+            if window_alpha >= beta:
+                killer_moves.add(ply=ply, move=move)
+                if stats is not None:
+                    stats.record_cutoff(move_index=move_index)
+                break
+    # Values of the root without some of its moves are not values of the position
+    is_restricted_root = ply == 0 and bool(excluded_moves)
+    if best_node is None:
+        # Maximum depth or no children, e.g. checkmate or stalemate
+        best_value = evaluate_node(
+            node=node,
+            value_function=partial(get_node_value, player=node.player),
+            stats=stats,
+        )
+        if not is_restricted_root:
+            table.store(
+                position_hash=node.position_hash,
+                depth=depth,
+                value=best_value,
+                bound=EXACT,
+            )
+        return None, best_value
+
+    if best_value <= alpha:
+        bound = UPPER_BOUND
+    elif best_value >= beta:
+        bound = LOWER_BOUND
+    else:
+        bound = EXACT
+    if not is_restricted_root:
+        table.store(
+            position_hash=node.position_hash,
+            depth=depth,
+            value=best_value,
+            bound=bound,
+            best_move=best_node.last_move,
+        )
+    return best_node, best_value
+
+
+def _create_child_node(
+    parent_node: Node, move: Move, stats: Optional[SearchStats]
+) -> Node:
+    """Create the node after a legal move with the hash of its position."""
+    child_node = ChildNode(parent=parent_node, last_move=move, stats=stats)
+    child_node.position_hash = get_position_hash(  # type: ignore
+        board=child_node.board, current_player=child_node.player, last_move=move
+    )
+    return child_node
+
+
+def _search_best_move_first(
+    children: Iterable[Node], best_move: Move
+) -> Generator[Node, None, None]:
+    other_children = []
+    for child_node in children:
+        if child_node.last_move == best_move:
+            yield child_node
+        else:
+            other_children.append(child_node)
+    yield from other_children
+
+
+def _search_with_aspiration_windows(
+    root_node: Node,
+    value_function: Callable[..., float],
+    get_children: Callable[..., Iterable[Node]],
+    depth: int,
+    expected_value: Optional[float],
+    aspiration_windows: Sequence[float],
+    stats: SearchStats,
+    should_stop: Optional[Callable[[], bool]],
+    table: Optional[TranspositionTable],
+) -> tuple[Optional[Node], float]:
+    """Search one depth with a window around its expected value.
+
+    As "minimax" keeps the best value it saw, a value at or below alpha is an upper
+    bound and a value at or above beta is a lower bound of the true value. Only the
+    side of the window the value fell outside of is widened for the next search.
+    """
+    if expected_value is None or not math.isfinite(expected_value):
+        aspiration_windows = ()
+    lower_window_index = upper_window_index = 0
+    while True:
+        alpha = (
+            expected_value - aspiration_windows[lower_window_index]  # type: ignore
+            if lower_window_index < len(aspiration_windows)
+            else -float("inf")
+        )
+        beta = (
+            expected_value + aspiration_windows[upper_window_index]  # type: ignore
+            if upper_window_index < len(aspiration_windows)
+            else float("inf")
+        )
+        best_node, value = minimax(
+            parent_node=root_node,
+            value_function=value_function,
+            get_children=get_children,
+            depth=depth,
+            maximizing_player=True,
+            alpha=alpha,
+            beta=beta,
+            stats=stats,
+            should_stop=should_stop,
+            table=table,
+        )
+        if value <= alpha and alpha != -float("inf"):
+            lower_window_index += 1
+        elif value >= beta and beta != float("inf"):
+            upper_window_index += 1
+        else:
+            return best_node, value
+        stats.aspiration_researches += 1
+
+
+def get_tablebase_plies_to_mate(value: float) -> Optional[int]:
+    """Get the plies to checkmate from the root node of a value from a tablebase.
+
+    Returns: The plies to checkmate, None if the value is not one of a position won
+        or lost according to a tablebase.
+    """
+    if (
+        not math.isfinite(value)
+        or abs(value) < TABLEBASE_WIN_VALUE - MAX_DEPTH - MAX_PLIES_TO_MATE
+    ):
+        return None
+    return round(TABLEBASE_WIN_VALUE - abs(value))
+
+
+def _get_tablebase_value(result: TablebaseResult, ply: int) -> float:
+    """Get the value of a tablebase result to the player to move at a node."""
+    if result.outcome == DRAW:
+        return DRAW_VALUE
+    value = TABLEBASE_WIN_VALUE - ply - (result.plies_to_mate or 0)
+    return value if result.outcome == WIN else -value
+
+
+def _get_node_value(
+    node: Node, player: str, value_function: Callable[..., float]
+) -> float:
+    if node.is_draw:
+        return DRAW_VALUE
+    if node.tablebase_result is not None:
+        value = _get_tablebase_value(
+            result=node.tablebase_result, ply=_get_ply(node=node)
+        )
+        return value if node.player == player else -value
+    return value_function(node=node, player=player)
+
+
+def _get_ply(node: Node) -> int:
+    """Get the distance of a node from the root node."""
+    ply = 0
+    while node.parent is not None:
+        node = node.parent
+        ply += 1
+    return ply
+
+
+def _create_children_best_move_first(
+    parent_node: Node,
+    root_node: Node,
+    best_move: Optional[Move],
+    previous_position_hashes: Sequence[int],
+    tablebases: Optional[Tablebases],
+    table: Optional[TranspositionTable],
+    stats: SearchStats,
+) -> Generator[Node, None, None]:
+    """Create the children of a node, the best move of the root or table first.
+
+    Children are reordered before their positions are computed, so children that
+    are pruned stay cheap.
+    """
+    if parent_node.is_draw or parent_node.tablebase_result is not None:
+        return
+    if parent_node is not root_node or best_move is None:
+        entry = None if table is None else table.get(parent_node.position_hash)
+        best_move = None if entry is None else entry.best_move
+    children: Iterable[Node] = create_children_from_parent(parent_node=parent_node)
+    if best_move is not None:
+        children = _search_best_move_first(children=children, best_move=best_move)
+    for child_node in children:
+        yield _add_tablebase_result(
+            node=_add_draw_information(
+                node=child_node, previous_position_hashes=previous_position_hashes
+            ),
+            tablebases=tablebases,
+            stats=stats,
+        )
+
+
+def _add_draw_information(node: Node, previous_position_hashes: Sequence[int]) -> Node:
+    """Set the position hash, halfmove clock and whether a child node is a draw."""
+    node.position_hash = get_position_hash(  # type: ignore
+        board=node.board, current_player=node.player, last_move=node.last_move
+    )
+    node.halfmove_clock = (  # type: ignore
+        0
+        if is_irreversible_move(move=node.last_move)
+        else node.parent.halfmove_clock + 1  # type: ignore
+    )
+    node.is_draw = (  # type: ignore
+        node.halfmove_clock >= FIFTY_MOVE_RULE_HALFMOVES
+        or _is_repetition(node=node, previous_position_hashes=previous_position_hashes)
+    )
+    return node
+
+
+def _add_tablebase_result(
+    node: Node, tablebases: Optional[Tablebases], stats: SearchStats
+) -> Node:
+    """Set the result of a child node's position in the tablebases, None if unknown."""
+    node.tablebase_result = (  # type: ignore
+        None
+        if tablebases is None or node.is_draw
+        else tablebases.probe(board=node.board, current_player=node.player)
+    )
+    if node.tablebase_result is not None:
+        stats.tablebase_hits += 1
+    return node
+
+
+def _is_repetition(node: Node, previous_position_hashes: Sequence[int]) -> bool:
+    """Get whether a node's position occurred before since the last irreversible move.
+
+    Positions before the last capture or pawn move cannot repeat, so only the
+    ancestors within the halfmove clock and then the positions of the game before
+    the root node are compared.
+    """
+    plies_to_check = node.halfmove_clock
+    ancestor = node.parent
+    while ancestor is not None and plies_to_check > 0:
+        if ancestor.position_hash == node.position_hash:
+            return True
+        ancestor = ancestor.parent
+        plies_to_check -= 1
+    if plies_to_check <= 0:
+        return False
+    return node.position_hash in previous_position_hashes[-plies_to_check:]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SearchStats:
+    """Statistics a search fills in while it runs.
+
+    Pass an instance to "minimax" (and to "create_children_from_parent" for the
+    timing of move generation) to collect statistics. Searches without an instance
+    skip all bookkeeping, so the production path is not slowed down.
+
+    Attributes:
+        nodes_per_ply: Number of visited nodes per distance from the root node.
+        expanded_nodes: Number of nodes whose children were generated.
+        beta_cutoffs: Number of times the remaining children of a node were pruned.
+        cutoff_move_indices: Number of cutoffs per index of the child that caused
+            them. Good move ordering causes most cutoffs at index 0.
+        tt_hits: Number of positions found in a transposition table.
+        tablebase_hits: Number of positions found in endgame tablebases.
+        aspiration_researches: Number of times an iteration of "iterative_deepening"
+            was searched again because its value fell outside of the aspiration
+            window.
+        evaluation_calls: Number of calls to the value function.
+        move_generation_seconds: Time spent generating and ordering legal moves and
+            making child boards.
+        evaluation_seconds: Time spent in the value function.
+        san_seconds: Time spent computing algebraic identifiers of moves, including
+            the check and checkmate flags. Child nodes only compute them when their
+            name is requested.
+        elapsed_seconds: Total time spent searching.
+    """
+
+    nodes_per_ply: dict[int, int] = field(default_factory=dict)
+    expanded_nodes: int = 0
+    beta_cutoffs: int = 0
+    cutoff_move_indices: Counter[int] = field(default_factory=Counter)
+    tt_hits: int = 0
+    tablebase_hits: int = 0
+    aspiration_researches: int = 0
+    evaluation_calls: int = 0
+    move_generation_seconds: float = 0.0
+    evaluation_seconds: float = 0.0
+    san_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def nodes(self) -> int:
+        return sum(self.nodes_per_ply.values())
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def average_branching_factor(self) -> float:
+        """Get the average number of children of expanded nodes."""
+        if not self.expanded_nodes:
+            return 0.0
+        return (self.nodes - self.nodes_per_ply.get(0, 0)) / self.expanded_nodes
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Get the share of cutoffs caused by the first child of a node."""
+        if not self.beta_cutoffs:
+            return 0.0
+        return self.cutoff_move_indices[0] / self.beta_cutoffs
+
+    def record_node(self, ply: int) -> None:
+        self.nodes_per_ply[ply] = self.nodes_per_ply.get(ply, 0) + 1
+
+    def record_cutoff(self, move_index: int) -> None:
+        self.beta_cutoffs += 1
+        self.cutoff_move_indices[move_index] += 1
+
+    def to_dict(self) -> dict:
+        """Get all statistics, including derived ones, e.g. for a JSON report."""
+        return {
+            "nodes": self.nodes,
+            "nodes_per_ply": dict(sorted(self.nodes_per_ply.items())),
+            "nodes_per_second": self.nodes_per_second,
+            "average_branching_factor": self.average_branching_factor,
+            "beta_cutoffs": self.beta_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+            "cutoff_move_indices": dict(sorted(self.cutoff_move_indices.items())),
+            "tt_hits": self.tt_hits,
+            "tablebase_hits": self.tablebase_hits,
+            "aspiration_researches": self.aspiration_researches,
+            "evaluation_calls": self.evaluation_calls,
+            "move_generation_seconds": self.move_generation_seconds,
+            "evaluation_seconds": self.evaluation_seconds,
+            "san_seconds": self.san_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
@@ -0,0 +1,161 @@
+"""Static exchange evaluation (SEE) of captures.
+
+The static exchange evaluation of a capture is the material the capturing player
+wins if both players keep capturing on the target square with their least valuable
+piece, and either may stop capturing when that is better for them. It tells
+captures that win material from captures that lose it without searching them, e.g.
+a queen capturing a defended pawn.
+"""
+from __future__ import annotations
+
+from typing import AbstractSet, Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.move import Move, get_captured_pieces
+from utahchess.move_validation import SLIDING_ATTACKERS, STEPPING_ATTACKERS
+from utahchess.tile_movement_utils import is_in_bounds
+
+# Same as the values of the evaluation. Kings cannot be captured, so a king must
+# never take part in an exchange in which it could be recaptured.
+EXCHANGE_VALUES = {
+    "Pawn": 1,
+    "Knight": 3,
+    "Bishop": 3,
+    "Rook": 5,
+    "Queen": 9,
+    "King": 100,
+}
+
+
+def see(board: Board, move: Move) -> float:
+    """Get the static exchange evaluation of a move.
+
+    The pieces of both players attacking the target square are looked up outwards
+    from the square with the attack tables of "utahchess.move_validation". Pieces
+    that already captured are taken off their square, so sliding pieces behind them
+    join the exchange. Pins are not considered.
+
+    Args:
+        board: Board on which the move would be made.
+        move: Move to evaluate, usually a capture.
+
+    Returns: The material the player making the move wins, negative if they lose
+        material. Zero for moves that capture nothing and cannot be recaptured.
+    """
+    from_position, to_position = move.piece_moves[0]
+    moving_piece = board[from_position]
+    if moving_piece is None:
+        raise ValueError(f"There is no piece to move on {from_position}.")
+    gains = [
+        float(
+            sum(
+                EXCHANGE_VALUES[piece.piece_type]
+                for piece in get_captured_pieces(board=board, move=move)
+            )
+        )
+    ]
+    removed_positions = {from_position, *move.pieces_to_delete}
+    value_on_square = EXCHANGE_VALUES[moving_piece.piece_type]
+    capturing_player = WHITE if moving_piece.color == BLACK else BLACK
+    while True:
+        attacker_position = get_least_valuable_attacker(
+            board=board,
+            position=to_position,
+            attacking_player=capturing_player,
+            removed_positions=removed_positions,
+        )
+        if attacker_position is None:
+            break
+        gains.append(value_on_square - gains[-1])
+        value_on_square = EXCHANGE_VALUES[
+            board[attacker_position].piece_type  # type: ignore
+        ]
+        removed_positions.add(attacker_position)
+        capturing_player = WHITE if capturing_player == BLACK else BLACK
+    # Going backwards, every player only captures if that is better than stopping
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+
+def get_least_valuable_attacker(
+    board: Board,
+    position: tuple[int, int],
+    attacking_player: str,
+    removed_positions: AbstractSet[tuple[int, int]] = frozenset(),
+) -> Optional[tuple[int, int]]:
+    """Get the position of the least valuable piece attacking a position.
+
+    Args:
+        board: Board on which to look for attackers.
+        position: Position that is possibly attacked.
+        attacking_player: Player whose pieces are possibly attacking.
+        removed_positions: Positions whose pieces are treated as if they were not on
+            the board.
+
+    Returns: Position of the least valuable attacker, None if there is none.
+    """
+    x, y = position
+    attackers: list[tuple[int, tuple[int, int]]] = []
+    # Pawns move towards lower y indices for white and capture diagonally
+    pawn_y = y + 1 if attacking_player == WHITE else y - 1
+    for pawn_x in (x - 1, x + 1):
+        _add_attacker(
+            attackers=attackers,
+            board=board,
+            position=(pawn_x, pawn_y),
+            attacking_player=attacking_player,
+            piece_types=("Pawn",),
+            removed_positions=removed_positions,
+        )
+        if attackers:
+            return attackers[0][1]
+
+    for movement_vectors, piece_types in STEPPING_ATTACKERS:
+        for x_offset, y_offset in movement_vectors:
+            _add_attacker(
+                attackers=attackers,
+                board=board,
+                position=(x + x_offset, y + y_offset),
+                attacking_player=attacking_player,
+                piece_types=piece_types,
+                removed_positions=removed_positions,
+            )
+
+    for movement_vectors, piece_types in SLIDING_ATTACKERS:
+        for x_offset, y_offset in movement_vectors:
+            next_tile = (x + x_offset, y + y_offset)
+            while is_in_bounds(position=next_tile) and (
+                board[next_tile] is None or next_tile in removed_positions
+            ):
+                next_tile = (next_tile[0] + x_offset, next_tile[1] + y_offset)
+            _add_attacker(
+                attackers=attackers,
+                board=board,
+                position=next_tile,
+                attacking_player=attacking_player,
+                piece_types=piece_types,
+                removed_positions=removed_positions,
+            )
+    return min(attackers)[1] if attackers else None
+
+
+def _add_attacker(
+    attackers: list[tuple[int, tuple[int, int]]],
+    board: Board,
+    position: tuple[int, int],
+    attacking_player: str,
+    piece_types: tuple[str, ...],
+    removed_positions: AbstractSet[tuple[int, int]],
+) -> None:
+    """Add the value and position of a piece of the attacking player and given types."""
+    if not is_in_bounds(position=position) or position in removed_positions:
+        return
+    piece = board[position]
+    if (
+        piece is not None
+        and piece.color == attacking_player
+        and piece.piece_type in piece_types
+    ):
+        attackers.append((EXCHANGE_VALUES[piece.piece_type], position))
@@ -0,0 +1,628 @@
+"""Endgame tablebases with the distance to checkmate of small endings.
+
+A tablebase knows the exact result of every position of a material, e.g. king and
+queen against king (KQK): whether the player to move wins, loses or draws with best
+play of both players, and in how many plies the game ends in checkmate. Tables are
+generated by retrograde analysis with the engine's own move generator. Starting
+from the checkmates, positions are resolved backwards one ply at a time: a position
+is won once one of its moves leads to a lost position and lost once all of its
+moves lead to won positions. Positions that are never resolved are draws.
+
+A table is a file of one byte per position, indexed by a perfect hash of the
+squares of the pieces and the player to move. Mirror images of a position share an
+entry, so the stronger player's king is only indexed on the ten squares of the
+triangle a1-d1-d4, or on files a to d in tables with pawns. The stronger player is
+always white in a table, positions in which black is stronger are looked up with
+flipped ranks and colors.
+
+Generate tables with:
+
+    python -m utahchess.tablebase tablebases KQK KRK
+
+The engine does not support promotions, so a pawn on the last rank stays a pawn and
+every KPK position is a draw.
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from itertools import product
+from typing import Iterable, Optional, Sequence
+
+from utahchess import BLACK, WHITE
+from utahchess.board import NO_RANKS_AND_FILES, Board
+from utahchess.move_candidates import get_all_move_candidates, get_move_candidates
+from utahchess.move_validation import is_check, is_valid_move
+from utahchess.piece import Bishop, King, Knight, Pawn, Piece, Queen, Rook
+from utahchess.regular_move import create_regular_move
+
+MAGIC = b"UTAHTB01"
+# The material of a table follows the magic, padded with spaces
+MATERIAL_SIZE = 8
+HEADER_SIZE = len(MAGIC) + MATERIAL_SIZE
+
+WIN = "win"
+LOSS = "loss"
+DRAW = "draw"
+
+# Pieces of the stronger player besides their king, in the order they are indexed
+MATERIALS = {
+    "KQK": ("Queen",),
+    "KRK": ("Rook",),
+    "KPK": ("Pawn",),
+    "KBNK": ("Bishop", "Knight"),
+}
+MAX_PIECES = max(len(piece_types) for piece_types in MATERIALS.values()) + 2
+
+PIECE_LETTERS = {"Queen": "Q", "Rook": "R", "Bishop": "B", "Knight": "N", "Pawn": "P"}
+PIECE_CLASSES = {
+    "King": King,
+    "Queen": Queen,
+    "Rook": Rook,
+    "Bishop": Bishop,
+    "Knight": Knight,
+    "Pawn": Pawn,
+}
+
+# Entries of drawn positions, of lost and won ones are the plies to mate plus one
+DRAW_ENTRY = 0
+# Entry of indices of illegal positions and of positions stored as a mirror image
+INVALID_ENTRY = 255
+MAX_PLIES_TO_MATE = INVALID_ENTRY - 2
+
+NUM_SQUARES = NO_RANKS_AND_FILES * NO_RANKS_AND_FILES
+# White pawns move towards lower y indices and start on y index 6, i.e. rank 2
+PAWN_START_Y = 6
+
+# Players by side to move of the index, the stronger player is always white
+_COLORS = (WHITE, BLACK)
+# Successor of a capture, which leaves too little material to checkmate
+_CAPTURE = -1
+
+
+@dataclass(frozen=True)
+class TablebaseResult:
+    """Exact result of a position with best play of both players.
+
+    Attributes:
+        outcome: WIN, LOSS or DRAW for the player to move.
+        plies_to_mate: Number of plies until checkmate, zero if the player to move is
+            checkmated. None for draws.
+    """
+
+    outcome: str
+    plies_to_mate: Optional[int]
+
+
+class Tablebase:
+    """Table of one material read from a file written by "write_table".
+
+    Use it as a context manager or call "close" to unmap the file.
+
+    Args:
+        path: Path of the table.
+
+    Raises:
+        ValueError: If the file is not a tablebase.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        material = (
+            self._mapped_file[len(MAGIC) : HEADER_SIZE]
+            .decode("ascii", errors="replace")
+            .strip()
+        )
+        if (
+            self._mapped_file[: len(MAGIC)] != MAGIC
+            or material not in MATERIALS
+            or len(self._mapped_file) != HEADER_SIZE + _LAYOUTS[material].size
+        ):
+            self._mapped_file.close()
+            raise ValueError(f"File '{path}' is not a tablebase.")
+        self.material = material
+        self._layout = _LAYOUTS[material]
+
+    def __len__(self) -> int:
+        return self._layout.size
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mapped_file.close()
+
+    def probe(self, board: Board, current_player: str) -> Optional[TablebaseResult]:
+        """Look up the result of a position.
+
+        Args:
+            board: Board of the position.
+            current_player: Player to move.
+
+        Returns: The exact result, None if the position has a different material, a
+            player can still castle or the position is illegal.
+        """
+        table_position = _get_table_position(board=board, current_player=current_player)
+        if table_position is None or table_position[0] != self.material:
+            return None
+        _, squares, side = table_position
+        return self._get_result(squares=squares, side=side)
+
+    def _get_result(
+        self, squares: tuple[int, ...], side: int
+    ) -> Optional[TablebaseResult]:
+        entry = self._mapped_file[
+            HEADER_SIZE + self._layout.get_index(squares=squares, side=side)
+        ]
+        if entry == INVALID_ENTRY:
+            return None
+        if entry == DRAW_ENTRY:
+            return TablebaseResult(outcome=DRAW, plies_to_mate=None)
+        plies_to_mate = entry - 1
+        # The player who mates makes the last move
+        return TablebaseResult(
+            outcome=WIN if plies_to_mate % 2 else LOSS, plies_to_mate=plies_to_mate
+        )
+
+
+class Tablebases:
+    """Tables of all materials found in a directory, see "get_table_path".
+
+    Use it as a context manager or call "close" to unmap the files.
+
+    Args:
+        directory: Directory of the tables.
+
+    Raises:
+        ValueError: If a file of a material is not a tablebase.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._tables: dict[str, Tablebase] = {}
+        for material in MATERIALS:
+            path = get_table_path(directory=directory, material=material)
+            if os.path.exists(path):
+                self._tables[material] = Tablebase(path=path)
+
+    @property
+    def materials(self) -> tuple[str, ...]:
+        return tuple(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __enter__(self) -> Tablebases:
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for table in self._tables.values():
+            table.close()
+
+    def probe(self, board: Board, current_player: str) -> Optional[TablebaseResult]:
+        """Look up the result of a position in the table of its material.
+
+        Boards with more pieces than any table are rejected after looking at a few
+        squares, so probing is cheap enough to do at every node of a search.
+
+        Args:
+            board: Board of the position.
+            current_player: Player to move.
+
+        Returns: The exact result, None if there is no table for the material, a
+            player can still castle or the position is illegal.
+        """
+        table_position = _get_table_position(board=board, current_player=current_player)
+        if table_position is None:
+            return None
+        material, squares, side = table_position
+        table = self._tables.get(material)
+        if table is None:
+            return None
+        return table._get_result(squares=squares, side=side)
+
+
+def get_table_path(directory: str, material: str) -> str:
+    return os.path.join(directory, f"{material}.bin")
+
+
+def generate_table(material: str) -> bytes:
+    """Generate the table of a material by retrograde analysis.
+
+    First all legal positions are marked, then the number of distinct positions
+    the moves of each position lead to is counted and the checkmates are collected.
+    Going backwards from the positions resolved at one ply, the positions that
+    have a move to them are resolved at the next ply. Captures leave too little
+    material to checkmate, so they are draws.
+
+    Args:
+        material: One of MATERIALS, e.g. "KQK".
+
+    Returns: The entries of all indices of the material, see "write_table".
+
+    Raises:
+        ValueError: If there is no table for the material.
+    """
+    if material not in MATERIALS:
+        raise ValueError(f"There is no tablebase for '{material}'.")
+    layout = _LAYOUTS[material]
+    table = bytearray([INVALID_ENTRY]) * layout.size
+    for index in range(layout.size):
+        if _is_valid_position(layout=layout, index=index):
+            table[index] = DRAW_ENTRY
+
+    # Distinct successors of each position that are not known to be won yet
+    unresolved_successors = bytearray(layout.size)
+    positions = []
+    for index in range(layout.size):
+        if table[index] == INVALID_ENTRY:
+            continue
+        squares, side = layout.get_position(index=index)
+        board = layout.get_board(squares=squares)
+        successors = _get_successors(
+            layout=layout, table=table, board=board, squares=squares, side=side
+        )
+        unresolved_successors[index] = len(successors)
+        if not successors and is_check(board=board, current_player=_COLORS[side]):
+            table[index] = 1  # Checkmated, zero plies to mate
+            positions.append(index)
+
+    plies = 0
+    while positions:
+        if plies + 1 > MAX_PLIES_TO_MATE:
+            raise ValueError(f"Mates of '{material}' are too long for a table.")
+        next_positions = []
+        for index in positions:
+            for predecessor in _get_predecessors(
+                layout=layout, table=table, index=index
+            ):
+                if table[predecessor] != DRAW_ENTRY:
+                    continue
+                # Even plies to mate are lost for the player to move
+                if plies % 2 == 1:
+                    unresolved_successors[predecessor] -= 1
+                    if unresolved_successors[predecessor]:
+                        continue
+                table[predecessor] = plies + 2
+                next_positions.append(predecessor)
+        positions = next_positions
+        plies += 1
+    return bytes(table)
+
+
+def write_table(path: str, material: str, table: bytes) -> None:
+    """Write a table generated by "generate_table".
+
+    Args:
+        path: Path of the file to write, see "get_table_path".
+        material: Material of the table.
+        table: Entries of the table.
+    """
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(material.encode("ascii").ljust(MATERIAL_SIZE))
+        file.write(table)
+
+
+class _TableLayout:
+    """Perfect hash of the positions of a material.
+
+    The index is made of the player to move (zero if it is the stronger player),
+    the square of the stronger king within its region, the squares of the other
+    pieces of the stronger player and the square of the weaker king. Squares are
+    counted from a8 rank by rank.
+    """
+
+    def __init__(self, material: str) -> None:
+        self.material = material
+        self.piece_types = ("King", *MATERIALS[material], "King")
+        has_pawns = "Pawn" in self.piece_types
+        self.king_squares = tuple(
+            square
+            for square in range(NUM_SQUARES)
+            if _is_in_king_region(square=square, has_pawns=has_pawns)
+        )
+        self._king_indices = {
+            square: king_index for king_index, square in enumerate(self.king_squares)
+        }
+        symmetries = (
+            _FILE_SYMMETRIES
+            if has_pawns
+            else tuple(
+                _get_symmetry(flip_files=flip_files, flip_ranks=flip_ranks, swap=swap)
+                for flip_files, flip_ranks, swap in product((False, True), repeat=3)
+            )
+        )
+        # Symmetries that map each square of the stronger king into its region
+        self._king_symmetries = tuple(
+            tuple(
+                symmetry
+                for symmetry in symmetries
+                if symmetry[square] in self._king_indices
+            )
+            for square in range(NUM_SQUARES)
+        )
+        self.size = (
+            2 * len(self.king_squares) * NUM_SQUARES ** (len(self.piece_types) - 1)
+        )
+
+    def get_index(self, squares: Sequence[int], side: int) -> int:
+        """Get the index of a position, the same for all of its mirror images."""
+        return min(
+            self._get_index(
+                squares=tuple(symmetry[square] for square in squares), side=side
+            )
+            for symmetry in self._king_symmetries[squares[0]]
+        )
+
+    def get_position(self, index: int) -> tuple[tuple[int, ...], int]:
+        """Get the squares of the pieces and the side to move of an index."""
+        squares = []
+        for _ in range(len(self.piece_types) - 1):
+            index, square = divmod(index, NUM_SQUARES)
+            squares.append(square)
+        side, king_index = divmod(index, len(self.king_squares))
+        return (self.king_squares[king_index], *reversed(squares)), side
+
+    def get_board(self, squares: Sequence[int]) -> Board:
+        """Get the board of the pieces on their squares, without castling rights."""
+        return Board(
+            pieces=tuple(
+                _create_piece(
+                    piece_type=piece_type,
+                    square=square,
+                    color=BLACK if piece_index == len(squares) - 1 else WHITE,
+                )
+                for piece_index, (piece_type, square) in enumerate(
+                    zip(self.piece_types, squares)
+                )
+            )
+        )
+
+    def _get_index(self, squares: Sequence[int], side: int) -> int:
+        index = side * len(self.king_squares) + self._king_indices[squares[0]]
+        for square in squares[1:]:
+            index = index * NUM_SQUARES + square
+        return index
+
+
+def _get_symmetry(flip_files: bool, flip_ranks: bool, swap: bool) -> tuple[int, ...]:
+    """Get the square each square is mapped to by a symmetry of the board."""
+    symmetry = []
+    for square in range(NUM_SQUARES):
+        y, x = divmod(square, NO_RANKS_AND_FILES)
+        if swap:
+            x, y = y, x
+        if flip_files:
+            x = NO_RANKS_AND_FILES - 1 - x
+        if flip_ranks:
+            y = NO_RANKS_AND_FILES - 1 - y
+        symmetry.append(y * NO_RANKS_AND_FILES + x)
+    return tuple(symmetry)
+
+
+# Pawns only move forward, so tables with pawns are only mirrored between files
+_FILE_SYMMETRIES = (
+    _get_symmetry(flip_files=False, flip_ranks=False, swap=False),
+    _get_symmetry(flip_files=True, flip_ranks=False, swap=False),
+)
+
+
+def _is_in_king_region(square: int, has_pawns: bool) -> bool:
+    """Get whether the stronger king is indexed on a square, e.g. a1-d1-d4."""
+    y, x = divmod(square, NO_RANKS_AND_FILES)
+    rank_index = NO_RANKS_AND_FILES - 1 - y
+    return x < NO_RANKS_AND_FILES // 2 and (has_pawns or rank_index <= x)
+
+
+_LAYOUTS = {material: _TableLayout(material=material) for material in MATERIALS}
+
+
+def _to_square(position: tuple[int, int]) -> int:
+    return position[1] * NO_RANKS_AND_FILES + position[0]
+
+
+def _to_position(square: int) -> tuple[int, int]:
+    return square % NO_RANKS_AND_FILES, square // NO_RANKS_AND_FILES
+
+
+def _create_piece(piece_type: str, square: int, color: str) -> Piece:
+    return PIECE_CLASSES[piece_type](
+        position=_to_position(square=square),
+        color=color,
+        is_in_start_position=(
+            piece_type == "Pawn" and square // NO_RANKS_AND_FILES == PAWN_START_Y
+        ),
+    )
+
+
+def _move_piece(squares: Sequence[int], from_square: int, to_square: int) -> tuple:
+    return tuple(to_square if square == from_square else square for square in squares)
+
+
+def _is_valid_position(layout: _TableLayout, index: int) -> bool:
+    """Get whether the position of an index is legal and not a mirror image."""
+    squares, side = layout.get_position(index=index)
+    if len(set(squares)) < len(squares):
+        return False
+    if any(
+        piece_type == "Pawn" and square // NO_RANKS_AND_FILES > PAWN_START_Y
+        for piece_type, square in zip(layout.piece_types, squares)
+    ):
+        return False
+    if layout.get_index(squares=squares, side=side) != index:
+        return False
+    return not is_check(
+        board=layout.get_board(squares=squares), current_player=_COLORS[1 - side]
+    )
+
+
+def _get_successors(
+    layout: _TableLayout,
+    table: bytearray,
+    board: Board,
+    squares: tuple[int, ...],
+    side: int,
+) -> set[int]:
+    """Get the indices of the distinct positions the legal moves lead to.
+
+    A move is legal if the position it leads to is valid, i.e. the moving player's
+    king is not in check. Legal captures are all represented by "_CAPTURE".
+    """
+    successors = set()
+    for from_position, to_position in get_all_move_candidates(
+        board=board, current_player=_COLORS[side]
+    ):
+        if board[to_position] is not None:
+            # Only the weaker king can capture
+            if is_valid_move(
+                board=board,
+                move=create_regular_move(
+                    board=board, move_candidate=(from_position, to_position)
+                ),
+            ):
+                successors.add(_CAPTURE)
+            continue
+        successor = layout.get_index(
+            squares=_move_piece(
+                squares=squares,
+                from_square=_to_square(position=from_position),
+                to_square=_to_square(position=to_position),
+            ),
+            side=1 - side,
+        )
+        if table[successor] != INVALID_ENTRY:
+            successors.add(successor)
+    return successors
+
+
+def _get_predecessors(layout: _TableLayout, table: bytearray, index: int) -> set[int]:
+    """Get the indices of the distinct valid positions with a move to a position."""
+    squares, side = layout.get_position(index=index)
+    board = layout.get_board(squares=squares)
+    moving_side = 1 - side
+    piece_indices: Iterable[int] = (
+        range(len(squares) - 1) if moving_side == 0 else (len(squares) - 1,)
+    )
+    predecessors = set()
+    for piece_index in piece_indices:
+        for from_square in _get_from_squares(
+            board=board,
+            piece_type=layout.piece_types[piece_index],
+            square=squares[piece_index],
+        ):
+            predecessor = layout.get_index(
+                squares=_move_piece(
+                    squares=squares,
+                    from_square=squares[piece_index],
+                    to_square=from_square,
+                ),
+                side=moving_side,
+            )
+            if table[predecessor] != INVALID_ENTRY:
+                predecessors.add(predecessor)
+    return predecessors
+
+
+def _get_from_squares(board: Board, piece_type: str, square: int) -> list[int]:
+    """Get the empty squares a piece can have moved from without capturing."""
+    x, y = _to_position(square=square)
+    if piece_type != "Pawn":
+        # Pieces other than pawns can move back the way they came
+        return [
+            _to_square(position=to_position)
+            for _, to_position in get_move_candidates(board=board, position=(x, y))
+            if board[to_position] is None
+        ]
+    from_squares = []
+    if y + 1 <= PAWN_START_Y and board[(x, y + 1)] is None:
+        from_squares.append(_to_square(position=(x, y + 1)))
+        if y + 2 == PAWN_START_Y and board[(x, y + 2)] is None:
+            from_squares.append(_to_square(position=(x, y + 2)))
+    return from_squares
+
+
+def _get_table_position(
+    board: Board, current_player: str
+) -> Optional[tuple[str, tuple[int, ...], int]]:
+    """Get the material, the squares of the pieces and the side to move of a board.
+
+    Returns: None if no table can hold the position, e.g. because a king or rook
+        can still castle.
+    """
+    pieces: list[Piece] = []
+    for piece in board.all_pieces():
+        if len(pieces) == MAX_PIECES:
+            return None
+        pieces.append(piece)
+    white_pieces = [piece for piece in pieces if piece.color == WHITE]
+    black_pieces = [piece for piece in pieces if piece.color == BLACK]
+    stronger_pieces, weaker_pieces = (
+        (white_pieces, black_pieces)
+        if len(white_pieces) >= len(black_pieces)
+        else (black_pieces, white_pieces)
+    )
+    if len(weaker_pieces) != 1 or any(
+        piece.is_in_start_position and piece.piece_type in ("King", "Rook")
+        for piece in pieces
+    ):
+        return None
+    kings = [piece for piece in stronger_pieces if piece.piece_type == "King"]
+    other_pieces = sorted(
+        (piece for piece in stronger_pieces if piece.piece_type != "King"),
+        key=lambda piece: tuple(PIECE_LETTERS).index(piece.piece_type),
+    )
+    material = f"K{''.join(PIECE_LETTERS[piece.piece_type] for piece in other_pieces)}K"
+    if material not in MATERIALS or len(kings) != 1:
+        return None
+    stronger_player = stronger_pieces[0].color
+    squares = tuple(
+        _to_square(
+            position=(x, y if stronger_player == WHITE else NO_RANKS_AND_FILES - 1 - y)
+        )
+        for x, y in (
+            piece.position for piece in (*kings, *other_pieces, *weaker_pieces)
+        )
+    )
+    return material, squares, 0 if current_player == stronger_player else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m utahchess.tablebase",
+        description="Generate endgame tablebases by retrograde analysis.",
+    )
+    parser.add_argument("directory", help="Directory to write the tables to.")
+    parser.add_argument(
+        "materials",
+        nargs="*",
+        help=f"Materials to generate, all of {', '.join(MATERIALS)} if none.",
+    )
+    arguments = parser.parse_args(argv)
+    for material in arguments.materials:
+        if material not in MATERIALS:
+            parser.error(f"There is no tablebase for '{material}'.")
+
+    os.makedirs(arguments.directory, exist_ok=True)
+    for material in arguments.materials or MATERIALS:
+        start = time.perf_counter()
+        path = get_table_path(directory=arguments.directory, material=material)
+        write_table(path=path, material=material, table=generate_table(material))
+        print(
+            f"Wrote {material} to {path} in {time.perf_counter() - start:.0f} seconds"
+        )
+
+
+if __name__ == "__main__":
+    main()
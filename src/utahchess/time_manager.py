@@ -0,0 +1,168 @@
+"""Time management of searches under a chess clock.
+
+Given the remaining time, the increment and the moves until the next time control,
+a "TimeManager" sets two limits for a move. No iteration of the search starts after
+the soft limit and the running one is aborted at the hard limit, which always leaves
+time on the clock. In between, the budget adapts to the search: it grows when the
+best move changes between iterations or the value drops, and the search stops early
+if there is a single legal move or the best move has not changed for a while.
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from utahchess.move import Move
+
+# Without moves to go assume that many moves are left until the time control ends
+DEFAULT_MOVES_TO_GO = 30
+# Time lost per move outside of the search, e.g. to talking to a GUI
+DEFAULT_MOVE_OVERHEAD_SECONDS = 0.05
+# Largest parts of the remaining time the soft and the hard limit may take
+MAX_SOFT_LIMIT_FRACTION = 0.5
+MAX_HARD_LIMIT_FRACTION = 0.8
+# The hard limit is that many times the soft limit, unless capped by the above
+HARD_LIMIT_FACTOR = 4.0
+# Factors the budget grows by when the best move changes and when the value drops
+# by more than "SCORE_DROP" pawns between iterations, up to the hard limit
+BEST_MOVE_CHANGE_EXTENSION = 1.5
+SCORE_DROP_EXTENSION = 1.5
+SCORE_DROP = 0.5
+# After that many iterations with the same best move only a part of the budget is
+# used
+STABLE_ITERATIONS = 3
+STABLE_BUDGET_FRACTION = 0.5
+# Assumed ratio of the durations of consecutive iterations until two were measured
+DEFAULT_ITERATION_GROWTH = 8.0
+
+
+class TimeManager:
+    """Time limits of the search of one move.
+
+    Pass it to "iterative_deepening", which reports every completed iteration with
+    "on_iteration", asks "should_start_iteration" before the next one and aborts an
+    iteration once "is_time_up".
+
+    Args:
+        remaining_seconds: Time left on the clock of the player to move.
+        increment_seconds: Time added to the clock after the move.
+        moves_to_go: Moves until the next time control, "DEFAULT_MOVES_TO_GO" if
+            None.
+        move_overhead_seconds: Time kept back for every move, e.g. for the GUI to
+            receive it.
+        is_running: Whether the clock runs from now on. Pass False for a search on
+            the opponent's time and call "start" once the clock runs.
+        clock: Function returning the current time in seconds.
+
+    Raises:
+        ValueError: If fewer than one move is left until the next time control.
+    """
+
+    def __init__(
+        self,
+        remaining_seconds: float,
+        increment_seconds: float = 0.0,
+        moves_to_go: Optional[int] = None,
+        move_overhead_seconds: float = DEFAULT_MOVE_OVERHEAD_SECONDS,
+        is_running: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if moves_to_go is not None and moves_to_go < 1:
+            raise ValueError("At least one move is left until the time control.")
+        available_seconds = max(remaining_seconds - move_overhead_seconds, 0.0)
+        moves_to_go = DEFAULT_MOVES_TO_GO if moves_to_go is None else moves_to_go
+        self.soft_limit = min(
+            available_seconds / moves_to_go + increment_seconds,
+            available_seconds * MAX_SOFT_LIMIT_FRACTION,
+        )
+        self.hard_limit = min(
+            self.soft_limit * HARD_LIMIT_FACTOR,
+            available_seconds * MAX_HARD_LIMIT_FRACTION,
+        )
+        self.is_running = is_running
+        self._clock = clock
+        self._start = clock()
+        self._budget = self.soft_limit
+        self._last_iteration_end = self._start
+        self._iteration_seconds: list[float] = []
+        self._best_move: Optional[Move] = None
+        self._value: Optional[float] = None
+        self._stable_iterations = 0
+        self._num_legal_moves: Optional[int] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Time since the clock started, zero while it does not run."""
+        return self._clock() - self._start if self.is_running else 0.0
+
+    @property
+    def budget(self) -> float:
+        """Time the search may take by what its iterations found so far."""
+        if self._stable_iterations >= STABLE_ITERATIONS:
+            return self._budget * STABLE_BUDGET_FRACTION
+        return self._budget
+
+    def start(self) -> None:
+        """Start the clock, e.g. on "ponderhit" after pondering.
+
+        Iterations reported before, e.g. while pondering, count for the budget.
+        """
+        self._start = self._clock()
+        self.is_running = True
+
+    def is_time_up(self) -> bool:
+        """Get whether the hard limit is reached and the search has to stop."""
+        return self.elapsed_seconds >= self.hard_limit
+
+    def on_iteration(self, best_move: Move, value: float, num_legal_moves: int) -> None:
+        """Adapt the budget to the result of a completed iteration.
+
+        Args:
+            best_move: Best move of the iteration.
+            value: Value of the best move to the player to move.
+            num_legal_moves: Number of legal moves of the searched board.
+        """
+        now = self._clock()
+        self._iteration_seconds.append(now - self._last_iteration_end)
+        self._last_iteration_end = now
+        self._num_legal_moves = num_legal_moves
+        if self._best_move is not None and best_move != self._best_move:
+            self._extend_budget(factor=BEST_MOVE_CHANGE_EXTENSION)
+            self._stable_iterations = 0
+        else:
+            self._stable_iterations += 1
+        if self._value is not None and value < self._value - SCORE_DROP:
+            self._extend_budget(factor=SCORE_DROP_EXTENSION)
+        self._best_move = best_move
+        self._value = value
+
+    def should_start_iteration(self) -> bool:
+        """Get whether to search one more iteration.
+
+        The search ends once there is a single legal move, once the budget is used
+        up or if the next iteration would most likely be aborted at the hard limit.
+        Its duration is predicted by how much longer the last iteration took than
+        the one before it.
+        """
+        if self._num_legal_moves == 1:
+            return False
+        if not self.is_running:
+            return True
+        elapsed_seconds = self.elapsed_seconds
+        if elapsed_seconds >= self.budget:
+            return False
+        return elapsed_seconds + self._predict_iteration_seconds() < self.hard_limit
+
+    def _extend_budget(self, factor: float) -> None:
+        self._budget = min(self._budget * factor, self.hard_limit)
+
+    def _predict_iteration_seconds(self) -> float:
+        """Predict the duration of the next iteration, zero before the first one."""
+        if not self._iteration_seconds:
+            return 0.0
+        last_seconds = self._iteration_seconds[-1]
+        if len(self._iteration_seconds) >= 2 and self._iteration_seconds[-2] > 0:
+            growth = last_seconds / self._iteration_seconds[-2]
+        else:
+            growth = DEFAULT_ITERATION_GROWTH
+        return last_seconds * growth
@@ -0,0 +1,124 @@
+"""Transposition table to remember search results of positions by hash.
+
+The same position is often reached through different move orders and searched
+again and again by repeated searches of the same tree, e.g. by "mtdf". The table
+stores the value found for a position, whether it is exact or only a bound, the
+depth it was searched to and the best move, so later searches can reuse it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from utahchess.move import Move
+
+EXACT = "exact"
+LOWER_BOUND = "lower_bound"
+UPPER_BOUND = "upper_bound"
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+@dataclass(frozen=True)
+class TranspositionEntry:
+    """Search result of a position.
+
+    Attributes:
+        depth: Depth the position was searched to.
+        value: Value of the position to the player to move.
+        bound: Whether the value is exact, a lower bound or an upper bound of the
+            true value.
+        best_move: The best move, None if the position has no legal moves or was not
+            expanded.
+    """
+
+    __slots__ = ("depth", "value", "bound", "best_move")
+
+    depth: int
+    value: float
+    bound: str
+    best_move: Optional[Move]
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        # Frozen dataclasses with slots cannot be unpickled by setting attributes
+        return (
+            TranspositionEntry,
+            (self.depth, self.value, self.bound, self.best_move),
+        )
+
+
+class TranspositionTable:
+    """Search results of positions by Zobrist hash.
+
+    A result replaces the one of the same position only if it was searched at
+    least as deep. Once the table is full the oldest entry makes room for a new
+    position.
+
+    Args:
+        max_entries: Maximum number of positions to remember.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("A transposition table needs room for one entry.")
+        self.max_entries = max_entries
+        self._entries: dict[int, TranspositionEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, position_hash: object) -> bool:
+        return position_hash in self._entries
+
+    def get(self, position_hash: int) -> Optional[TranspositionEntry]:
+        """Get the search result of a position, None if it is unknown."""
+        return self._entries.get(position_hash)
+
+    def store(
+        self,
+        position_hash: int,
+        depth: int,
+        value: float,
+        bound: str,
+        best_move: Optional[Move] = None,
+    ) -> None:
+        """Remember the search result of a position.
+
+        Args:
+            position_hash: Zobrist hash of the position.
+            depth: Depth the position was searched to.
+            value: Value of the position to the player to move.
+            bound: One of EXACT, LOWER_BOUND and UPPER_BOUND.
+            best_move: The best move.
+        """
+        entry = self._entries.get(position_hash)
+        if entry is not None:
+            if entry.depth > depth:
+                return
+            del self._entries[position_hash]  # Keep recently stored entries last
+        elif len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[position_hash] = TranspositionEntry(
+            depth=depth,
+            value=value,
+            bound=bound,
+            best_move=best_move,
+        )
+
+    def update(self, other: TranspositionTable) -> None:
+        """Store the search results of another table, e.g. of a search's copy.
+
+        Entries are stored oldest first, each replacing the one of the same position
+        only if it was searched at least as deep.
+        """
+        for position_hash, entry in other._entries.items():
+            self.store(
+                position_hash=position_hash,
+                depth=entry.depth,
+                value=entry.value,
+                bound=entry.bound,
+                best_move=entry.best_move,
+            )
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,471 @@
+"""Universal Chess Interface (UCI) for the engine.
+
+Run "utahchess-uci" (or "python -m utahchess.uci") and connect it to any UCI
+compatible graphical user interface. For the protocol see
+https://www.shredderchess.com/chess-features/uci-universal-chess-interface.html
+
+The engine keeps a transposition table, sized by the "Hash" option, for the whole
+game. It supports pondering: with the "Ponder" option set, "bestmove" names the
+expected reply and "go ponder" searches the position after it on the opponent's
+time. On "ponderhit" the search goes on under the time limits of the "go" command,
+otherwise it is stopped and only its table entries are of use for the next search.
+
+Under a chess clock the time of a move is set by a "TimeManager", see
+"utahchess.time_manager".
+"""
+from __future__ import annotations
+
+import math
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.chess import ChessGame, is_irreversible_move
+from utahchess.legal_moves import get_legal_moves
+from utahchess.minimax import CHECKMATE_VALUE
+from utahchess.move import Move, make_move
+from utahchess.opening_book import OpeningBook
+from utahchess.pgn import INITIAL_FEN
+from utahchess.search import (
+    BOOK_DEPTH,
+    MAX_DEPTH,
+    SearchInfo,
+    get_ponder_move,
+    get_tablebase_plies_to_mate,
+    iterative_deepening,
+)
+from utahchess.tablebase import Tablebases
+from utahchess.time_manager import TimeManager
+from utahchess.transposition_table import TranspositionTable
+from utahchess.utils import x_index_to_file, y_index_to_rank
+from utahchess.zobrist import get_position_hash
+
+ENGINE_NAME = "utahchess"
+ENGINE_AUTHOR = "Pombo Lutador"
+
+DEFAULT_HASH_SIZE_MB = 16
+MIN_HASH_SIZE_MB = 1
+MAX_HASH_SIZE_MB = 1024
+# Approximate memory of an entry of the transposition table, including its key
+TABLE_ENTRY_BYTES = 200
+
+
+def to_uci_move(move: Move) -> str:
+    """Get a move in the long algebraic notation of UCI, e.g. "e2e4" or "e1g1".
+
+    For castling moves the king's move is used.
+    """
+    (from_x, from_y), (to_x, to_y) = move.piece_moves[0]
+    return (
+        f"{x_index_to_file(x=from_x)}{y_index_to_rank(y=from_y)}"
+        f"{x_index_to_file(x=to_x)}{y_index_to_rank(y=to_y)}"
+    )
+
+
+def find_move(uci_move: str, legal_moves: Iterable[Move]) -> Move:
+    """Get the legal move described by a move in UCI notation.
+
+    Raises:
+        ValueError: If no legal move matches, e.g. for promotions.
+    """
+    for move in legal_moves:
+        if to_uci_move(move=move) == uci_move:
+            return move
+    raise ValueError(f"Move '{uci_move}' is not legal or not supported.")
+
+
+class UciEngine:
+    """State of a UCI session.
+
+    Commands are passed to "handle_command" one line at a time. Searches run on a
+    worker thread, so "stop" and "isready" are answered while the engine thinks.
+
+    Args:
+        output: Function to send a line to the graphical user interface.
+    """
+
+    def __init__(self, output: Callable[[str], None]) -> None:
+        self._output = output
+        self._output_lock = threading.Lock()
+        self.hash_size_mb = DEFAULT_HASH_SIZE_MB
+        self.table = _create_table(hash_size_mb=self.hash_size_mb)
+        self.ponder = False
+        self.own_book = False
+        self.book_path = ""
+        self._book: Optional[OpeningBook] = None
+        self.tablebase_path = ""
+        self._tablebases: Optional[Tablebases] = None
+        self.board = Board()
+        self.current_player = WHITE
+        self.last_move: Optional[Move] = None
+        self.previous_position_hashes: list[int] = []
+        self.halfmove_clock = 0
+        self._stop_event = threading.Event()
+        # Set once "bestmove" may be sent, by "stop" or, when pondering, "ponderhit"
+        self._release_event = threading.Event()
+        self._search_thread: Optional[threading.Thread] = None
+        self._is_infinite = False
+        self._is_pondering = False
+        self._go_parameters: dict[str, int] = {}
+        self._deadline: Optional[float] = None
+        self._time_manager: Optional[TimeManager] = None
+
+    def handle_command(self, line: str) -> bool:
+        """Handle a single command.
+
+        A command that cannot be parsed or that the engine does not support, e.g. a
+        position with a promotion, is reported with "info string" and leaves the
+        state as it was.
+
+        Returns: False if the engine should quit, True otherwise.
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        try:
+            return self._handle_command(command=tokens[0], arguments=tokens[1:])
+        except ValueError as error:
+            self.send(f"info string Ignoring command '{line.strip()}': {error}")
+            return True
+
+    def _handle_command(self, command: str, arguments: list[str]) -> bool:
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(
+                f"option name Hash type spin default {DEFAULT_HASH_SIZE_MB} "
+                f"min {MIN_HASH_SIZE_MB} max {MAX_HASH_SIZE_MB}"
+            )
+            self.send("option name Ponder type check default false")
+            self.send("option name OwnBook type check default false")
+            self.send("option name BookFile type string default <empty>")
+            self.send("option name TablebasePath type string default <empty>")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self._set_option(arguments=arguments)
+        elif command == "ucinewgame":
+            self.stop()
+            self.table.clear()
+            self._set_position(arguments=["startpos"])
+        elif command == "position":
+            self.stop()
+            self._set_position(arguments=arguments)
+        elif command == "go":
+            self.stop()
+            self._go(arguments=arguments)
+        elif command == "ponderhit":
+            self._ponderhit()
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            return False
+        return True
+
+    def send(self, line: str) -> None:
+        with self._output_lock:
+            self._output(line)
+
+    def stop(self) -> None:
+        """Stop a running search and wait until its best move was sent."""
+        if self._search_thread is None:
+            return
+        self._stop_event.set()
+        self._release_event.set()
+        self._search_thread.join()
+        self._search_thread = None
+
+    def wait(self) -> None:
+        """Wait until a running search is finished, stopping it if it is infinite.
+
+        A search that is still pondering is stopped as well.
+        """
+        if self._is_infinite or self._is_pondering:
+            self.stop()
+        elif self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+
+    def _set_option(self, arguments: list[str]) -> None:
+        if "name" not in arguments or "value" not in arguments:
+            return
+        name = " ".join(
+            arguments[arguments.index("name") + 1 : arguments.index("value")]
+        )
+        value = " ".join(arguments[arguments.index("value") + 1 :])
+        if name.lower() == "hash":
+            self.hash_size_mb = min(max(int(value), MIN_HASH_SIZE_MB), MAX_HASH_SIZE_MB)
+            self.table = _create_table(hash_size_mb=self.hash_size_mb)
+        elif name.lower() == "ponder":
+            self.ponder = value.lower() == "true"
+        elif name.lower() == "ownbook":
+            self.own_book = value.lower() == "true"
+        elif name.lower() == "bookfile":
+            self.book_path = "" if value == "<empty>" else value
+        elif name.lower() == "tablebasepath":
+            self.tablebase_path = "" if value == "<empty>" else value
+
+    def _get_book(self) -> Optional[OpeningBook]:
+        """Get the opening book if it is enabled, opening it on first use."""
+        if not self.own_book or not self.book_path:
+            return None
+        if self._book is None or self._book.path != self.book_path:
+            if self._book is not None:
+                self._book.close()
+                self._book = None
+            try:
+                self._book = OpeningBook(path=self.book_path)
+            except (OSError, ValueError) as error:
+                self.send(f"info string Could not open book: {error}")
+        return self._book
+
+    def _get_tablebases(self) -> Optional[Tablebases]:
+        """Get the tablebases of the tablebase path, opening them on first use."""
+        if not self.tablebase_path:
+            return None
+        if (
+            self._tablebases is None
+            or self._tablebases.directory != self.tablebase_path
+        ):
+            if self._tablebases is not None:
+                self._tablebases.close()
+                self._tablebases = None
+            try:
+                self._tablebases = Tablebases(directory=self.tablebase_path)
+            except (OSError, ValueError) as error:
+                self.send(f"info string Could not open tablebases: {error}")
+        return self._tablebases
+
+    def _set_position(self, arguments: list[str]) -> None:
+        moves_index = arguments.index("moves") if "moves" in arguments else None
+        position = arguments[:moves_index]
+        fen = INITIAL_FEN if position[:1] == ["startpos"] else " ".join(position[1:])
+        game = ChessGame.from_fen(fen)
+        # The position only replaces the current one once all of its moves are legal
+        board = game.current_game_state.board
+        current_player = game.current_game_state.current_player
+        last_move = game.current_game_state.last_move
+        previous_position_hashes: list[int] = []
+        halfmove_clock = game.current_game_state.halfmove_clock
+        for uci_move in [] if moves_index is None else arguments[moves_index + 1 :]:
+            move = find_move(
+                uci_move=uci_move,
+                legal_moves=get_legal_moves(
+                    board=board, current_player=current_player, last_move=last_move
+                ),
+            )
+            if is_irreversible_move(move=move):
+                previous_position_hashes = []
+                halfmove_clock = 0
+            else:
+                previous_position_hashes.append(
+                    get_position_hash(
+                        board=board, current_player=current_player, last_move=last_move
+                    )
+                )
+                halfmove_clock += 1
+            board = make_move(board=board, move=move)
+            current_player = WHITE if current_player == BLACK else BLACK
+            last_move = move
+        self.board = board
+        self.current_player = current_player
+        self.last_move = last_move
+        self.previous_position_hashes = previous_position_hashes
+        self.halfmove_clock = halfmove_clock
+
+    def _go(self, arguments: list[str]) -> None:
+        parameters = {
+            name: int(value)
+            for name, value in zip(arguments, arguments[1:])
+            if name
+            in ("depth", "movetime", "wtime", "btime", "winc", "binc", "movestogo")
+        }
+        is_infinite = "infinite" in arguments
+        is_ponder = "ponder" in arguments
+        # Pondering is on the opponent's time, the limits only apply on "ponderhit"
+        time_manager = self._get_time_manager(
+            parameters=parameters, is_infinite=is_infinite, is_ponder=is_ponder
+        )
+        self._deadline = self._get_deadline(
+            parameters=parameters, is_infinite=is_infinite or is_ponder
+        )
+        self._time_manager = time_manager
+        self._go_parameters = parameters
+        self._is_infinite = is_infinite
+        self._is_pondering = is_ponder
+        self._stop_event = threading.Event()
+        self._release_event = threading.Event()
+        if not is_infinite and not is_ponder:
+            self._release_event.set()
+        self._search_thread = threading.Thread(
+            target=self._search,
+            kwargs={
+                "max_depth": parameters.get("depth", MAX_DEPTH),
+                "stop_event": self._stop_event,
+                "release_event": self._release_event,
+            },
+            daemon=True,
+        )
+        self._search_thread.start()
+
+    def _ponderhit(self) -> None:
+        """Go on with the pondering search, as the opponent played the expected move.
+
+        From now on the search is limited by the time of the "go ponder" command. A
+        search that already finished sends its best move right away.
+        """
+        if not self._is_pondering:
+            return
+        self._deadline = self._get_deadline(
+            parameters=self._go_parameters, is_infinite=False
+        )
+        if self._time_manager is not None:
+            self._time_manager.start()
+        self._is_pondering = False
+        self._release_event.set()
+
+    def _get_deadline(
+        self, parameters: dict[str, int], is_infinite: bool
+    ) -> Optional[float]:
+        """Get the time at which a "movetime" search has to stop, None without one."""
+        if is_infinite or "movetime" not in parameters:
+            return None
+        return time.perf_counter() + parameters["movetime"] / 1000
+
+    def _get_time_manager(
+        self, parameters: dict[str, int], is_infinite: bool, is_ponder: bool
+    ) -> Optional[TimeManager]:
+        """Get the time manager of a search under a chess clock, None without one.
+
+        The clock of a pondering search only starts on "ponderhit".
+        """
+        remaining_ms = parameters.get(
+            "wtime" if self.current_player == WHITE else "btime"
+        )
+        if is_infinite or "movetime" in parameters or remaining_ms is None:
+            return None
+        increment_ms = parameters.get(
+            "winc" if self.current_player == WHITE else "binc", 0
+        )
+        moves_to_go = parameters.get("movestogo")
+        return TimeManager(
+            remaining_seconds=remaining_ms / 1000,
+            increment_seconds=increment_ms / 1000,
+            moves_to_go=None if moves_to_go is None or moves_to_go < 1 else moves_to_go,
+            is_running=not is_ponder,
+        )
+
+    def _search(
+        self,
+        max_depth: int,
+        stop_event: threading.Event,
+        release_event: threading.Event,
+    ) -> None:
+        def should_stop() -> bool:
+            # The deadline is set later on "ponderhit"
+            deadline = self._deadline
+            return stop_event.is_set() or (
+                deadline is not None and time.perf_counter() >= deadline
+            )
+
+        result = iterative_deepening(
+            board=self.board,
+            current_player=self.current_player,
+            last_move=self.last_move,
+            max_depth=max_depth,
+            should_stop=should_stop,
+            on_iteration=lambda info: self.send(get_info_line(info=info)),
+            previous_position_hashes=self.previous_position_hashes,
+            halfmove_clock=self.halfmove_clock,
+            book=self._get_book(),
+            tablebases=self._get_tablebases(),
+            table=self.table,
+            time_manager=self._time_manager,
+        )
+        # "bestmove" must not be sent before "stop" or, when pondering, "ponderhit"
+        release_event.wait()
+        if result is None:
+            result_move = self._get_any_legal_move()
+            self.send(f"bestmove {'0000' if result_move is None else result_move}")
+            return
+        ponder_move = (
+            get_ponder_move(
+                board=self.board,
+                current_player=self.current_player,
+                best_move=result.best_move,
+                table=self.table,
+                last_move=self.last_move,
+            )
+            if self.ponder
+            else None
+        )
+        if ponder_move is None:
+            self.send(f"bestmove {to_uci_move(move=result.best_move)}")
+        else:
+            self.send(
+                f"bestmove {to_uci_move(move=result.best_move)} "
+                f"ponder {to_uci_move(move=ponder_move)}"
+            )
+
+    def _get_any_legal_move(self) -> Optional[str]:
+        """Get a legal move if the search was stopped before finishing depth one."""
+        for move in get_legal_moves(
+            board=self.board,
+            current_player=self.current_player,
+            last_move=self.last_move,
+        ):
+            return to_uci_move(move=move)
+        return None
+
+
+def _create_table(hash_size_mb: int) -> TranspositionTable:
+    """Create a transposition table that takes about the given memory."""
+    return TranspositionTable(
+        max_entries=hash_size_mb * 1024 * 1024 // TABLE_ENTRY_BYTES
+    )
+
+
+def get_info_line(info: SearchInfo) -> str:
+    """Get the UCI "info" line for the result of a search iteration."""
+    if info.depth == BOOK_DEPTH:
+        return f"info string book move {to_uci_move(move=info.best_move)}"
+    plies_to_mate = get_tablebase_plies_to_mate(value=info.value)
+    if abs(info.value) == CHECKMATE_VALUE:
+        moves_to_mate = math.ceil(info.depth / 2)
+        score = f"mate {moves_to_mate if info.value > 0 else -moves_to_mate}"
+    elif plies_to_mate is not None:
+        moves_to_mate = math.ceil(plies_to_mate / 2)
+        score = f"mate {moves_to_mate if info.value > 0 else -moves_to_mate}"
+    else:
+        score = f"cp {round(info.value * 100)}"
+    principal_variation = " ".join(
+        to_uci_move(move=move) for move in info.principal_variation_moves
+    )
+    return (
+        f"info depth {info.depth} score {score} nodes {info.nodes} "
+        f"nps {round(info.nodes_per_second)} "
+        f"time {round(info.elapsed_seconds * 1000)} "
+        f"pv {principal_variation}"
+    )
+
+
+def main() -> None:
+    """Run the engine on standard input and output."""
+
+    def output(line: str) -> None:
+        print(line, flush=True)
+
+    engine = UciEngine(output=output)
+    for line in sys.stdin:
+        if not engine.handle_command(line):
+            return
+    engine.wait()  # Input ended, e.g. when commands are piped in
+
+
+if __name__ == "__main__":
+    main()
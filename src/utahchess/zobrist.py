@@ -0,0 +1,67 @@
+"""Zobrist hashing of positions.
+
+Every piece on every square, castling piece still in starting position, en passant
+file and the side to move get a fixed random 64 bit key. The hash of a position is
+the XOR of the keys that apply to it, so equal positions always have equal hashes
+and different positions have different hashes with overwhelming probability.
+"""
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+from utahchess import BLACK, WHITE
+from utahchess.board import NO_RANKS_AND_FILES, Board
+from utahchess.en_passant import get_en_passant_moves
+from utahchess.move import Move
+
+# Fixed seed, so hashes are the same in every process, e.g. for an opening book
+ZOBRIST_SEED = 20221028
+PIECE_TYPES = ("Pawn", "Knight", "Bishop", "Rook", "Queen", "King")
+
+_random = random.Random(ZOBRIST_SEED)
+PIECE_KEYS = {
+    (piece_type, color, x, y): _random.getrandbits(64)
+    for piece_type in PIECE_TYPES
+    for color in (WHITE, BLACK)
+    for x in range(NO_RANKS_AND_FILES)
+    for y in range(NO_RANKS_AND_FILES)
+}
+# Kings and rooks in starting position decide castling availability
+CASTLING_KEYS = {
+    (piece_type, color, x, y): _random.getrandbits(64)
+    for piece_type in ("Rook", "King")
+    for color in (WHITE, BLACK)
+    for x in range(NO_RANKS_AND_FILES)
+    for y in range(NO_RANKS_AND_FILES)
+}
+EN_PASSANT_KEYS = tuple(_random.getrandbits(64) for _ in range(NO_RANKS_AND_FILES))
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+
+
+def get_position_hash(
+    board: Board, current_player: str, last_move: Optional[Move] = None
+) -> int:
+    """Get the Zobrist hash of a position.
+
+    Two positions are the same if the same pieces stand on the same squares, the
+    same player is to move and the same castling and en passant moves are
+    available. The en passant file only counts if an en passant move is legal.
+
+    Args:
+        board: Board of the position.
+        current_player: Player whose turn it is.
+        last_move: Last move that was executed on the board.
+
+    Returns: A 64 bit hash of the position.
+    """
+    position_hash = BLACK_TO_MOVE_KEY if current_player == BLACK else 0
+    for piece in board.all_pieces():
+        key = (piece.piece_type, piece.color, *piece.position)
+        position_hash ^= PIECE_KEYS[key]
+        if piece.is_in_start_position and key in CASTLING_KEYS:
+            position_hash ^= CASTLING_KEYS[key]
+    for en_passant_move in get_en_passant_moves(board=board, last_move=last_move):
+        position_hash ^= EN_PASSANT_KEYS[en_passant_move.piece_moves[0][1][0]]
+        break
+    return position_hash
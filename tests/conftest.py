@@ -7,6 +7,7 @@ from utahchess.piece import (
     INITIAL_QUEENS,
     INITIAL_ROOKS,
 )
+from utahchess.tablebase import generate_table, get_table_path, write_table
 
 
 @pytest.fixture
@@ -27,3 +28,15 @@ def initial_board_with_only_queens():
 @pytest.fixture
 def initial_board_with_only_kings():
     return Board(pieces=INITIAL_KINGS)
+
+
+@pytest.fixture(scope="session")
+def tablebase_directory(tmp_path_factory):
+    """Directory with the KQK table, which takes a few seconds to generate."""
+    directory = str(tmp_path_factory.mktemp("tablebases"))
+    write_table(
+        path=get_table_path(directory=directory, material="KQK"),
+        material="KQK",
+        table=generate_table(material="KQK"),
+    )
+    return directory
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.async_search import start_search
+from utahchess.board import Board
+from utahchess.legal_moves import get_legal_moves
+from utahchess.opening_book import BookEntry, encode_book_move, write_book
+from utahchess.search import BOOK_DEPTH, TABLEBASE_WIN_VALUE
+from utahchess.transposition_table import TranspositionTable
+from utahchess.zobrist import get_position_hash
+
+FOOLS_MATE_FEN = "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
+
+
+def test_start_search_result():
+    # given
+    handle = start_search(board=Board.from_fen(FOOLS_MATE_FEN), current_player=BLACK)
+
+    # when
+    result = asyncio.run(handle.result())
+
+    # then
+    assert result is not None
+    assert result.best_move_identifier == "Qh4#"
+    assert handle.is_done
+
+
+def test_start_search_iterates_over_infos():
+    # given
+    handle = start_search(
+        board=Board.from_fen("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"),
+        current_player=WHITE,
+        max_depth=2,
+    )
+
+    async def collect_infos():
+        return [info async for info in handle]
+
+    # when
+    result = asyncio.run(collect_infos())
+
+    # then
+    assert [info.depth for info in result] == [1, 2]
+    assert all(info.nodes_per_second > 0 for info in result)
+    assert result[-1].principal_variation == (result[-1].best_move_identifier,)
+
+
+def test_search_handle_stop_returns_best_move_so_far():
+    # given
+    handle = start_search(board=Board(), current_player=WHITE)
+
+    async def stop_after_first_info():
+        async for _ in handle:
+            handle.stop()
+        return await handle.result()
+
+    # when
+    result = asyncio.run(stop_after_first_info())
+
+    # then
+    assert result is not None
+    assert result.depth >= 1
+
+
+def test_search_handle_cancel():
+    # given
+    handle = start_search(board=Board(), current_player=WHITE)
+
+    # when
+    handle.cancel()
+
+    # then
+    assert handle.is_done
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(handle.result())
+
+
+def test_start_search_sends_back_filled_transposition_table():
+    # given
+    table = TranspositionTable()
+    handle = start_search(
+        board=Board.from_fen("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"),
+        current_player=WHITE,
+        max_depth=2,
+        table=table,
+    )
+
+    # when
+    asyncio.run(handle.result())
+
+    # then
+    assert handle.table is not None
+    assert len(handle.table) > 0
+    assert len(table) == 0  # The search filled a copy
+
+
+def test_search_handle_cancel_discards_transposition_table():
+    # given
+    handle = start_search(
+        board=Board(), current_player=WHITE, table=TranspositionTable()
+    )
+
+    # when
+    handle.cancel()
+
+    # then
+    assert handle.table is None
+
+
+def test_start_search_plays_book_move(tmp_path):
+    # given
+    board = Board()
+    book_path = str(tmp_path / "book.bin")
+    book_move = next(get_legal_moves(board=board, current_player=WHITE))
+    write_book(
+        path=book_path,
+        entries=[
+            BookEntry(
+                key=get_position_hash(board=board, current_player=WHITE),
+                move=encode_book_move(move=book_move),
+                weight=1,
+            )
+        ],
+    )
+    handle = start_search(board=board, current_player=WHITE, book_path=book_path)
+
+    # when
+    result = asyncio.run(handle.result())
+
+    # then
+    assert result is not None
+    assert result.depth == BOOK_DEPTH
+    assert result.best_move == book_move
+
+
+def test_start_search_uses_tablebases(tablebase_directory):
+    # given
+    handle = start_search(
+        board=Board.from_fen("k7/8/1K6/8/8/8/8/6Q1 w - - 0 1"),
+        current_player=WHITE,
+        tablebase_path=tablebase_directory,
+    )
+
+    # when
+    result = asyncio.run(handle.result())
+
+    # then
+    assert result is not None
+    assert result.best_move_identifier == "Qg8#"
+    assert result.value == TABLEBASE_WIN_VALUE - 1
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from utahchess import WHITE
+from utahchess.bench import measure_memory_per_game, perft, run_suites
+from utahchess.bench.__main__ import main
+from utahchess.bench.harness import get_percentile
+from utahchess.board import Board
+
+
+@pytest.mark.parametrize(
+    ("fen", "depth", "expected"),
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", 1, 20),
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", 2, 400),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 1, 14),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 2, 191),
+    ],
+)
+def test_perft(fen, depth, expected):
+    # when
+    result = perft(
+        board=Board.from_fen(fen), current_player=WHITE, last_move=None, depth=depth
+    )
+
+    # then
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("percentile", "expected"), [(50, 5.0), (95, 10.0), (10, 1.0), (0, 1.0)]
+)
+def test_get_percentile(percentile, expected):
+    # when
+    result = get_percentile(
+        values=[10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0],
+        percentile=percentile,
+    )
+
+    # then
+    assert result == expected
+
+
+def test_run_suites():
+    # when
+    result = run_suites(suites=["evaluation", "san"], repeat=2, label="test")
+
+    # then
+    assert result["label"] == "test"
+    assert {entry["suite"] for entry in result["results"]} == {"evaluation", "san"}
+    assert (
+        next(
+            entry
+            for entry in result["results"]
+            if entry["suite"] == "san" and entry["workload"] == "initial"
+        )["nodes"]
+        == 20
+    )
+    assert all(entry["nodes_per_second"] > 0 for entry in result["results"])
+    assert all(
+        entry["median_seconds"] <= entry["p95_seconds"] for entry in result["results"]
+    )
+
+
+def test_run_suites_raises_valueerror():
+    # when and then
+    with pytest.raises(ValueError):
+        run_suites(suites=["not_a_suite"])
+
+
+def test_main_writes_json(tmp_path):
+    # given
+    output_path = tmp_path / "report.json"
+
+    # when
+    main(["evaluation", "--repeat", "1", "--output", str(output_path)])
+
+    # then
+    result = json.loads(output_path.read_text())
+    assert result["repeat"] == 1
+    assert len(result["results"]) == 4
+
+
+def test_measure_memory_per_game():
+    # when
+    result = measure_memory_per_game(plies=4, games=2)
+
+    # then
+    assert result["plies"] == 4
+    assert result["games"] == 2
+    assert result["bytes_per_game"] > 0
+    assert result["snapshot_bytes"] > 0
+
+
+def test_main_writes_memory_per_game(tmp_path):
+    # given
+    output_path = tmp_path / "report.json"
+
+    # when
+    main(
+        [
+            "evaluation",
+            "--repeat",
+            "1",
+            "--memory-plies",
+            "2",
+            "--memory-games",
+            "1",
+            "--output",
+            str(output_path),
+        ]
+    )
+
+    # then
+    result = json.loads(output_path.read_text())
+    assert result["memory"]["plies"] == 2
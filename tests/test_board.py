@@ -193,3 +193,79 @@ def test_board_raises_valueerror():
         assert (
             e == "Cannot create board when both pieces and board string are provided."
         )
+
+
+def test_board_from_fen_initial_position():
+    # given
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+    # when
+    result = Board.from_fen(fen)
+
+    # then
+    assert result == Board()
+
+
+def test_board_to_fen_initial_position():
+    # when
+    result = Board().to_fen()
+
+    # then
+    assert result == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/4k3/8/PpP5/8/8/8/3K4 w - - 0 1",
+        "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 0 12",
+        "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3",
+    ],
+)
+def test_board_fen_round_trip(fen):
+    # when
+    result = Board.from_fen(fen).to_fen(
+        current_player=BLACK if fen.split()[1] == "b" else WHITE,
+        en_passant_square=fen.split()[3],
+        fullmove_number=int(fen.split()[5]),
+    )
+
+    # then
+    assert result == fen
+
+
+@pytest.mark.parametrize(
+    ("castling_availability", "position", "expected"),
+    [
+        ("KQkq", (4, 7), True),
+        ("Kq", (7, 7), True),
+        ("Kq", (0, 7), False),
+        ("Kq", (0, 0), True),
+        ("Kq", (7, 0), False),
+        ("-", (4, 0), False),
+        ("-", (7, 7), False),
+    ],
+)
+def test_board_from_fen_castling_availability(
+    castling_availability, position, expected
+):
+    # when
+    board = Board.from_fen(f"r3k2r/8/8/8/8/8/8/R3K2R w {castling_availability} - 0 1")
+
+    # then
+    assert board[position].is_in_start_position == expected
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/ppppxppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    ],
+)
+def test_board_from_fen_raises_valueerror(fen):
+    # when and then
+    with pytest.raises(ValueError):
+        Board.from_fen(fen)
@@ -1,6 +1,15 @@
+import pytest
+
 from utahchess import BLACK
 from utahchess.board import Board
-from utahchess.chess import is_stalemate
+from utahchess.chess import (
+    CHECKMATE,
+    FIFTY_MOVE_RULE,
+    STALEMATE,
+    THREEFOLD_REPETITION,
+    ChessGame,
+    is_stalemate,
+)
 from utahchess.legal_moves import get_move_per_algebraic_identifier
 
 
@@ -54,3 +63,263 @@ def test_is_not_stalemate():
         current_player=BLACK,
         legal_moves_for_current_player=black_legal_moves,
     )
+
+
+def test_chess_game_from_fen_allows_en_passant():
+    # given
+    fen = "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3"
+
+    # when
+    game = ChessGame.from_fen(fen)
+
+    # then
+    assert game.get_current_player() == BLACK
+    assert game.current_game_state.turn == 3
+    assert "xe3 e.p." in game.get_legal_moves()
+    assert game.to_fen() == fen
+
+
+def test_chess_game_from_fen_without_en_passant_square():
+    # given
+    fen = "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 3"
+
+    # when
+    game = ChessGame.from_fen(fen)
+
+    # then
+    assert "xe3 e.p." not in game.get_legal_moves()
+    assert game.to_fen() == fen
+
+
+def test_chess_game_from_fen_raises_valueerror_for_invalid_en_passant_square():
+    # given
+    fen = "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq d3 0 3"
+
+    # when and then
+    with pytest.raises(ValueError):
+        ChessGame.from_fen(fen)
+
+
+def test_chess_game_from_fen_matches_new_game():
+    # given
+    game = ChessGame()
+    game.new_game()
+
+    # when
+    result = ChessGame.from_fen(
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    )
+
+    # then
+    assert result.current_game_state == game.current_game_state
+
+
+def test_get_legal_destinations_for_piece():
+    # given
+    game = ChessGame.from_fen("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+
+    # when
+    result = game.get_legal_destinations_for_piece(position=(4, 7))
+
+    # then
+    assert set(result) == {(3, 7), (5, 7), (3, 6), (4, 6), (5, 6), (2, 7), (6, 7)}
+
+
+def test_moves_per_square_matches_legal_moves():
+    # given
+    game = ChessGame()
+    game.new_game()
+
+    # when
+    result = game.current_game_state.moves_per_square
+
+    # then
+    assert {
+        algebraic_identifier: move
+        for moves_to_square in result.values()
+        for algebraic_identifier, move in moves_to_square.values()
+    } == game.current_game_state.legal_moves
+    assert result[(4, 6)][(4, 4)][0] == "e4"
+
+
+@pytest.mark.parametrize(
+    "fen, squares, expected_algebraic_identifier",
+    [
+        (
+            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+            ((6, 7), (5, 5)),
+            "Nf3",
+        ),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", ((4, 7), (6, 7)), "O-O"),
+        (
+            "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3",
+            ((3, 4), (4, 5)),
+            "xe3 e.p.",
+        ),
+    ],
+)
+def test_make_move_from_squares(fen, squares, expected_algebraic_identifier):
+    # given
+    game = ChessGame.from_fen(fen)
+    expected_move = game.current_game_state.legal_moves[expected_algebraic_identifier]
+
+    # when
+    result = game.make_move_from_squares(from_square=squares[0], to_square=squares[1])
+
+    # then
+    assert result
+    assert game.current_game_state.last_move == expected_move
+    assert game.current_game_state.last_move_algebraic == expected_algebraic_identifier
+
+
+def test_make_move_from_squares_rejects_illegal_move():
+    # given
+    game = ChessGame()
+    game.new_game()
+    fen = game.to_fen()
+
+    # when
+    result = game.make_move_from_squares(from_square=(4, 6), to_square=(4, 3))
+
+    # then
+    assert not result
+    assert game.to_fen() == fen
+
+
+@pytest.mark.parametrize(
+    "fen, algebraic_identifier",
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", "e4"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "O-O-O"),
+        ("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1", "xd5"),
+        ("rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3", "xe3 e.p."),
+    ],
+)
+def test_undo_move_restores_game_state(fen, algebraic_identifier):
+    # given
+    game = ChessGame.from_fen(fen)
+    game_state = game.current_game_state
+    game.make_move(move_in_algebraic_notation=algebraic_identifier)
+
+    # when
+    game.undo_move()
+
+    # then
+    assert game.current_game_state == game_state
+    assert game.current_game_state.legal_moves == game_state.legal_moves
+    assert game.history == []
+
+
+def test_undo_move_restores_last_move_of_previous_move():
+    # given
+    game = ChessGame()
+    game.new_game()
+    for algebraic_identifier in ("e4", "d5", "Nc3"):
+        game.make_move(move_in_algebraic_notation=algebraic_identifier)
+    game_state = game.current_game_state
+    game.make_move(move_in_algebraic_notation="xe4")
+
+    # when
+    game.undo_move()
+
+    # then
+    assert game.current_game_state == game_state
+    assert game.current_game_state.last_move_algebraic == "Nc3"
+    assert len(game.history) == 3
+
+
+def test_undo_move_without_history_keeps_game_state():
+    # given
+    game = ChessGame()
+    game.new_game()
+    game_state = game.current_game_state
+
+    # when
+    game.undo_move()
+
+    # then
+    assert game.current_game_state is game_state
+
+
+def test_make_move_records_history():
+    # given
+    game = ChessGame.from_fen("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+
+    # when
+    game.make_move(move_in_algebraic_notation="xd5")
+
+    # then
+    (history_entry,) = game.history
+    assert history_entry.algebraic_identifier == "xd5"
+    assert [piece.position for piece in history_entry.captured_pieces] == [(3, 3)]
+    assert history_entry.position_hash == game.current_game_state.position_hash
+
+
+def test_halfmove_clock_counts_moves_since_capture_or_pawn_move():
+    # given
+    game = ChessGame.from_fen("4k3/8/8/3p4/4P3/8/8/4K3 w - - 7 20")
+
+    # when
+    game.make_move(move_in_algebraic_notation="Kd2")
+    halfmove_clock_after_king_move = game.current_game_state.halfmove_clock
+    game.make_move(move_in_algebraic_notation="xe4")
+
+    # then
+    assert halfmove_clock_after_king_move == 8
+    assert game.current_game_state.halfmove_clock == 0
+    assert game.to_fen() == "4k3/8/8/8/4p3/8/3K4/8 w - - 0 21"
+    game.undo_move()
+    assert game.current_game_state.halfmove_clock == 8
+
+
+def test_threefold_repetition():
+    # given
+    game = ChessGame()
+    game.new_game()
+    moves = ("Nf3", "Nf6", "Ng1", "Ng8") * 2
+
+    # when
+    for move in moves[:-1]:
+        game.make_move(move_in_algebraic_notation=move)
+    game_over_type_before = game.get_game_over_type()
+    game.make_move(move_in_algebraic_notation=moves[-1])
+
+    # then
+    assert game_over_type_before is None
+    assert game.is_threefold_repetition()
+    assert game.get_game_over_type() == THREEFOLD_REPETITION
+    assert game.is_game_over()
+
+
+def test_get_reversible_position_hashes_stops_at_irreversible_move():
+    # given
+    game = ChessGame()
+    game.new_game()
+    for move in ("Nf3", "Nf6", "e4", "Ng8", "Ng1"):
+        game.make_move(move_in_algebraic_notation=move)
+
+    # when
+    result = game.get_reversible_position_hashes()
+
+    # then
+    assert result == [entry.position_hash for entry in game.history[2:4]]
+
+
+@pytest.mark.parametrize(
+    "fen, expected",
+    [
+        ("7k/8/8/8/8/8/8/K5R1 w - - 99 80", None),
+        ("7k/8/8/8/8/8/8/K5R1 w - - 100 80", FIFTY_MOVE_RULE),
+        ("7k/5Q2/6K1/8/8/8/8/8 b - - 100 80", STALEMATE),
+        ("7k/6Q1/6K1/8/8/8/8/8 b - - 100 80", CHECKMATE),
+    ],
+)
+def test_get_game_over_type(fen, expected):
+    # given
+    game = ChessGame.from_fen(fen)
+
+    # when
+    result = game.get_game_over_type()
+
+    # then
+    assert result == expected
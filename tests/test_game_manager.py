@@ -0,0 +1,111 @@
+import pytest
+
+from utahchess.chess import ChessGame
+from utahchess.game_manager import GameManager, restore_game, snapshot_game
+from utahchess.pgn import write_game
+
+
+def _play(moves, fen=None):
+    game = ChessGame.from_fen(fen) if fen else ChessGame()
+    if fen is None:
+        game.new_game()
+    for move in moves:
+        assert game.make_move(move_in_algebraic_notation=move)
+    return game
+
+
+def test_game_manager_stores_games_by_id():
+    # given
+    manager = GameManager()
+
+    # when
+    game_id1 = manager.new_game()
+    game_id2 = manager.new_game(fen="4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+    manager.get_game(game_id=game_id1).make_move(move_in_algebraic_notation="e4")
+
+    # then
+    assert game_id1 != game_id2
+    assert len(manager) == 2
+    assert set(manager) == {game_id1, game_id2}
+    assert len(manager.get_game(game_id=game_id1).history) == 1
+    assert manager.get_game(game_id=game_id2).history == []
+
+
+def test_game_manager_remove_game():
+    # given
+    manager = GameManager()
+    game_id = manager.new_game()
+
+    # when
+    manager.remove_game(game_id=game_id)
+
+    # then
+    assert game_id not in manager
+    with pytest.raises(KeyError):
+        manager.get_game(game_id=game_id)
+
+
+def test_chess_games_do_not_share_history():
+    # given
+    game1, game2 = ChessGame(), ChessGame()
+    game1.new_game()
+    game2.new_game()
+
+    # when
+    game1.make_move(move_in_algebraic_notation="e4")
+
+    # then
+    assert game2.history == []
+
+
+@pytest.mark.parametrize(
+    "fen, moves",
+    [
+        (None, ()),
+        (None, ("e4", "e5", "Nf3", "Nc6", "Bc4", "Nf6", "O-O")),
+        (
+            "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3",
+            ("xe3 e.p.", "d3", "xf2+", "Kxf2"),
+        ),
+    ],
+)
+def test_restore_game_from_snapshot(fen, moves):
+    # given
+    game = _play(moves=moves, fen=fen)
+
+    # when
+    result = restore_game(snapshot=snapshot_game(game=game))
+
+    # then
+    assert result.current_game_state == game.current_game_state
+    assert result.history == game.history
+    assert write_game(game=result) == write_game(game=game)
+
+
+def test_game_manager_snapshot_and_restore():
+    # given
+    manager = GameManager()
+    game_id = manager.new_game()
+    manager.get_game(game_id=game_id).make_move(move_in_algebraic_notation="d4")
+
+    # when
+    restored_game_id = manager.restore(
+        snapshot=manager.snapshot(game_id=game_id), game_id="restored"
+    )
+
+    # then
+    assert restored_game_id == "restored"
+    assert (
+        manager.get_game(game_id=restored_game_id).to_fen()
+        == manager.get_game(game_id=game_id).to_fen()
+    )
+
+
+@pytest.mark.parametrize(
+    "snapshot",
+    [b"", b"not a snapshot", snapshot_game(game=_play(moves=("e4",)))[:-1]],
+)
+def test_restore_game_raises_valueerror_for_invalid_snapshot(snapshot):
+    # when and then
+    with pytest.raises(ValueError):
+        restore_game(snapshot=snapshot)
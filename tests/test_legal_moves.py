@@ -2,7 +2,13 @@ import pytest
 
 from utahchess import BLACK, WHITE
 from utahchess.board import Board
-from utahchess.legal_moves import get_move_per_algebraic_identifier, is_checkmate
+from utahchess.legal_moves import (
+    get_algebraic_identifier,
+    get_legal_moves,
+    get_move_per_algebraic_identifier,
+    is_checkmate,
+    is_legal_move,
+)
 from utahchess.move import REGULAR_MOVE, Move, make_move
 
 
@@ -338,3 +344,115 @@ def test_is_checkmate_averted_by_en_passant():
     # then
     assert not is_checkmate(board=board, current_player=WHITE, last_move=last_move)
     assert is_checkmate(board=board, current_player=WHITE, last_move=None)
+
+
+@pytest.mark.parametrize(
+    ("board_string", "current_player"),
+    [
+        (
+            f"""br-bn-bb-bq-bk-bb-bn-br
+            bp-bp-bp-bp-bp-bp-bp-bp
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            wp-wp-wp-wp-wp-wp-wp-wp
+            wr-wn-wb-wq-wk-wb-wn-wr""",
+            WHITE,
+        ),
+        (
+            f"""oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-bk-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-wn-oo-oo-oo-wn-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            wr-oo-oo-oo-wk-oo-oo-wr""",
+            WHITE,
+        ),
+        (
+            f"""br-oo-oo-wq-oo-bk-oo-br
+            oo-oo-oo-oo-bn-oo-bp-oo
+            oo-wb-oo-oo-wp-bp-oo-oo
+            oo-bp-oo-oo-oo-wp-wn-oo
+            bq-wp-oo-oo-wp-oo-oo-bp
+            bb-oo-wp-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            wk-wn-oo-wb-oo-wn-oo-wr""",
+            BLACK,
+        ),
+    ],
+)
+def test_get_algebraic_identifier_same_as_for_all_legal_moves(
+    board_string, current_player
+):
+    # given
+    board = Board(board_string=board_string)
+    move_per_algebraic_identifier = get_move_per_algebraic_identifier(
+        board=board, current_player=current_player, last_move=None
+    )
+
+    # when
+    result = {
+        get_algebraic_identifier(
+            board=board, move=move, current_player=current_player
+        ): move
+        for move in move_per_algebraic_identifier.values()
+    }
+
+    # then
+    assert result == move_per_algebraic_identifier
+
+
+def test_is_legal_move():
+    # given
+    board = Board()
+    legal_moves = set(get_legal_moves(board=board, current_player=WHITE))
+    black_moves = set(get_legal_moves(board=board, current_player=BLACK))
+    moved_board = make_move(board=board, move=next(iter(legal_moves)))
+    moves_on_moved_board = set(get_legal_moves(board=moved_board, current_player=WHITE))
+
+    # then
+    assert all(
+        is_legal_move(board=board, move=move, current_player=WHITE)
+        for move in legal_moves
+    )
+    assert not any(
+        is_legal_move(board=board, move=move, current_player=WHITE)
+        for move in black_moves
+    )
+    assert not any(
+        is_legal_move(board=board, move=move, current_player=WHITE)
+        for move in moves_on_moved_board - legal_moves
+    )
+
+
+def test_is_legal_move_en_passant_depends_on_last_move():
+    # given
+    board_string = f"""bk-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-bp-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-wp-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-wk"""
+    board = Board(board_string=board_string)
+    last_move = Move(
+        type=REGULAR_MOVE,
+        piece_moves=(((4, 1), (4, 3)),),
+        moving_pieces=(board[(4, 1)],),
+        is_capturing_move=False,
+        allows_en_passant=True,
+    )
+    board = make_move(board=board, move=last_move)
+    en_passant_move = get_move_per_algebraic_identifier(
+        board=board, current_player=WHITE, last_move=last_move
+    )["xe6 e.p."]
+
+    # then
+    assert is_legal_move(
+        board=board, move=en_passant_move, current_player=WHITE, last_move=last_move
+    )
+    assert not is_legal_move(board=board, move=en_passant_move, current_player=WHITE)
@@ -6,13 +6,17 @@ from utahchess import BLACK, WHITE
 from utahchess.board import Board
 from utahchess.legal_moves import get_move_per_algebraic_identifier, is_checkmate
 from utahchess.minimax import (
+    DRAW_VALUE,
+    ChildNode,
     Node,
     create_children_from_parent,
     get_board_value,
     get_node_value,
+    get_quiescence_value,
     minimax,
 )
 from utahchess.move import make_move
+from utahchess.search_stats import SearchStats
 
 
 def test_get_board_value_on_symmetric_board():
@@ -147,6 +151,53 @@ def test_minimax_finds_checkmate_in_fools_mate(depth, ordered):
     assert resulting_value == float("inf")
 
 
+@pytest.mark.parametrize("depth", [1, 2])
+def test_minimax_scores_stalemate_as_draw(depth):
+    # given
+    parent_node = Node(
+        name="initial_node",
+        parent=None,
+        board=Board.from_fen("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1"),
+        last_move=None,
+        player=BLACK,
+    )
+
+    # when
+    best_node, value = minimax(
+        parent_node=parent_node,
+        value_function=partial(get_node_value, player=BLACK),
+        get_children=create_children_from_parent,
+        depth=depth,
+        maximizing_player=True,
+        alpha=-float("inf"),
+        beta=float("inf"),
+    )
+
+    # then
+    assert best_node is None
+    assert value == DRAW_VALUE
+
+
+def test_get_board_value_of_stalemate_only_for_player_to_move():
+    # given
+    board = Board.from_fen("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+
+    # when
+    result_black_to_move = get_board_value(
+        board=board,
+        player_that_just_made_the_move=WHITE,
+        last_move=None,
+        current_player=BLACK,
+    )
+    result_unknown_player_to_move = get_board_value(
+        board=board, player_that_just_made_the_move=WHITE, last_move=None
+    )
+
+    # then
+    assert result_black_to_move == DRAW_VALUE
+    assert result_unknown_player_to_move > DRAW_VALUE
+
+
 def test_minimax_with_dummy_game():
     # given
 
@@ -180,3 +231,166 @@ def test_minimax_with_dummy_game():
     # then
     assert result_value == 4
     assert result_node.name == "child_with_value_1_depth_1"
+
+
+@pytest.mark.parametrize(
+    ("prune", "expected_nodes_per_ply", "expected_beta_cutoffs"),
+    [(False, {0: 1, 1: 4, 2: 16, 3: 64}, 0), (True, {0: 1, 1: 4, 2: 7, 3: 28}, 6)],
+)
+def test_minimax_records_stats_with_dummy_game(
+    prune, expected_nodes_per_ply, expected_beta_cutoffs
+):
+    # given
+    parent_node = Node(name="parent", parent=None, value=3)
+    stats = SearchStats()
+
+    def children_nodes_function(parent_node):
+        return [
+            Node(name=f"child_{i+1}", parent=parent_node, value=(i + 1))
+            for i in range(4)
+        ]
+
+    def node_value_function(node):
+        return node.value
+
+    # when
+    result_node, result_value = minimax(
+        parent_node=parent_node,
+        value_function=node_value_function,
+        get_children=children_nodes_function,
+        depth=3,
+        maximizing_player=True,
+        alpha=-float("inf"),
+        beta=float("inf"),
+        prune=prune,
+        stats=stats,
+    )
+
+    # then
+    assert result_value == 4
+    assert stats.nodes_per_ply == expected_nodes_per_ply
+    assert stats.evaluation_calls == expected_nodes_per_ply[3]
+    assert stats.expanded_nodes == 1 + expected_nodes_per_ply[1] + (
+        expected_nodes_per_ply[2]
+    )
+    assert stats.beta_cutoffs == expected_beta_cutoffs
+    assert sum(stats.cutoff_move_indices.values()) == expected_beta_cutoffs
+    assert stats.elapsed_seconds > 0
+
+
+def test_minimax_with_stats_finds_checkmate_in_fools_mate():
+    # given
+    stats = SearchStats()
+    board = Board.from_fen(
+        "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
+    )
+    parent_node = Node(
+        name="parent", parent=None, board=board, last_move=None, player=BLACK
+    )
+
+    # when
+    resulting_node, resulting_value = minimax(
+        parent_node=parent_node,
+        value_function=get_node_value,
+        get_children=partial(create_children_from_parent, stats=stats),
+        depth=1,
+        alpha=-float("inf"),
+        beta=float("inf"),
+        maximizing_player=True,
+        stats=stats,
+    )
+
+    # then
+    assert resulting_node.name == "Qh4#"
+    assert resulting_value == float("inf")
+    assert stats.nodes_per_ply == {0: 1, 1: 1}
+    assert stats.evaluation_calls == 1
+    assert stats.first_move_cutoff_rate == 1.0
+    assert stats.move_generation_seconds > 0
+    assert stats.san_seconds > 0
+    assert stats.evaluation_seconds > 0
+
+
+@pytest.mark.parametrize("with_stats", [True, False])
+def test_create_children_from_parent_orders_losing_captures_last(with_stats):
+    # given
+    board = Board.from_fen("4k3/8/2p5/3p4/4P3/8/8/3QK3 w - - 0 1")
+    parent_node = Node(
+        name="parent", parent=None, board=board, last_move=None, player=WHITE
+    )
+
+    # when
+    children = create_children_from_parent(
+        parent_node=parent_node, stats=SearchStats() if with_stats else None
+    )
+
+    # then
+    names = [child_node.name for child_node in children]
+    assert names[0] == "xd5"
+    assert names[-1] == "Qxd5"
+
+
+def test_create_children_from_parent_computes_names_on_request():
+    # given
+    board = Board()
+    parent_node = Node(
+        name="parent", parent=None, board=board, last_move=None, player=WHITE
+    )
+    stats = SearchStats()
+
+    # when
+    children = list(create_children_from_parent(parent_node=parent_node, stats=stats))
+
+    # then
+    assert stats.san_seconds == 0
+    assert {child_node.name for child_node in children} == set(
+        get_move_per_algebraic_identifier(board=board, current_player=WHITE)
+    )
+    assert stats.san_seconds > 0
+
+
+def test_child_node_makes_board_on_first_access():
+    # given
+    board = Board()
+    parent_node = Node(
+        name="parent", parent=None, board=board, last_move=None, player=WHITE
+    )
+    move = get_move_per_algebraic_identifier(board=board, current_player=WHITE)["e4"]
+
+    # when
+    child_node = ChildNode(parent=parent_node, last_move=move)
+
+    # then
+    assert child_node.player == BLACK
+    assert child_node.board == make_move(board=board, move=move)
+    assert child_node.board is child_node.board
+    assert child_node.name == "e4"
+    assert repr(child_node) == "e4"
+
+
+def test_get_quiescence_value_resolves_pending_recapture():
+    # given
+    board = Board.from_fen("4k3/8/2p5/3Q4/8/8/8/4K3 b - - 0 1")
+    node = Node(name="Qxd5", parent=None, board=board, last_move=None, player=BLACK)
+
+    # when
+    value = get_node_value(node=node)
+    quiescence_value = get_quiescence_value(node=node)
+
+    # then
+    assert value > 0
+    assert quiescence_value < 0
+    assert get_quiescence_value(node=node, player=BLACK) == -quiescence_value
+
+
+def test_get_quiescence_value_of_quiet_node_equals_node_value():
+    # given
+    node = Node(
+        name="initial", parent=None, board=Board(), last_move=None, player=WHITE
+    )
+
+    # when
+    quiescence_value = get_quiescence_value(node=node, player=WHITE)
+
+    # then
+    assert quiescence_value == get_node_value(node=node, player=WHITE)
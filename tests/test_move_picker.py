@@ -0,0 +1,144 @@
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_move_per_algebraic_identifier
+from utahchess.move_picker import KillerMoves, pick_moves
+
+BOARD_STRING = f"""bk-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-bp-oo
+            oo-oo-oo-oo-oo-oo-oo-bp
+            oo-oo-oo-bn-oo-oo-oo-oo
+            oo-oo-oo-oo-wp-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-oo
+            oo-oo-oo-oo-oo-oo-oo-wq
+            oo-oo-oo-oo-oo-oo-oo-wk"""
+
+
+@pytest.fixture
+def board():
+    return Board(board_string=BOARD_STRING)
+
+
+@pytest.fixture
+def moves(board):
+    return get_move_per_algebraic_identifier(
+        board=board, current_player=WHITE, last_move=None
+    )
+
+
+@pytest.mark.parametrize(
+    ("board_string", "current_player"),
+    [
+        (BOARD_STRING, WHITE),
+        (BOARD_STRING, BLACK),
+        (
+            f"""br-oo-oo-oo-bk-oo-oo-br
+            bp-bp-bp-oo-oo-bp-bp-bp
+            oo-oo-bn-oo-oo-bn-oo-oo
+            oo-oo-oo-bp-bp-oo-oo-oo
+            oo-oo-oo-wp-wp-oo-oo-oo
+            oo-oo-wn-oo-oo-wn-oo-oo
+            wp-wp-wp-oo-oo-wp-wp-wp
+            wr-oo-oo-oo-wk-oo-oo-wr""",
+            WHITE,
+        ),
+    ],
+)
+def test_pick_moves_yields_every_legal_move_once(board_string, current_player):
+    # given
+    board = Board(board_string=board_string)
+    legal_moves = get_move_per_algebraic_identifier(
+        board=board, current_player=current_player, last_move=None
+    ).values()
+
+    # when
+    result = list(pick_moves(board=board, current_player=current_player))
+
+    # then
+    assert len(result) == len(legal_moves)
+    assert set(result) == set(legal_moves)
+
+
+def test_pick_moves_good_captures_first_and_bad_captures_last(board, moves):
+    # when
+    result = list(pick_moves(board=board, current_player=WHITE))
+
+    # then
+    assert result[0] == moves["xd5"]
+    assert result[-1] == moves["Qxh6"]
+
+
+def test_pick_moves_table_move_and_killer_moves_first(board, moves):
+    # when
+    result = list(
+        pick_moves(
+            board=board,
+            current_player=WHITE,
+            table_move=moves["Qh3"],
+            killer_moves=(moves["Kg1"],),
+        )
+    )
+
+    # then
+    assert result[:3] == [moves["Qh3"], moves["xd5"], moves["Kg1"]]
+    assert len(result) == len(moves)
+
+
+def test_pick_moves_skips_illegal_table_move_and_killer_moves(board, moves):
+    # given
+    black_moves = get_move_per_algebraic_identifier(
+        board=board, current_player=BLACK, last_move=None
+    )
+
+    # when
+    result = list(
+        pick_moves(
+            board=board,
+            current_player=WHITE,
+            table_move=black_moves["Ka7"],
+            killer_moves=(black_moves["g6"],),
+        )
+    )
+
+    # then
+    assert set(result) == set(moves.values())
+    assert result[0] == moves["xd5"]
+
+
+def test_pick_moves_validates_no_moves_before_yielding_table_move(
+    board, moves, monkeypatch
+):
+    # given
+    validated_moves = []
+
+    def is_valid_move(board, move):
+        validated_moves.append(move)
+        return True
+
+    monkeypatch.setattr("utahchess.move_picker.is_valid_move", is_valid_move)
+
+    # when
+    result = next(
+        pick_moves(board=board, current_player=WHITE, table_move=moves["Qh3"])
+    )
+
+    # then
+    assert result == moves["Qh3"]
+    assert not validated_moves
+
+
+def test_killer_moves_keeps_most_recent_quiet_moves(moves):
+    # given
+    killer_moves = KillerMoves(moves_per_ply=2)
+
+    # when
+    killer_moves.add(ply=1, move=moves["Kg1"])
+    killer_moves.add(ply=1, move=moves["Qxh6"])
+    killer_moves.add(ply=1, move=moves["Qh3"])
+    killer_moves.add(ply=1, move=moves["Qh4"])
+    killer_moves.add(ply=1, move=moves["Qh4"])
+
+    # then
+    assert killer_moves.get(ply=1) == (moves["Qh4"], moves["Qh3"])
+    assert killer_moves.get(ply=2) == ()
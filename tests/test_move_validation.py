@@ -1,9 +1,16 @@
 import pytest
 
+from utahchess import BLACK, WHITE
 from utahchess.board import Board
+from utahchess.legal_moves import get_legal_moves
 from utahchess.move import REGULAR_MOVE, Move, make_move
 from utahchess.move_candidates import get_king_move_candidates, get_pawn_move_candidates
-from utahchess.move_validation import is_valid_move
+from utahchess.move_validation import (
+    gives_check,
+    is_attacked,
+    is_check,
+    is_valid_move,
+)
 
 
 def test_is_valid_move_restricted_king():
@@ -157,3 +164,80 @@ def test_make_regular_move(board, from_move, to_move, expected):
 
     # then
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("fen", "position", "attacking_player", "expected"),
+    [
+        ("4k3/8/8/8/8/8/3P4/4K3 w - - 0 1", (2, 5), WHITE, True),
+        ("4k3/8/8/8/8/8/3P4/4K3 w - - 0 1", (3, 5), WHITE, False),
+        ("4k3/3p4/8/8/8/8/8/4K3 w - - 0 1", (4, 2), BLACK, True),
+        ("4k3/3p4/8/8/8/8/8/4K3 w - - 0 1", (4, 0), BLACK, False),
+        ("4k3/8/8/8/8/2n5/8/4K3 w - - 0 1", (3, 7), BLACK, True),
+        ("4k3/8/8/8/8/8/8/R3K3 w - - 0 1", (0, 0), WHITE, True),
+        ("4k3/8/8/8/8/8/p7/R3K3 w - - 0 1", (0, 0), WHITE, False),
+        ("4k3/8/8/8/8/8/8/B3K3 w - - 0 1", (7, 0), WHITE, True),
+        ("4k3/8/8/4p3/8/8/8/B3K3 w - - 0 1", (7, 0), WHITE, False),
+        ("4k3/8/8/8/8/8/8/Q3K3 w - - 0 1", (0, 4), WHITE, True),
+        ("4k3/8/8/8/8/8/8/4K3 w - - 0 1", (5, 6), WHITE, True),
+        ("4k3/8/8/8/8/8/8/4K3 w - - 0 1", (5, 6), BLACK, False),
+    ],
+)
+def test_is_attacked(fen, position, attacking_player, expected):
+    # given
+    board = Board.from_fen(fen)
+
+    # when
+    result = is_attacked(
+        board=board, position=position, attacking_player=attacking_player
+    )
+
+    # then
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player", "expected"),
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", WHITE, False),
+        ("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3", WHITE, True),
+        ("4k3/8/8/8/8/8/8/4R1K1 b - - 0 1", BLACK, True),
+        ("4k3/8/8/8/8/8/4p3/4R1K1 b - - 0 1", BLACK, False),
+        ("4k3/3P4/8/8/8/8/8/6K1 b - - 0 1", BLACK, True),
+    ],
+)
+def test_is_check(fen, current_player, expected):
+    # given
+    board = Board.from_fen(fen)
+
+    # when
+    result = is_check(board=board, current_player=current_player)
+
+    # then
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player", "expected_checks"),
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", WHITE, 0),
+        ("4k3/8/8/8/4N3/8/8/4R1K1 w - - 0 1", WHITE, 8),
+        ("5k2/8/8/8/8/8/8/4K2R w K - 0 1", WHITE, 3),
+        ("rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2", BLACK, 1),
+    ],
+)
+def test_gives_check_same_as_is_check_after_move(fen, current_player, expected_checks):
+    # given
+    board = Board.from_fen(fen)
+    enemy_player = WHITE if current_player == BLACK else BLACK
+    legal_moves = tuple(get_legal_moves(board=board, current_player=current_player))
+
+    # when
+    result = [gives_check(board=board, move=move) for move in legal_moves]
+
+    # then
+    assert result == [
+        is_check(board=make_move(board=board, move=move), current_player=enemy_player)
+        for move in legal_moves
+    ]
+    assert sum(result) == expected_checks
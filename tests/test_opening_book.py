@@ -0,0 +1,268 @@
+import io
+import random
+
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_move_per_algebraic_identifier
+from utahchess.move import make_move
+from utahchess.opening_book import (
+    BookEntry,
+    OpeningBook,
+    build_book,
+    decode_book_move,
+    encode_book_move,
+    main,
+    write_book,
+)
+from utahchess.pgn import read_games
+from utahchess.zobrist import get_position_hash
+
+PGN_TEXT = """[Event "First"]
+
+1. e4 e5 2. Nf3 Nc6 1-0
+
+[Event "Second"]
+
+1. e4 c5 2. Nf3 d6 0-1
+
+[Event "Third"]
+
+1. d4 d5 2. c4 1/2-1/2
+"""
+
+
+@pytest.fixture
+def book_path(tmp_path):
+    path = str(tmp_path / "book.bin")
+    write_book(
+        path=path, entries=build_book(pgn_games=read_games(io.StringIO(PGN_TEXT)))
+    )
+    return path
+
+
+def test_build_book_counts_moves_per_position():
+    # given
+    board = Board()
+    moves = get_move_per_algebraic_identifier(board=board, current_player=WHITE)
+
+    # when
+    result = build_book(pgn_games=read_games(io.StringIO(PGN_TEXT)), max_plies=1)
+
+    # then
+    assert sorted(result, key=lambda entry: entry.weight) == [
+        BookEntry(
+            key=get_position_hash(board=board, current_player=WHITE),
+            move=encode_book_move(move=moves["d4"]),
+            weight=1,
+        ),
+        BookEntry(
+            key=get_position_hash(board=board, current_player=WHITE),
+            move=encode_book_move(move=moves["e4"]),
+            weight=2,
+        ),
+    ]
+
+
+def test_write_book_merges_and_sorts_entries(tmp_path):
+    # given
+    path = str(tmp_path / "book.bin")
+    entries = [
+        BookEntry(key=7, move=1, weight=1),
+        BookEntry(key=3, move=2, weight=1),
+        BookEntry(key=7, move=2, weight=3),
+        BookEntry(key=7, move=1, weight=4),
+        BookEntry(key=2**64 - 1, move=5, weight=2**20),
+    ]
+
+    # when
+    num_entries = write_book(path=path, entries=entries)
+
+    # then
+    with OpeningBook(path=path) as book:
+        assert num_entries == len(book) == 4
+        assert book.get_entries(position_hash=7) == [
+            BookEntry(key=7, move=1, weight=5),
+            BookEntry(key=7, move=2, weight=3),
+        ]
+        assert book.get_entries(position_hash=3) == [BookEntry(key=3, move=2, weight=1)]
+        assert book.get_entries(position_hash=2**64 - 1) == [
+            BookEntry(key=2**64 - 1, move=5, weight=2**16 - 1)
+        ]
+        assert book.get_entries(position_hash=5) == []
+        assert book.get_entries(position_hash=0) == []
+
+
+def test_opening_book_choose_move(book_path):
+    # given
+    board = Board()
+    moves = get_move_per_algebraic_identifier(board=board, current_player=WHITE)
+
+    # when
+    with OpeningBook(path=book_path) as book:
+        result = {
+            book.choose_move(board=board, current_player=WHITE, rng=random.Random(seed))
+            for seed in range(20)
+        }
+
+    # then
+    assert result == {moves["e4"], moves["d4"]}
+
+
+def test_opening_book_choose_move_skips_illegal_moves(tmp_path):
+    # given
+    board = Board()
+    path = str(tmp_path / "book.bin")
+    key = get_position_hash(board=board, current_player=WHITE)
+    black_move = get_move_per_algebraic_identifier(board=board, current_player=BLACK)[
+        "e5"
+    ]
+    white_move = get_move_per_algebraic_identifier(board=board, current_player=WHITE)[
+        "e4"
+    ]
+    write_book(
+        path=path,
+        entries=[
+            BookEntry(key=key, move=encode_book_move(move=black_move), weight=1000),
+            BookEntry(key=key, move=encode_book_move(move=white_move), weight=1),
+        ],
+    )
+
+    # when
+    with OpeningBook(path=path) as book:
+        result = {
+            book.choose_move(board=board, current_player=WHITE, rng=random.Random(seed))
+            for seed in range(5)
+        }
+
+    # then
+    assert result == {white_move}
+
+
+def test_opening_book_choose_move_outside_of_book(book_path):
+    # given
+    board = Board.from_fen("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1")
+
+    # when
+    with OpeningBook(path=book_path) as book:
+        result = book.choose_move(board=board, current_player=WHITE)
+
+    # then
+    assert result is None
+
+
+def test_opening_book_choose_move_after_moves(book_path):
+    # given
+    board = Board()
+    e4 = get_move_per_algebraic_identifier(board=board, current_player=WHITE)["e4"]
+    board = make_move(board=board, move=e4)
+
+    # when
+    with OpeningBook(path=book_path) as book:
+        result = book.choose_move(board=board, current_player=BLACK, last_move=e4)
+
+    # then
+    assert (
+        result
+        in get_move_per_algebraic_identifier(
+            board=board, current_player=BLACK, last_move=e4
+        ).values()
+    )
+    assert result.piece_moves[0][0] in ((4, 1), (2, 1))
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player", "algebraic_identifier"),
+    [
+        ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", WHITE, "O-O"),
+        ("r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1", BLACK, "O-O-O"),
+        ("4k3/8/8/8/8/8/5n2/4K3 w - - 0 1", WHITE, "Kxf2"),
+    ],
+)
+def test_decode_book_move(fen, current_player, algebraic_identifier):
+    # given
+    board = Board.from_fen(fen)
+    move = get_move_per_algebraic_identifier(
+        board=board, current_player=current_player
+    )[algebraic_identifier]
+
+    # when
+    result = decode_book_move(
+        board=board,
+        book_move=encode_book_move(move=move),
+        current_player=current_player,
+    )
+
+    # then
+    assert result == move
+
+
+def test_decode_book_move_en_passant_depends_on_last_move():
+    # given
+    board = Board.from_fen("4k3/3p4/8/4P3/8/8/8/4K3 b - - 0 1")
+    last_move = get_move_per_algebraic_identifier(board=board, current_player=BLACK)[
+        "d5"
+    ]
+    board = make_move(board=board, move=last_move)
+    en_passant_move = get_move_per_algebraic_identifier(
+        board=board, current_player=WHITE, last_move=last_move
+    )["xd6 e.p."]
+    book_move = encode_book_move(move=en_passant_move)
+
+    # then
+    assert (
+        decode_book_move(
+            board=board,
+            book_move=book_move,
+            current_player=WHITE,
+            last_move=last_move,
+        )
+        == en_passant_move
+    )
+    assert (
+        decode_book_move(board=board, book_move=book_move, current_player=WHITE) is None
+    )
+
+
+def test_decode_book_move_of_illegal_move():
+    # given
+    board = Board()
+    black_move = get_move_per_algebraic_identifier(board=board, current_player=BLACK)[
+        "e5"
+    ]
+    book_move = encode_book_move(move=black_move)
+
+    # then
+    assert (
+        decode_book_move(board=board, book_move=book_move, current_player=WHITE) is None
+    )
+    assert decode_book_move(board=board, book_move=book_move, current_player=BLACK) == (
+        black_move
+    )
+    assert decode_book_move(board=board, book_move=0, current_player=BLACK) is None
+
+
+def test_opening_book_raises_valueerror(tmp_path):
+    # given
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"not a book")
+
+    # when and then
+    with pytest.raises(ValueError):
+        OpeningBook(path=str(path))
+
+
+def test_main_builds_book_from_pgn_file(tmp_path, capsys):
+    # given
+    pgn_path = tmp_path / "games.pgn"
+    pgn_path.write_text(PGN_TEXT)
+    book_path = tmp_path / "book.bin"
+
+    # when
+    main([str(pgn_path), str(book_path), "--max-plies", "2"])
+
+    # then
+    with OpeningBook(path=str(book_path)) as book:
+        assert len(book) == 5
+    assert "Wrote 5 entries" in capsys.readouterr().out
@@ -0,0 +1,166 @@
+import io
+
+import pytest
+
+from utahchess import WHITE
+from utahchess.chess import ChessGame
+from utahchess.pgn import (
+    PgnGame,
+    find_algebraic_identifier,
+    read_games,
+    replay_game,
+    write_game,
+)
+
+PGN_TEXT = """[Event "Fool's mate"]
+[Site "?"]
+[Result "0-1"]
+
+1. f3 {a bad idea} e5 2. g4?? (2. e4 Qh4+ 3. g3) Qh4# 0-1
+
+[Event "En passant"]
+[White "Someone \\"quoted\\""]
+
+1. e4 $1 d5 2. e5 f5 3. exf6 Nxf6 *
+
+1. d4 d5 2. Nf3 Nf6
+"""
+
+
+def test_read_games():
+    # when
+    result = list(read_games(lines=io.StringIO(PGN_TEXT)))
+
+    # then
+    assert result == [
+        PgnGame(
+            headers={"Event": "Fool's mate", "Site": "?", "Result": "0-1"},
+            moves=("f3", "e5", "g4??", "Qh4#"),
+            result="0-1",
+        ),
+        PgnGame(
+            headers={"Event": "En passant", "White": 'Someone "quoted"'},
+            moves=("e4", "d5", "e5", "f5", "exf6", "Nxf6"),
+            result="*",
+        ),
+        PgnGame(headers={}, moves=("d4", "d5", "Nf3", "Nf6"), result="*"),
+    ]
+
+
+def test_read_games_is_lazy():
+    # given
+    def lines():
+        yield from io.StringIO(PGN_TEXT)
+        raise AssertionError("Reader consumed more lines than needed.")
+
+    # when
+    result = next(read_games(lines=lines()))
+
+    # then
+    assert result.moves == ("f3", "e5", "g4??", "Qh4#")
+
+
+@pytest.mark.parametrize(
+    ("san", "expected_identifier"),
+    [
+        ("Qh4", "Qh4#"),
+        ("Qh4+", "Qh4#"),
+        ("Qh4#", "Qh4#"),
+        ("Qdh4", "Qh4#"),
+        ("Qd8h4!", "Qh4#"),
+    ],
+)
+def test_find_algebraic_identifier_tolerates_flags(san, expected_identifier):
+    # given
+    game = ChessGame.from_fen(
+        "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq g3 0 2"
+    )
+
+    # when
+    result = find_algebraic_identifier(
+        san=san, legal_moves=game.current_game_state.legal_moves
+    )
+
+    # then
+    assert result == expected_identifier
+
+
+@pytest.mark.parametrize("san", ["exf6", "exf6 e.p.", "exf6ep", "xf6"])
+def test_find_algebraic_identifier_with_en_passant(san):
+    # given
+    game = ChessGame.from_fen(
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
+    )
+
+    # when
+    result = find_algebraic_identifier(
+        san=san, legal_moves=game.current_game_state.legal_moves
+    )
+
+    # then
+    assert result == "xf6 e.p."
+
+
+@pytest.mark.parametrize("san", ["Ke2", "e8=Q", "Nc3c4", "O-O"])
+def test_find_algebraic_identifier_raises_valueerror(san):
+    # given
+    game = ChessGame.from_fen(
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    )
+
+    # when and then
+    with pytest.raises(ValueError):
+        find_algebraic_identifier(
+            san=san, legal_moves=game.current_game_state.legal_moves
+        )
+
+
+def test_replay_game():
+    # given
+    pgn_game = list(read_games(lines=io.StringIO(PGN_TEXT)))[1]
+
+    # when
+    result = replay_game(pgn_game=pgn_game)
+
+    # then
+    assert result.get_current_player() == WHITE
+    assert result.current_game_state.last_move_algebraic == "Nxf6"
+    assert result.to_fen() == (
+        "rnbqkb1r/ppp1p1pp/5n2/3p4/8/8/PPPP1PPP/RNBQKBNR w KQkq - 0 4"
+    )
+
+
+def test_write_game_round_trip():
+    # given
+    pgn_game = PgnGame(moves=("e4", "d5", "e5", "f5", "exf6", "Nxf6", "d4"))
+    game = replay_game(pgn_game=pgn_game)
+
+    # when
+    result = write_game(game=game, headers={"White": "Human"})
+
+    # then
+    assert result == (
+        '[Event "?"]\n[Site "?"]\n[Date "????.??.??"]\n[Round "?"]\n'
+        '[White "Human"]\n[Black "?"]\n[Result "*"]\n\n'
+        "1. e4 d5 2. e5 f5 3. exf6 Nxf6 4. d4 *\n\n"
+    )
+    assert next(read_games(lines=io.StringIO(result))).moves == pgn_game.moves
+
+
+def test_write_game_from_fen_with_black_to_move():
+    # given
+    fen = "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq g3 0 2"
+    game = replay_game(pgn_game=PgnGame(headers={"FEN": fen}, moves=("Qh4",)))
+
+    # when
+    result = write_game(game=game)
+
+    # then
+    assert f'[FEN "{fen}"]' in result
+    assert '[Result "0-1"]' in result
+    assert result.endswith("2... Qh4# 0-1\n\n")
+    assert game.get_current_player() == WHITE
+    assert (
+        replay_game(pgn_game=next(read_games(lines=io.StringIO(result)))).to_fen()
+        == game.to_fen()
+    )
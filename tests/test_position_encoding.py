@@ -0,0 +1,78 @@
+import pytest
+
+from utahchess import BLACK
+from utahchess.board import Board
+from utahchess.position_encoding import (
+    RECORD_SIZE,
+    count_positions,
+    decode_board,
+    decode_fen,
+    encode_board,
+    encode_fen,
+    read_encoded_positions,
+    read_positions,
+    write_positions,
+)
+
+FENS = (
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "8/4k3/8/PpP5/8/8/8/3K4 w - b6 0 1",
+    "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 0 1",
+    "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+)
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_encode_fen_round_trip(fen):
+    # when
+    result = encode_fen(fen=fen)
+
+    # then
+    assert len(result) == RECORD_SIZE
+    assert decode_fen(data=result) == fen
+
+
+def test_encode_board_round_trip():
+    # given
+    board = Board()
+
+    # when
+    result = decode_board(data=encode_board(board=board, current_player=BLACK))
+
+    # then
+    assert result == board
+
+
+@pytest.mark.parametrize("fen", ["", "8/8/8/8/8/8/8/7 w - - 0 1", "8/8/8/x7/8/8/8/8"])
+def test_encode_fen_raises_valueerror(fen):
+    # when and then
+    with pytest.raises(ValueError):
+        encode_fen(fen=fen)
+
+
+def test_write_and_read_positions(tmp_path):
+    # given
+    path = str(tmp_path / "positions.bin")
+
+    # when
+    num_written = write_positions(
+        path=path, encoded_positions=(encode_fen(fen=fen) for fen in FENS)
+    )
+
+    # then
+    assert num_written == len(FENS) == count_positions(path=path)
+    assert list(read_positions(path=path)) == [Board.from_fen(fen) for fen in FENS]
+    assert [
+        decode_fen(data=data)
+        for data in read_encoded_positions(path=path, start=1, stop=3)
+    ] == list(FENS[1:3])
+
+
+def test_read_positions_raises_valueerror_for_other_files(tmp_path):
+    # given
+    path = tmp_path / "positions.bin"
+    path.write_bytes(b"not a file of positions")
+
+    # when and then
+    with pytest.raises(ValueError):
+        next(read_positions(path=str(path)))
@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utahchess import WHITE, legal_moves, move_validation
+from utahchess.board import Board
+from utahchess.legal_moves import get_move_per_algebraic_identifier
+from utahchess.profiling import Profiler
+
+
+def test_profiler_counts_calls_and_restores_functions():
+    # given
+    original_is_check = move_validation.is_check
+
+    # when
+    with Profiler() as profiler:
+        is_check_during_profiling = legal_moves.is_check
+        get_move_per_algebraic_identifier(board=Board(), current_player=WHITE)
+
+    # then
+    assert is_check_during_profiling is not original_is_check
+    assert move_validation.is_check is original_is_check
+    assert legal_moves.is_check is original_is_check
+    assert profiler.calls["is_checkmate"] == 20
+    assert profiler.calls["get_all_move_candidates"] > 0
+    assert all(profiler.total_ns[name] > 0 for name in profiler.calls)
+    assert "is_checkmate" in profiler.get_report()
+
+
+def test_profiler_writes_chrome_trace(tmp_path):
+    # given
+    trace_path = tmp_path / "trace.json"
+
+    # when
+    with Profiler(trace=True) as profiler:
+        get_move_per_algebraic_identifier(board=Board(), current_player=WHITE)
+    profiler.write_chrome_trace(path=str(trace_path))
+
+    # then
+    result = json.loads(trace_path.read_text())["traceEvents"]
+    assert len(result) >= sum(profiler.calls.values())
+    assert {event["ph"] for event in result} == {"X"}
+
+
+def test_profiler_raises_runtimeerror_if_nested():
+    # when and then
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            Profiler().enable()
+
+
+def test_profiling_from_environment():
+    # given
+    environment = {
+        **os.environ,
+        "UTAHCHESS_PROFILE": "1",
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+
+    # when
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from utahchess.chess import ChessGame; game = ChessGame(); "
+            "game.new_game(); game.get_legal_moves()",
+        ],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then
+    assert "is_checkmate" in result.stderr
+    assert result.stdout == ""
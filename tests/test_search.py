@@ -0,0 +1,621 @@
+from functools import partial
+
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_legal_moves, is_legal_move
+from utahchess.minimax import (
+    Node,
+    create_children_from_parent,
+    get_node_value,
+    minimax,
+)
+from utahchess.move import make_move
+from utahchess.opening_book import BookEntry, OpeningBook, encode_book_move, write_book
+from utahchess.search import (
+    BOOK_DEPTH,
+    DRAW_VALUE,
+    TABLEBASE_WIN_VALUE,
+    get_ponder_move,
+    iterative_deepening,
+    mtdf,
+    multipv_search,
+)
+from utahchess.search_stats import SearchStats
+from utahchess.tablebase import Tablebases
+from utahchess.time_manager import TimeManager
+from utahchess.transposition_table import TranspositionTable
+from utahchess.zobrist import get_position_hash
+
+
+def test_iterative_deepening_finds_checkmate_in_fools_mate():
+    # given
+    board = Board.from_fen(
+        "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
+    )
+    infos = []
+
+    # when
+    result = iterative_deepening(
+        board=board, current_player=BLACK, max_depth=3, on_iteration=infos.append
+    )
+
+    # then
+    assert result is not None
+    assert result.best_move_identifier == "Qh4#"
+    assert result.value == float("inf")
+    assert infos == [result]
+
+
+def test_iterative_deepening_reports_every_depth():
+    # given
+    board = Board.from_fen("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1")
+    infos = []
+
+    # when
+    result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=2, on_iteration=infos.append
+    )
+
+    # then
+    assert [info.depth for info in infos] == [1, 2]
+    assert result == infos[-1]
+    assert infos[0].nodes < infos[1].nodes
+
+
+def test_iterative_deepening_returns_last_completed_iteration_when_stopped():
+    # given
+    board = Board()
+    infos = []
+
+    # when
+    result = iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        should_stop=lambda: len(infos) == 1,
+        on_iteration=infos.append,
+    )
+
+    # then
+    assert result is not None
+    assert result.depth == 1
+
+
+def test_iterative_deepening_returns_none_without_legal_moves():
+    # given
+    board = Board.from_fen("k7/8/1Q6/8/8/8/8/7K b - - 0 1")
+
+    # when
+    result = iterative_deepening(board=board, current_player=BLACK, max_depth=2)
+
+    # then
+    assert result is None
+
+
+def test_iterative_deepening_scores_repetitions_as_draws():
+    # given
+    board = Board.from_fen("7k/8/8/8/8/8/8/KQ6 w - - 0 1")
+    previous_position_hashes = tuple(
+        get_position_hash(
+            board=make_move(board=board, move=move),
+            current_player=BLACK,
+            last_move=move,
+        )
+        for move in get_legal_moves(board=board, current_player=WHITE)
+    )
+
+    # when
+    result = iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=1,
+        previous_position_hashes=previous_position_hashes,
+        halfmove_clock=len(previous_position_hashes),
+    )
+
+    # then
+    assert result is not None
+    assert result.value == DRAW_VALUE
+
+
+def test_iterative_deepening_without_repetitions_scores_material():
+    # given
+    board = Board.from_fen("7k/8/8/8/8/8/8/KQ6 w - - 0 1")
+
+    # when
+    result = iterative_deepening(board=board, current_player=WHITE, max_depth=1)
+
+    # then
+    assert result is not None
+    assert result.value > DRAW_VALUE
+
+
+def test_iterative_deepening_scores_fifty_move_rule_as_draw():
+    # given
+    board = Board.from_fen("7k/8/8/8/8/8/8/KQ6 w - - 99 80")
+
+    # when
+    result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=1, halfmove_clock=99
+    )
+
+    # then
+    assert result is not None
+    assert result.value == DRAW_VALUE
+
+
+def test_iterative_deepening_with_aspiration_windows_finds_same_values():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    infos_with_windows = []
+    infos_without_windows = []
+
+    # when
+    iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=3,
+        on_iteration=infos_with_windows.append,
+        aspiration_windows=(0.25, 1.0),
+    )
+    iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=3,
+        on_iteration=infos_without_windows.append,
+        aspiration_windows=(),
+    )
+
+    # then
+    assert [info.value for info in infos_with_windows] == [
+        info.value for info in infos_without_windows
+    ]
+
+
+def test_iterative_deepening_counts_aspiration_researches():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    stats = SearchStats()
+    stats_without_windows = SearchStats()
+
+    # when
+    result = iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=3,
+        stats=stats,
+        aspiration_windows=(0.0,),
+    )
+    result_without_windows = iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=3,
+        stats=stats_without_windows,
+        aspiration_windows=(),
+    )
+
+    # then
+    assert result is not None and result_without_windows is not None
+    assert result.value == result_without_windows.value
+    assert stats.aspiration_researches > 0
+    assert stats_without_windows.aspiration_researches == 0
+    assert stats.to_dict()["aspiration_researches"] == stats.aspiration_researches
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1",
+        "r3k2r/ppp2ppp/2n5/3qp3/8/2N2N2/PPP2PPP/R2QK2R b KQkq - 0 1",
+    ],
+)
+def test_mtdf_finds_minimax_value(fen, depth):
+    # given
+    board = Board.from_fen(fen)
+    player = WHITE if " w " in fen else BLACK
+    _, minimax_value = minimax(
+        parent_node=Node(
+            name="root", parent=None, board=board, last_move=None, player=player
+        ),
+        value_function=partial(get_node_value, player=player),
+        get_children=create_children_from_parent,
+        depth=depth,
+        maximizing_player=True,
+        alpha=-float("inf"),
+        beta=float("inf"),
+    )
+
+    # when
+    best_node, value = mtdf(board=board, player=player, first_guess=0.0, depth=depth)
+
+    # then
+    assert best_node is not None
+    assert value == minimax_value
+
+
+def test_mtdf_finds_checkmate_in_fools_mate():
+    # given
+    board = Board.from_fen(
+        "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
+    )
+
+    # when
+    best_node, value = mtdf(board=board, player=BLACK, first_guess=0.0, depth=3)
+
+    # then
+    assert best_node is not None
+    assert best_node.name == "Qh4#"
+    assert value == float("inf")
+
+
+def test_mtdf_returns_none_without_legal_moves():
+    # given
+    board = Board.from_fen("k7/8/1Q6/8/8/8/8/7K b - - 0 1")
+
+    # when
+    best_node, value = mtdf(board=board, player=BLACK, first_guess=0.0, depth=2)
+
+    # then
+    assert best_node is None
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_mtdf_scores_stalemate_as_draw(depth):
+    # given
+    board = Board.from_fen("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+
+    # when
+    best_node, value = mtdf(board=board, player=BLACK, first_guess=0.0, depth=depth)
+
+    # then
+    assert best_node is None
+    assert value == DRAW_VALUE
+
+
+def test_mtdf_reuses_transposition_table():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    table = TranspositionTable()
+    first_stats = SearchStats()
+    second_stats = SearchStats()
+
+    # when
+    _, first_value = mtdf(
+        board=board,
+        player=WHITE,
+        first_guess=0.0,
+        depth=3,
+        table=table,
+        stats=first_stats,
+    )
+    _, second_value = mtdf(
+        board=board,
+        player=WHITE,
+        first_guess=0.0,
+        depth=3,
+        table=table,
+        stats=second_stats,
+    )
+
+    # then
+    assert first_value == second_value
+    assert second_stats.tt_hits > 0
+    assert second_stats.nodes < first_stats.nodes
+
+
+def test_iterative_deepening_reuses_transposition_table():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    table = TranspositionTable()
+    first_stats = SearchStats()
+    second_stats = SearchStats()
+
+    # when
+    first_result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=3, stats=first_stats, table=table
+    )
+    second_result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=3, stats=second_stats, table=table
+    )
+
+    # then
+    assert first_result is not None and second_result is not None
+    assert first_result.value == second_result.value
+    assert second_stats.nodes < first_stats.nodes
+
+
+def test_iterative_deepening_reports_principal_variation_from_table():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    infos = []
+
+    # when
+    iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=3,
+        on_iteration=infos.append,
+        table=TranspositionTable(),
+    )
+
+    # then
+    assert len(infos[0].principal_variation) == 1
+    assert all(1 < len(info.principal_variation) <= info.depth for info in infos[1:])
+    for info in infos:
+        assert info.principal_variation[0] == info.best_move_identifier
+        assert info.principal_variation_moves[0] == info.best_move
+        assert len(info.principal_variation_moves) == len(info.principal_variation)
+        line_board, player, last_move = board, WHITE, None
+        for move in info.principal_variation_moves:
+            assert is_legal_move(
+                board=line_board,
+                move=move,
+                current_player=player,
+                last_move=last_move,
+            )
+            line_board = make_move(board=line_board, move=move)
+            player, last_move = (BLACK if player == WHITE else WHITE), move
+
+
+def test_iterative_deepening_without_table_reports_best_move_as_principal_variation():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+
+    # when
+    result = iterative_deepening(board=board, current_player=WHITE, max_depth=2)
+
+    # then
+    assert result is not None
+    assert result.principal_variation == (result.best_move_identifier,)
+    assert result.principal_variation_moves == (result.best_move,)
+
+
+def test_get_ponder_move_returns_legal_reply_to_best_move():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    table = TranspositionTable()
+    result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=3, table=table
+    )
+    assert result is not None
+
+    # when
+    ponder_move = get_ponder_move(
+        board=board, current_player=WHITE, best_move=result.best_move, table=table
+    )
+
+    # then
+    assert ponder_move is not None
+    assert is_legal_move(
+        board=make_move(board=board, move=result.best_move),
+        move=ponder_move,
+        current_player=BLACK,
+        last_move=result.best_move,
+    )
+
+
+def test_get_ponder_move_returns_none_for_unknown_position():
+    # given
+    board = Board()
+    best_move = next(get_legal_moves(board=board, current_player=WHITE))
+
+    # when
+    result = get_ponder_move(
+        board=board,
+        current_player=WHITE,
+        best_move=best_move,
+        table=TranspositionTable(),
+    )
+
+    # then
+    assert result is None
+
+
+def test_iterative_deepening_stops_with_single_legal_move_under_time_manager():
+    # given
+    board = Board.from_fen("7k/8/8/8/8/8/6q1/7K w - - 0 1")
+    infos = []
+
+    # when
+    result = iterative_deepening(
+        board=board,
+        current_player=WHITE,
+        max_depth=4,
+        on_iteration=infos.append,
+        time_manager=TimeManager(remaining_seconds=60.0),
+    )
+
+    # then
+    assert result is not None
+    assert result.best_move_identifier == "Kxg2"
+    assert len(infos) == 1
+
+
+def test_iterative_deepening_returns_in_time_under_time_manager():
+    # given
+    time_manager = TimeManager(remaining_seconds=1.0, moves_to_go=1)
+
+    # when
+    result = iterative_deepening(
+        board=Board(),
+        current_player=WHITE,
+        time_manager=time_manager,
+    )
+
+    # then
+    assert result is not None
+    assert time_manager.elapsed_seconds < 1.0
+
+
+def test_iterative_deepening_with_quiescence_avoids_defended_pawn():
+    # given
+    board = Board.from_fen("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+
+    # when
+    result = iterative_deepening(board=board, current_player=WHITE, max_depth=1)
+    quiescence_result = iterative_deepening(
+        board=board, current_player=WHITE, max_depth=1, quiescence=True
+    )
+
+    # then
+    assert result is not None and quiescence_result is not None
+    assert result.best_move_identifier == "Qxd5"
+    assert quiescence_result.best_move_identifier != "Qxd5"
+    assert quiescence_result.value < result.value
+
+
+def test_iterative_deepening_plays_book_move_without_searching(tmp_path):
+    # given
+    board = Board()
+    book_path = str(tmp_path / "book.bin")
+    book_move = next(get_legal_moves(board=board, current_player=WHITE))
+    write_book(
+        path=book_path,
+        entries=[
+            BookEntry(
+                key=get_position_hash(board=board, current_player=WHITE),
+                move=encode_book_move(move=book_move),
+                weight=1,
+            )
+        ],
+    )
+    stats = SearchStats()
+    infos = []
+
+    # when
+    with OpeningBook(path=book_path) as book:
+        result = iterative_deepening(
+            board=board,
+            current_player=WHITE,
+            on_iteration=infos.append,
+            stats=stats,
+            book=book,
+        )
+
+    # then
+    assert result is not None
+    assert result.depth == BOOK_DEPTH
+    assert result.best_move == book_move
+    assert infos == [result]
+    assert stats.nodes == 0
+
+
+def test_iterative_deepening_scores_tablebase_positions_exactly(tablebase_directory):
+    # given
+    board = Board.from_fen("k7/8/1K6/8/8/8/8/6Q1 w - - 0 1")
+    stats = SearchStats()
+    infos = []
+
+    # when
+    with Tablebases(directory=tablebase_directory) as tablebases:
+        result = iterative_deepening(
+            board=board,
+            current_player=WHITE,
+            max_depth=4,
+            on_iteration=infos.append,
+            stats=stats,
+            tablebases=tablebases,
+        )
+
+    # then
+    assert result is not None
+    assert result.best_move_identifier == "Qg8#"
+    assert result.value == TABLEBASE_WIN_VALUE - 1
+    assert infos == [result]
+    assert set(stats.nodes_per_ply) == {0, 1}
+    assert stats.tablebase_hits == stats.nodes_per_ply[1]
+
+
+def test_mtdf_does_not_search_below_tablebase_positions(tablebase_directory):
+    # given
+    board = Board.from_fen("8/8/8/3k4/8/8/8/Q3K3 w - - 0 1")
+    stats = SearchStats()
+
+    # when
+    with Tablebases(directory=tablebase_directory) as tablebases:
+        plies_to_mate = tablebases.probe(
+            board=board, current_player=WHITE
+        ).plies_to_mate
+        best_node, value = mtdf(
+            board=board,
+            player=WHITE,
+            first_guess=0.0,
+            depth=3,
+            stats=stats,
+            tablebases=tablebases,
+        )
+        best_child_result = tablebases.probe(
+            board=best_node.board, current_player=BLACK
+        )
+
+    # then
+    assert value == TABLEBASE_WIN_VALUE - plies_to_mate
+    assert best_child_result.plies_to_mate == plies_to_mate - 1
+    assert set(stats.nodes_per_ply) == {0, 1}
+
+
+def test_multipv_search_finds_values_of_best_moves():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    depth = 2
+    move_values = sorted(
+        (
+            -mtdf(
+                board=make_move(board=board, move=move),
+                player=BLACK,
+                first_guess=0.0,
+                depth=depth - 1,
+                last_move=move,
+            )[1]
+            for move in get_legal_moves(board=board, current_player=WHITE)
+        ),
+        reverse=True,
+    )
+
+    # when
+    lines = multipv_search(board=board, player=WHITE, depth=depth, multipv=3)
+
+    # then
+    assert [line.value for line in lines] == move_values[:3]
+    assert [line.rank for line in lines] == [1, 2, 3]
+    assert len({line.best_move for line in lines}) == 3
+    assert all(len(line.principal_variation) == depth for line in lines)
+
+
+def test_multipv_search_first_line_is_best_move_of_mtdf():
+    # given
+    board = Board.from_fen("4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+    best_node, value = mtdf(board=board, player=WHITE, first_guess=0.0, depth=2)
+    iterations = []
+
+    # when
+    lines = multipv_search(
+        board=board, player=WHITE, depth=2, multipv=2, on_iteration=iterations.append
+    )
+
+    # then
+    assert lines[0].value == value
+    assert lines[0].principal_variation[0] == best_node.name
+    assert [[line.depth for line in iteration] for iteration in iterations] == [
+        [1, 1],
+        [2, 2],
+    ]
+
+
+def test_multipv_search_returns_a_line_per_legal_move_at_most():
+    # given
+    board = Board.from_fen("7k/8/8/8/8/8/8/K5R1 b - - 0 1")
+
+    # when
+    lines = multipv_search(board=board, player=BLACK, depth=2, multipv=3)
+
+    # then
+    assert [line.principal_variation[0] for line in lines] == ["Kh7"]
+
+
+def test_multipv_search_raises_without_lines():
+    # when and then
+    with pytest.raises(ValueError):
+        multipv_search(board=Board(), player=WHITE, depth=1, multipv=0)
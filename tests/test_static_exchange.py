@@ -0,0 +1,89 @@
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.chess import ChessGame
+from utahchess.legal_moves import get_move_per_algebraic_identifier
+from utahchess.static_exchange import get_least_valuable_attacker, see
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player", "algebraic_identifier", "expected"),
+    [
+        # Undefended pawn
+        ("4k3/8/8/3p4/8/8/8/3QK3 w - - 0 1", WHITE, "Qxd5", 1),
+        # Pawn defended by a pawn
+        ("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1", WHITE, "Qxd5", -8),
+        # Pawn takes defended pawn
+        ("4k3/8/2p5/3p4/4P3/8/8/4K3 w - - 0 1", WHITE, "xd5", 0),
+        # Rooks behind each other join the exchange
+        ("3rk3/3r4/8/3p4/8/8/3R4/3RK3 w - - 0 1", WHITE, "Rxd5", -4),
+        ("3rk3/8/8/3p4/8/8/3R4/3RK3 w - - 0 1", WHITE, "Rxd5", 1),
+        # A king recaptures, but not on a defended square
+        ("4k3/3p4/8/8/8/8/8/3QK3 w - - 0 1", WHITE, "Qxd7+", -8),
+        ("8/8/8/8/8/2k5/3p4/3QK3 w - - 0 1", WHITE, "Qxd2+", 1),
+    ],
+)
+def test_see(fen, current_player, algebraic_identifier, expected):
+    # given
+    board = Board.from_fen(fen)
+    move = get_move_per_algebraic_identifier(
+        board=board, current_player=current_player
+    )[algebraic_identifier]
+
+    # when
+    result = see(board=board, move=move)
+
+    # then
+    assert result == expected
+
+
+def test_see_of_en_passant_capture():
+    # given
+    game_state = ChessGame.from_fen(
+        "4k3/4p3/8/3pP3/8/8/8/4K3 w - d6 0 1"
+    ).current_game_state
+    move = get_move_per_algebraic_identifier(
+        board=game_state.board,
+        current_player=WHITE,
+        last_move=game_state.last_move,
+    )["xd6 e.p."]
+
+    # when
+    result = see(board=game_state.board, move=move)
+
+    # then
+    assert result == 0
+
+
+def test_get_least_valuable_attacker():
+    # given
+    board = Board.from_fen("3qk3/8/2n5/3p4/4P3/8/8/3RK3 b - - 0 1")
+
+    # when
+    white_attacker = get_least_valuable_attacker(
+        board=board, position=(3, 3), attacking_player=WHITE
+    )
+    black_attacker = get_least_valuable_attacker(
+        board=board, position=(4, 4), attacking_player=BLACK
+    )
+
+    # then
+    assert white_attacker == (4, 4)
+    assert black_attacker == (3, 3)
+
+
+def test_get_least_valuable_attacker_ignores_removed_positions():
+    # given
+    board = Board.from_fen("3qk3/8/8/3p4/8/8/3R4/3RK3 w - - 0 1")
+
+    # when
+    attacker = get_least_valuable_attacker(
+        board=board,
+        position=(3, 3),
+        attacking_player=WHITE,
+        removed_positions={(3, 6)},
+    )
+
+    # then
+    assert attacker == (3, 7)
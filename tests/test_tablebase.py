@@ -0,0 +1,148 @@
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.tablebase import (
+    DRAW,
+    HEADER_SIZE,
+    INVALID_ENTRY,
+    LOSS,
+    WIN,
+    Tablebase,
+    TablebaseResult,
+    Tablebases,
+    generate_table,
+    get_table_path,
+    main,
+)
+
+
+@pytest.fixture
+def kqk_path(tablebase_directory):
+    return get_table_path(directory=tablebase_directory, material="KQK")
+
+
+def test_generate_table_finds_longest_mates_of_kqk(kqk_path):
+    # given
+    with open(kqk_path, "rb") as file:
+        table = file.read()[HEADER_SIZE:]
+
+    # when
+    plies_to_mate = [entry - 1 for entry in table if entry != INVALID_ENTRY]
+
+    # then
+    assert max(plies for plies in plies_to_mate if plies % 2 == 1) == 19
+    assert max(plies for plies in plies_to_mate if plies % 2 == 0) == 20
+
+
+def test_generate_table_raises_for_unknown_material():
+    # when and then
+    with pytest.raises(ValueError):
+        generate_table(material="KQQK")
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player", "expected"),
+    [
+        (
+            "k7/1Q6/1K6/8/8/8/8/8 b - - 0 1",
+            BLACK,
+            TablebaseResult(outcome=LOSS, plies_to_mate=0),
+        ),
+        (
+            "k7/8/1K6/8/8/8/8/6Q1 w - - 0 1",
+            WHITE,
+            TablebaseResult(outcome=WIN, plies_to_mate=1),
+        ),
+        (
+            "k7/2Q5/1K6/8/8/8/8/8 b - - 0 1",
+            BLACK,
+            TablebaseResult(outcome=DRAW, plies_to_mate=None),
+        ),
+        (
+            "8/8/8/8/8/8/1Qk5/7K b - - 0 1",
+            BLACK,
+            TablebaseResult(outcome=DRAW, plies_to_mate=None),
+        ),
+    ],
+)
+def test_probe(kqk_path, fen, current_player, expected):
+    # given
+    board = Board.from_fen(fen)
+
+    # when
+    with Tablebase(path=kqk_path) as tablebase:
+        result = tablebase.probe(board=board, current_player=current_player)
+
+    # then
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player"),
+    [
+        ("7k/8/6K1/8/8/8/8/1Q6 w - - 0 1", WHITE),
+        ("6Q1/8/8/8/8/1K6/8/k7 w - - 0 1", WHITE),
+        ("K7/8/1k6/8/8/8/8/6q1 b - - 0 1", BLACK),
+        ("7K/8/6k1/8/8/8/8/1q6 b - - 0 1", BLACK),
+    ],
+)
+def test_probe_same_result_for_mirror_images(kqk_path, fen, current_player):
+    # given
+    board = Board.from_fen(fen)
+
+    # when
+    with Tablebase(path=kqk_path) as tablebase:
+        result = tablebase.probe(board=board, current_player=current_player)
+
+    # then
+    assert result == TablebaseResult(outcome=WIN, plies_to_mate=1)
+
+
+@pytest.mark.parametrize(
+    ("fen", "current_player"),
+    [
+        ("k7/8/1K6/8/8/8/8/6R1 w - - 0 1", WHITE),
+        ("k7/8/8/8/8/8/8/Q3K3 w Q - 0 1", WHITE),
+        ("k7/8/1K6/8/8/8/8/7Q w - - 0 1", WHITE),
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", WHITE),
+    ],
+)
+def test_probe_returns_none_for_positions_not_in_table(
+    tablebase_directory, fen, current_player
+):
+    # given
+    board = Board.from_fen(fen)
+
+    # when
+    with Tablebases(directory=tablebase_directory) as tablebases:
+        result = tablebases.probe(board=board, current_player=current_player)
+
+    # then
+    assert result is None
+
+
+def test_tablebases_open_tables_found_in_directory(tablebase_directory):
+    # when
+    with Tablebases(directory=tablebase_directory) as tablebases:
+        materials = tablebases.materials
+
+    # then
+    assert materials == ("KQK",)
+
+
+def test_tablebase_raises_for_file_that_is_no_tablebase(tmp_path):
+    # given
+    path = str(tmp_path / "KQK.bin")
+    with open(path, "wb") as file:
+        file.write(b"UTAHBOOK" + bytes(12))
+
+    # when and then
+    with pytest.raises(ValueError):
+        Tablebase(path=path)
+
+
+def test_main_rejects_unknown_material(tmp_path):
+    # when and then
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), "KQQK"])
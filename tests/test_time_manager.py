@@ -0,0 +1,169 @@
+import pytest
+
+from utahchess import WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_legal_moves
+from utahchess.time_manager import (
+    BEST_MOVE_CHANGE_EXTENSION,
+    SCORE_DROP_EXTENSION,
+    STABLE_BUDGET_FRACTION,
+    STABLE_ITERATIONS,
+    TimeManager,
+)
+
+FIRST_MOVE, SECOND_MOVE = tuple(get_legal_moves(board=Board(), current_player=WHITE))[
+    :2
+]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_time_manager_limits():
+    # when
+    time_manager = TimeManager(
+        remaining_seconds=60.05, increment_seconds=1.0, moves_to_go=20
+    )
+
+    # then
+    assert time_manager.soft_limit == pytest.approx(4.0)
+    assert time_manager.hard_limit == pytest.approx(16.0)
+
+
+def test_time_manager_limits_leave_time_on_the_clock():
+    # when
+    time_manager = TimeManager(
+        remaining_seconds=1.0, increment_seconds=5.0, moves_to_go=1
+    )
+
+    # then
+    assert time_manager.soft_limit <= time_manager.hard_limit < 1.0
+
+
+def test_time_manager_raises_without_moves_to_go():
+    # when and then
+    with pytest.raises(ValueError):
+        TimeManager(remaining_seconds=60.0, moves_to_go=0)
+
+
+def test_time_manager_stops_after_first_iteration_with_single_legal_move():
+    # given
+    time_manager = TimeManager(remaining_seconds=60.0, clock=FakeClock())
+
+    # when
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=0.0, num_legal_moves=1)
+
+    # then
+    assert not time_manager.should_start_iteration()
+
+
+def test_time_manager_extends_budget_when_best_move_changes():
+    # given
+    time_manager = TimeManager(remaining_seconds=60.0, clock=FakeClock())
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=0.0, num_legal_moves=20)
+
+    # when
+    time_manager.on_iteration(best_move=SECOND_MOVE, value=0.0, num_legal_moves=20)
+
+    # then
+    assert time_manager.budget == pytest.approx(
+        time_manager.soft_limit * BEST_MOVE_CHANGE_EXTENSION
+    )
+
+
+def test_time_manager_extends_budget_when_value_drops():
+    # given
+    time_manager = TimeManager(remaining_seconds=60.0, clock=FakeClock())
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=1.0, num_legal_moves=20)
+
+    # when
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=-1.0, num_legal_moves=20)
+
+    # then
+    assert time_manager.budget == pytest.approx(
+        time_manager.soft_limit * SCORE_DROP_EXTENSION
+    )
+
+
+def test_time_manager_budget_never_exceeds_hard_limit():
+    # given
+    time_manager = TimeManager(remaining_seconds=60.0, clock=FakeClock())
+
+    # when
+    for iteration in range(10):
+        time_manager.on_iteration(
+            best_move=(FIRST_MOVE, SECOND_MOVE)[iteration % 2],
+            value=-iteration,
+            num_legal_moves=20,
+        )
+
+    # then
+    assert time_manager.budget == time_manager.hard_limit
+
+
+def test_time_manager_uses_part_of_budget_once_best_move_is_stable():
+    # given
+    time_manager = TimeManager(remaining_seconds=60.0, clock=FakeClock())
+
+    # when
+    for _ in range(STABLE_ITERATIONS):
+        time_manager.on_iteration(best_move=FIRST_MOVE, value=0.0, num_legal_moves=20)
+
+    # then
+    assert time_manager.budget == pytest.approx(
+        time_manager.soft_limit * STABLE_BUDGET_FRACTION
+    )
+
+
+def test_time_manager_stops_once_budget_is_used_up():
+    # given
+    clock = FakeClock()
+    time_manager = TimeManager(remaining_seconds=60.0, clock=clock)
+    clock.now = 0.001
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=0.0, num_legal_moves=20)
+    assert time_manager.should_start_iteration()
+
+    # when
+    clock.now = time_manager.soft_limit
+
+    # then
+    assert not time_manager.should_start_iteration()
+    assert not time_manager.is_time_up()
+
+
+def test_time_manager_skips_iteration_predicted_to_exceed_hard_limit():
+    # given
+    clock = FakeClock()
+    time_manager = TimeManager(remaining_seconds=60.0, clock=clock)
+    clock.now = 0.1
+    time_manager.on_iteration(best_move=FIRST_MOVE, value=0.0, num_legal_moves=20)
+    clock.now = 1.0
+    time_manager.on_iteration(best_move=SECOND_MOVE, value=0.0, num_legal_moves=20)
+
+    # when
+    result = time_manager.should_start_iteration()
+
+    # then
+    assert time_manager.elapsed_seconds < time_manager.budget
+    assert not result  # The next iteration would take about nine seconds
+
+
+def test_time_manager_clock_starts_on_start():
+    # given
+    clock = FakeClock()
+    time_manager = TimeManager(remaining_seconds=60.0, is_running=False, clock=clock)
+    clock.now = 100.0
+    assert not time_manager.is_time_up()
+    assert time_manager.elapsed_seconds == 0.0
+
+    # when
+    time_manager.start()
+    clock.now = 100.0 + time_manager.hard_limit
+
+    # then
+    assert time_manager.is_time_up()
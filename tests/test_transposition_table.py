@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+
+from utahchess import WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_legal_moves
+from utahchess.transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionEntry,
+    TranspositionTable,
+)
+
+
+def test_transposition_table_returns_stored_entry():
+    # given
+    table = TranspositionTable()
+    move = next(get_legal_moves(board=Board(), current_player=WHITE))
+
+    # when
+    table.store(position_hash=42, depth=3, value=1.5, bound=EXACT, best_move=move)
+
+    # then
+    assert 42 in table
+    assert table.get(position_hash=42) == TranspositionEntry(
+        depth=3, value=1.5, bound=EXACT, best_move=move
+    )
+    assert table.get(position_hash=43) is None
+
+
+def test_transposition_table_keeps_deeper_entry():
+    # given
+    table = TranspositionTable()
+    table.store(position_hash=42, depth=3, value=1.5, bound=LOWER_BOUND)
+
+    # when
+    table.store(position_hash=42, depth=2, value=0.5, bound=UPPER_BOUND)
+
+    # then
+    entry = table.get(position_hash=42)
+    assert entry is not None
+    assert (entry.depth, entry.value, entry.bound) == (3, 1.5, LOWER_BOUND)
+
+
+def test_transposition_table_replaces_shallower_entry():
+    # given
+    table = TranspositionTable()
+    table.store(position_hash=42, depth=2, value=0.5, bound=UPPER_BOUND)
+
+    # when
+    table.store(position_hash=42, depth=3, value=1.5, bound=EXACT)
+
+    # then
+    entry = table.get(position_hash=42)
+    assert entry is not None
+    assert (entry.depth, entry.value, entry.bound) == (3, 1.5, EXACT)
+
+
+def test_transposition_table_evicts_oldest_entry_when_full():
+    # given
+    table = TranspositionTable(max_entries=2)
+    table.store(position_hash=1, depth=1, value=0.0, bound=EXACT)
+    table.store(position_hash=2, depth=1, value=0.0, bound=EXACT)
+
+    # when
+    table.store(position_hash=3, depth=1, value=0.0, bound=EXACT)
+
+    # then
+    assert len(table) == 2
+    assert 1 not in table
+    assert 2 in table and 3 in table
+
+
+def test_transposition_table_needs_room_for_one_entry():
+    # when and then
+    with pytest.raises(ValueError):
+        TranspositionTable(max_entries=0)
+
+
+def test_transposition_table_can_be_pickled():
+    # given
+    table = TranspositionTable(max_entries=2)
+    move = next(get_legal_moves(board=Board(), current_player=WHITE))
+    table.store(position_hash=42, depth=3, value=1.5, bound=EXACT, best_move=move)
+
+    # when
+    result = pickle.loads(pickle.dumps(table))
+
+    # then
+    assert result.max_entries == 2
+    assert result.get(position_hash=42) == table.get(position_hash=42)
+
+
+def test_transposition_table_update_keeps_deeper_entries():
+    # given
+    table = TranspositionTable()
+    table.store(position_hash=1, depth=3, value=1.5, bound=EXACT)
+    table.store(position_hash=2, depth=1, value=0.5, bound=EXACT)
+    other = TranspositionTable()
+    other.store(position_hash=1, depth=2, value=0.0, bound=EXACT)
+    other.store(position_hash=2, depth=2, value=1.0, bound=LOWER_BOUND)
+    other.store(position_hash=3, depth=1, value=2.0, bound=UPPER_BOUND)
+
+    # when
+    table.update(other)
+
+    # then
+    assert len(table) == 3
+    assert table.get(position_hash=1) == TranspositionEntry(
+        depth=3, value=1.5, bound=EXACT, best_move=None
+    )
+    assert table.get(position_hash=2) == TranspositionEntry(
+        depth=2, value=1.0, bound=LOWER_BOUND, best_move=None
+    )
+    assert 3 in table
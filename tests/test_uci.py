@@ -0,0 +1,326 @@
+import time
+
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.legal_moves import get_move_per_algebraic_identifier
+from utahchess.move import LONG_CASTLING, SHORT_CASTLING, Move
+from utahchess.opening_book import BookEntry, encode_book_move, write_book
+from utahchess.uci import UciEngine, find_move, to_uci_move
+from utahchess.zobrist import get_position_hash
+
+
+@pytest.mark.parametrize(
+    ("castling_type", "king_move", "rook_move", "expected"),
+    [
+        (SHORT_CASTLING, ((4, 7), (6, 7)), ((7, 7), (5, 7)), "e1g1"),
+        (LONG_CASTLING, ((4, 0), (2, 0)), ((0, 0), (3, 0)), "e8c8"),
+    ],
+)
+def test_to_uci_move_with_castling(castling_type, king_move, rook_move, expected):
+    # given
+    board = Board.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    move = Move(
+        type=castling_type,
+        piece_moves=(king_move, rook_move),
+        moving_pieces=(board[king_move[0]], board[rook_move[0]]),  # type: ignore
+        is_capturing_move=False,
+        allows_en_passant=False,
+    )
+
+    # when
+    result = to_uci_move(move=move)
+
+    # then
+    assert result == expected
+
+
+def test_find_move_raises_valueerror():
+    # when and then
+    with pytest.raises(ValueError):
+        find_move(uci_move="e2e5", legal_moves=[])
+
+
+def test_uci_handshake():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+
+    # when
+    for command in ("uci", "setoption name Hash value 64", "isready"):
+        engine.handle_command(command)
+
+    # then
+    assert lines[0] == "id name utahchess"
+    assert lines[-2:] == ["uciok", "readyok"]
+    assert "option name Ponder type check default false" in lines
+    assert engine.hash_size_mb == 64
+
+
+def test_uci_position_with_moves():
+    # given
+    engine = UciEngine(output=lambda line: None)
+
+    # when
+    engine.handle_command("position startpos moves e2e4 e7e5 g1f3")
+
+    # then
+    assert engine.current_player == BLACK
+    assert engine.board.to_fen(current_player=BLACK) == (
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 0 1"
+    )
+
+
+def test_uci_position_tracks_positions_since_irreversible_move():
+    # given
+    engine = UciEngine(output=lambda line: None)
+
+    # when
+    engine.handle_command("position startpos moves e2e4 g8f6 g1f3 f6g8 f3g1")
+
+    # then
+    assert engine.halfmove_clock == 4
+    assert len(engine.previous_position_hashes) == 4
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "position startpos moves e2e4 e7e5 e2e5",
+        "position fen 4k3/P7/8/8/8/8/8/4K3 w - - 0 1 moves a7a8q",
+        "position fen garbage",
+    ],
+)
+def test_uci_invalid_position_keeps_previous_position(command):
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos moves e2e4 g8f6 g1f3")
+
+    # when
+    result = engine.handle_command(command)
+
+    # then
+    assert result
+    assert lines[-1].startswith(f"info string Ignoring command '{command}': ")
+    assert engine.current_player == BLACK
+    assert engine.board.to_fen(current_player=BLACK) == (
+        "rnbqkb1r/pppppppp/5n2/8/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 0 1"
+    )
+    assert engine.halfmove_clock == 2
+    assert len(engine.previous_position_hashes) == 2
+
+
+def test_uci_invalid_option_keeps_previous_value():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("setoption name Hash value 64")
+
+    # when
+    engine.handle_command("setoption name Hash value abc")
+
+    # then
+    assert lines[-1].startswith("info string Ignoring command ")
+    assert engine.hash_size_mb == 64
+
+
+def test_uci_invalid_go_does_not_search():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos")
+
+    # when
+    engine.handle_command("go depth x")
+    engine.wait()
+
+    # then
+    assert len(lines) == 1
+    assert lines[0].startswith("info string Ignoring command 'go depth x': ")
+
+
+def test_uci_go_depth_sends_bestmove():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command(
+        "position fen rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
+    )
+
+    # when
+    engine.handle_command("go depth 2")
+    engine.wait()
+
+    # then
+    assert lines[0].startswith("info depth 1 score mate 1 ")
+    assert lines[-1] == "bestmove d8h4"
+
+
+def test_uci_go_sends_principal_variation():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    fen = "4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1"
+    engine.handle_command(f"position fen {fen}")
+
+    # when
+    engine.handle_command("go depth 3")
+    engine.wait()
+
+    # then
+    tokens = lines[-2].split()
+    assert tokens[:3] == ["info", "depth", "3"]
+    principal_variation = tokens[tokens.index("pv") + 1 :]
+    assert 1 < len(principal_variation) <= 3
+    assert principal_variation[0] == lines[-1].split()[1]
+    engine.handle_command(f"position fen {fen} moves {' '.join(principal_variation)}")
+    assert not lines[-1].startswith("info string")
+
+
+def test_uci_stop_ends_infinite_search():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos")
+
+    # when
+    engine.handle_command("go infinite")
+    engine.handle_command("stop")
+
+    # then
+    assert lines[-1].startswith("bestmove ")
+    assert len(lines[-1].split()[1]) == 4
+
+
+def test_uci_go_sends_expected_reply_to_ponder_on():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("setoption name Ponder value true")
+    engine.handle_command("position fen 4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+
+    # when
+    engine.handle_command("go depth 3")
+    engine.wait()
+
+    # then
+    tokens = lines[-1].split()
+    assert tokens[0] == "bestmove" and tokens[2] == "ponder"
+    engine.handle_command(
+        f"position fen 4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1 "
+        f"moves {tokens[1]} {tokens[3]}"
+    )
+    assert engine.current_player == WHITE
+
+
+def test_uci_go_sends_no_reply_to_ponder_on_without_ponder_option():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position fen 4k3/8/3p4/2r5/8/2N2B2/3P4/4K3 w - - 0 1")
+
+    # when
+    engine.handle_command("go depth 3")
+    engine.wait()
+
+    # then
+    tokens = lines[-1].split()
+    assert tokens[0] == "bestmove" and len(tokens) == 2
+
+
+def test_uci_go_ponder_waits_for_ponderhit():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos moves e2e4")
+    engine.handle_command("go ponder depth 1")
+    engine._search_thread.join(timeout=1.0)  # type: ignore
+    assert not any(line.startswith("bestmove") for line in lines)
+
+    # when
+    engine.handle_command("ponderhit")
+    engine.wait()
+
+    # then
+    assert lines[-1].startswith("bestmove ")
+
+
+def test_uci_stop_ends_pondering_search():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos moves e2e4")
+    engine.handle_command("go ponder wtime 1000 btime 1000")
+
+    # when
+    engine.handle_command("stop")
+
+    # then
+    assert lines[-1].startswith("bestmove ")
+
+
+def test_uci_go_with_clock_moves_in_time():
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command("position startpos")
+    start = time.perf_counter()
+
+    # when
+    engine.handle_command("go wtime 500 btime 500 winc 0 binc 0")
+    engine.wait()
+
+    # then
+    assert time.perf_counter() - start < 0.5
+    assert lines[-1].startswith("bestmove ")
+
+
+def test_uci_go_plays_move_of_own_book(tmp_path):
+    # given
+    board = Board()
+    book_path = str(tmp_path / "book.bin")
+    write_book(
+        path=book_path,
+        entries=[
+            BookEntry(
+                key=get_position_hash(board=board, current_player=WHITE),
+                move=encode_book_move(
+                    move=get_move_per_algebraic_identifier(
+                        board=board, current_player=WHITE
+                    )["Nf3"]
+                ),
+                weight=1,
+            )
+        ],
+    )
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command(f"setoption name BookFile value {book_path}")
+    engine.handle_command("setoption name OwnBook value true")
+    engine.handle_command("position startpos")
+
+    # when
+    engine.handle_command("go depth 5")
+    engine.wait()
+
+    # then
+    assert lines == ["info string book move g1f3", "bestmove g1f3"]
+
+
+def test_uci_go_reports_mate_found_in_tablebases(tablebase_directory):
+    # given
+    lines = []
+    engine = UciEngine(output=lines.append)
+    engine.handle_command(f"setoption name TablebasePath value {tablebase_directory}")
+    engine.handle_command("position fen k7/8/1K6/8/8/8/8/6Q1 w - - 0 1")
+
+    # when
+    engine.handle_command("go depth 5")
+    engine.wait()
+
+    # then
+    assert len(lines) == 2
+    assert lines[0].startswith("info depth 1 score mate 1 ")
+    assert lines[1] == "bestmove g1g8"
@@ -0,0 +1,80 @@
+import pytest
+
+from utahchess import BLACK, WHITE
+from utahchess.board import Board
+from utahchess.chess import ChessGame
+from utahchess.zobrist import get_position_hash
+
+
+def _play(moves):
+    game = ChessGame()
+    game.new_game()
+    for move in moves:
+        assert game.make_move(move_in_algebraic_notation=move)
+    return game
+
+
+@pytest.mark.parametrize(
+    "moves1, moves2",
+    [
+        (("Nf3", "Nf6", "Ng1", "Ng8"), ()),
+        (("e4", "e5", "Nf3"), ("Nf3", "e5", "e4")),
+    ],
+)
+def test_get_position_hash_is_equal_for_same_position(moves1, moves2):
+    # given
+    game1, game2 = _play(moves=moves1), _play(moves=moves2)
+
+    # when
+    result1 = game1.current_game_state.position_hash
+    result2 = game2.current_game_state.position_hash
+
+    # then
+    assert result1 == result2
+
+
+def test_get_position_hash_depends_on_castling_availability():
+    # given
+    game = _play(moves=("e4", "e5", "Ke2", "Ke7", "Ke1", "Ke8"))
+
+    # when
+    result = game.current_game_state.position_hash
+
+    # then
+    assert result != _play(moves=("e4", "e5")).current_game_state.position_hash
+
+
+def test_get_position_hash_depends_on_current_player():
+    # given
+    board = Board()
+
+    # when
+    result_white = get_position_hash(board=board, current_player=WHITE)
+    result_black = get_position_hash(board=board, current_player=BLACK)
+
+    # then
+    assert result_white != result_black
+
+
+@pytest.mark.parametrize(
+    "fen_with_en_passant_square, expected_equal",
+    [
+        ("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1", True),
+        ("rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 3", False),
+    ],
+)
+def test_get_position_hash_counts_en_passant_file_only_if_legal(
+    fen_with_en_passant_square, expected_equal
+):
+    # given
+    fields = fen_with_en_passant_square.split()
+    fen_without_en_passant_square = " ".join(fields[:3] + ["-"] + fields[4:])
+
+    # when
+    result = ChessGame.from_fen(fen_with_en_passant_square).current_game_state
+    without_en_passant = ChessGame.from_fen(
+        fen_without_en_passant_square
+    ).current_game_state
+
+    # then
+    assert (result.position_hash == without_en_passant.position_hash) is expected_equal